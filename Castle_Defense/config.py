@@ -2,6 +2,7 @@
 """
 Game configuration and constants
 """
+from types import MappingProxyType
 
 # Window settings
 WINDOW_WIDTH = 1920
@@ -20,12 +21,14 @@ FPS = 60
 BACKGROUND_COLOR = (0, 0, 0)
 
 # Resource settings
-RESOURCE_TYPES = ["Stone", "Iron", "Copper", "Thorium"]
-SPECIAL_RESOURCES = ["Monster Coins", "Force Core", "Spirit Core", "Magic Core", "Void Core", 
-                     "Unstoppable Force", "Serene Spirit"]
-INITIAL_RESOURCES = {"Stone": 100, "Iron": 0, "Copper": 0, "Thorium": 0, "Monster Coins": 50,
-                     "Force Core": 0, "Spirit Core": 0, "Magic Core": 0, "Void Core": 0,
-                     "Unstoppable Force": 0, "Serene Spirit": 0}
+# Tables that are never tuned at runtime are read-only; the ones the developer
+# menu edits through config_extension stay plain dicts
+RESOURCE_TYPES = ("Stone", "Iron", "Copper", "Thorium")
+SPECIAL_RESOURCES = ("Monster Coins", "Force Core", "Spirit Core", "Magic Core", "Void Core", 
+                     "Unstoppable Force", "Serene Spirit")
+INITIAL_RESOURCES = MappingProxyType({"Stone": 100, "Iron": 0, "Copper": 0, "Thorium": 0, "Monster Coins": 50,
+                                      "Force Core": 0, "Spirit Core": 0, "Magic Core": 0, "Void Core": 0,
+                                      "Unstoppable Force": 0, "Serene Spirit": 0})
 
 # Castle settings
 CASTLE_INITIAL_HEALTH = 1000
@@ -46,7 +49,7 @@ MINE_PRODUCTION_INTERVAL = 20  # Seconds
 MINE_PRODUCTION_MULTIPLIER = 1.2
 MINE_UPGRADE_TIME_MULTIPLIER = 2.2
 MINE_INITIAL_UPGRADE_TIME = 10  # Seconds
-MINE_UPGRADE_COST = {"Monster Coins": 150}
+MINE_UPGRADE_COST = {"Monster Coins": 150}  # Shared by every mine; edited in place by config_extension
 
 # Coresmith settings
 CORESMITH_CRAFTING_TIME = 30  # Seconds
@@ -11,7 +11,7 @@ from config import (
     WAVE_DIFFICULTY_MULTIPLIER, MONSTER_SPAWN_INTERVAL,
     WAVE_MONSTER_COUNT_BASE, WAVE_MONSTER_COUNT_MULTIPLIER,
     MONSTER_STATS, BOSS_STATS,
-    MINE_INITIAL_PRODUCTION, MINE_PRODUCTION_MULTIPLIER,
+    MINE_INITIAL_PRODUCTION, MINE_PRODUCTION_MULTIPLIER, MINE_UPGRADE_COST,
     LOOT_MONSTER_BASE_COIN_DROP, LOOT_BOSS_BASE_COIN_DROP, LOOT_WAVE_SCALING,
     ITEM_COSTS, ITEM_EFFECTS,
     TOWER_TYPES, TOWER_UPGRADE_COST_MULTIPLIER, TOWER_MONSTER_COIN_COSTS, TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER,
@@ -19,6 +19,7 @@ from config import (
     CASTLE_HEALTH_UPGRADE_COST, CASTLE_DAMAGE_REDUCTION_UPGRADE_COST, CASTLE_HEALTH_REGEN_UPGRADE_COST,
     CASTLE_HEALTH_UPGRADE_MULTIPLIER, CASTLE_DAMAGE_REDUCTION_UPGRADE_MULTIPLIER, CASTLE_HEALTH_REGEN_UPGRADE_MULTIPLIER
 )
+from features.towers.tower_utils import clear_upgrade_cost_cache
 
 # Store original values for reset functionality
 ORIGINAL_VALUES = {
@@ -30,6 +31,7 @@ ORIGINAL_VALUES = {
     "BOSS_STATS": copy.deepcopy(BOSS_STATS),
     "MINE_INITIAL_PRODUCTION": MINE_INITIAL_PRODUCTION,
     "MINE_PRODUCTION_MULTIPLIER": MINE_PRODUCTION_MULTIPLIER,
+    "MINE_UPGRADE_COST": copy.deepcopy(MINE_UPGRADE_COST),
     "LOOT_MONSTER_BASE_COIN_DROP": LOOT_MONSTER_BASE_COIN_DROP,
     "LOOT_BOSS_BASE_COIN_DROP": LOOT_BOSS_BASE_COIN_DROP,
     "LOOT_WAVE_SCALING": LOOT_WAVE_SCALING,
@@ -108,6 +110,18 @@ def set_mine_production_multiplier(value):
     module = sys.modules['config']
     module.MINE_PRODUCTION_MULTIPLIER = value
 
+def update_mine_upgrade_cost(resource, value):
+    """Update the mine upgrade cost"""
+    module = sys.modules['config']
+    # Update in place, since every mine returns this shared dict
+    module.MINE_UPGRADE_COST[resource] = value
+
+def reset_mine_upgrade_cost():
+    """Reset the mine upgrade cost to its original value"""
+    module = sys.modules['config']
+    module.MINE_UPGRADE_COST.clear()
+    module.MINE_UPGRADE_COST.update(ORIGINAL_VALUES["MINE_UPGRADE_COST"])
+
 def set_loot_monster_base_coin_drop(value):
     """Set the base monster coin drop"""
     module = sys.modules['config']
@@ -131,6 +145,13 @@ def update_item_cost(item_name, resource, value):
         module = sys.modules['config']
         module.ITEM_COSTS[item_name][resource] = value
 
+def update_item_costs_all(item_name, costs_dict):
+    """Update all resource costs for an item"""
+    if item_name in ITEM_COSTS:
+        module = sys.modules['config']
+        # Update in place so code holding the item's cost dict sees the change
+        module.ITEM_COSTS[item_name].update(costs_dict)
+
 def update_castle_upgrade_cost(upgrade_type, resource, value):
     """Update castle upgrade cost"""
     module = sys.modules['config']
@@ -170,6 +191,7 @@ def update_tower_stat(tower_type, stat, value):
     if tower_type in TOWER_TYPES and stat in TOWER_TYPES[tower_type]:
         module = sys.modules['config']
         module.TOWER_TYPES[tower_type][stat] = value
+        clear_upgrade_cost_cache()
 
 def update_tower_cost(tower_type, resource, value):
     """Update tower resource cost"""
@@ -181,12 +203,14 @@ def update_tower_cost(tower_type, resource, value):
             module.TOWER_TYPES[tower_type]["cost"] = {}
         
         module.TOWER_TYPES[tower_type]["cost"][resource] = value
+        clear_upgrade_cost_cache()
 
 def update_tower_monster_coin_cost(tower_type, value):
     """Update tower Monster Coin cost"""
     if tower_type in TOWER_MONSTER_COIN_COSTS:
         module = sys.modules['config']
         module.TOWER_MONSTER_COIN_COSTS[tower_type] = value
+        clear_upgrade_cost_cache()
 
 def set_tower_upgrade_cost_multiplier(value):
     """Set tower upgrade cost multiplier"""
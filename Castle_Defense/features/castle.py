@@ -50,6 +50,9 @@ class Castle:
             self.size[0],
             self.size[1]
         )
+        
+        # Boundary check bounds by threshold, filled in by is_on_castle_boundary
+        self.boundary_bounds = {}
     
     def update(self, dt):
         """
@@ -98,36 +101,29 @@ class Castle:
         Returns:
             True if position is on castle boundary, False otherwise
         """
-        # Scale the threshold based on display size
-        scaled_threshold = scale_value(threshold)
+        # The castle never moves, so the band around it is computed once per threshold
+        bounds = self.boundary_bounds.get(threshold)
+        if bounds is None:
+            # Scale the threshold based on display size
+            scaled_threshold = scale_value(threshold)
+            bounds = (
+                self.rect.left - scaled_threshold,
+                self.rect.top - scaled_threshold,
+                self.rect.right + scaled_threshold,
+                self.rect.bottom + scaled_threshold
+            )
+            self.boundary_bounds[threshold] = bounds
         
         x, y = position
+        left, top, right, bottom = bounds
         
-        # Only consider positions outside the castle
-        if not self.rect.collidepoint(position):
-            # Check if we're near any of the edges (visually)
-            
-            # For the top edge - check if within horizontal bounds and near the top
-            if (self.rect.left - scaled_threshold <= x <= self.rect.right + scaled_threshold and
-                abs(y - self.rect.top) <= scaled_threshold):
-                return True
-                
-            # For the left edge - check if within vertical bounds and near the left
-            if (self.rect.top - scaled_threshold <= y <= self.rect.bottom + scaled_threshold and
-                abs(x - self.rect.left) <= scaled_threshold):
-                return True
-                
-            # For the right edge - check if within vertical bounds and near the right
-            if (self.rect.top - scaled_threshold <= y <= self.rect.bottom + scaled_threshold and
-                abs(x - self.rect.right) <= scaled_threshold):
-                return True
-                
-            # For the bottom edge - check if within horizontal bounds and near the bottom
-            if (self.rect.left - scaled_threshold <= x <= self.rect.right + scaled_threshold and
-                abs(y - self.rect.bottom) <= scaled_threshold):
-                return True
+        # Anything outside the expanded rectangle is not near any edge
+        if not (left <= x <= right and top <= y <= bottom):
+            return False
         
-        return False
+        # Inside the expanded rectangle, only positions outside the castle itself
+        # are within the threshold of one of its edges
+        return not self.rect.collidepoint(position)
     
     def get_health_upgrade_cost(self):
         """
@@ -8,6 +8,8 @@ from utils import draw_health_bar, scale_position, scale_size, scale_value
 
 class Monster:
     """Base class for all monsters"""
+    is_boss = False  # Overridden by BossMonster, checked when loot is handed out
+    
     def __init__(self, start_pos, target_pos, monster_type, stats):
         """
         Initialize monster with position, target, and stats
@@ -40,6 +42,9 @@ class Monster:
         else:
             self.direction = (0, 1)  # Default downward if no direction
         
+        # Monsters move in a straight line, so the full-speed velocity is fixed
+        self.velocity = (self.direction[0] * self.speed, self.direction[1] * self.speed)
+        
         # Status effects
         self.slowed = False
         self.slow_timer = 0
@@ -63,6 +68,8 @@ class Monster:
         # Monster state flags
         self.is_dead = False
         self.reached_castle = False
+        self.death_handled = False  # Set once loot and death effects are processed
+        self.removed = False  # Set once the wave manager drops the monster
         
         # Attack state properties
         self.attacking_castle = False
@@ -122,13 +129,13 @@ class Monster:
             return self.update_castle_attack(dt, castle, animation_manager)
             
         # Move toward castle
-        effective_speed = self.speed * self.slow_factor * dt
-        self.position[0] += self.direction[0] * effective_speed
-        self.position[1] += self.direction[1] * effective_speed
+        position = self.position
+        step = self.slow_factor * dt
+        position[0] += self.velocity[0] * step
+        position[1] += self.velocity[1] * step
         
         # Update rectangle position
-        self.rect.centerx = int(self.position[0])
-        self.rect.centery = int(self.position[1])
+        self.rect.center = (int(position[0]), int(position[1]))
         
         # Check if we've reached the castle boundary
         if self.is_at_castle_boundary(castle):
@@ -194,7 +201,7 @@ class Monster:
         Returns:
             True if at boundary, False otherwise
         """
-        return castle.is_on_castle_boundary((self.position[0], self.position[1]))
+        return castle.is_on_castle_boundary(self.position)
     
     def update_animations(self, dt):
         """
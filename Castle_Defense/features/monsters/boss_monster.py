@@ -8,6 +8,8 @@ from utils import scale_size, scale_value
 
 class BossMonster(Monster):
     """Special boss monster with unique abilities"""
+    is_boss = True
+    
     def __init__(self, start_pos, target_pos, boss_type):
         """
         Initialize boss monster
@@ -17,16 +17,20 @@ class RegularMonster(Monster):
             monster_type: Type of monster (Grunt, Runner, Tank, Flyer)
             wave_number: Current wave number (for scaling difficulty)
         """
-        # Get base stats from config
-        stats = MONSTER_STATS.get(monster_type, {}).copy()
+        # Get base stats from config; Monster only reads them, so the shared
+        # dict is passed through unless wave scaling needs its own copy
+        stats = MONSTER_STATS.get(monster_type, {})
         
         # Scale stats based on wave number
         if wave_number > 1:
             # Apply wave difficulty multiplier (based on how it's defined in your config)
             from config import WAVE_DIFFICULTY_MULTIPLIER
             difficulty_multiplier = WAVE_DIFFICULTY_MULTIPLIER ** (wave_number // 5)
-            stats["health"] = int(stats["health"] * difficulty_multiplier)
-            stats["damage"] = int(stats["damage"] * difficulty_multiplier)
+            stats = dict(
+                stats,
+                health=int(stats["health"] * difficulty_multiplier),
+                damage=int(stats["damage"] * difficulty_multiplier)
+            )
         
         # Initialize with the base Monster class
         super().__init__(start_pos, target_pos, monster_type, stats)
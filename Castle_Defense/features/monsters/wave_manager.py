@@ -2,11 +2,11 @@
 """
 Wave management system for Castle Defense
 """
-import pygame
 import random
 import math
+from bisect import bisect_left
+from itertools import accumulate
 from .factory import MonsterFactory
-from .boss_monster import BossMonster
 from config import (
     MONSTER_STATS,
     BOSS_STATS,
@@ -15,12 +15,33 @@ from config import (
     WAVE_MONSTER_COUNT_BASE,
     WAVE_MONSTER_COUNT_MULTIPLIER,
     REF_WIDTH,
-    REF_HEIGHT
+    REF_HEIGHT,
+    SCALE_X,
+    SCALE_Y
 )
-from utils import scale_position
+from utils import scale_value, render_text
+from features import registry
+
+# Monsters spawn 50 reference pixels from the top; the scaled y never changes
+SPAWN_Y = int(50 * SCALE_Y)
+
+# Upper bound on monsters spawned in a single update after a long frame
+MAX_SPAWNS_PER_FRAME = 4
+
+# Cell size of the monster grid used for tower target lookups
+MONSTER_GRID_CELL_SIZE = scale_value(100)
 
 class WaveManager:
     """Manages monster waves and spawning"""
+    # Fixed attribute set: slots avoid a per-instance __dict__ on this hot object
+    __slots__ = (
+        "current_wave", "active_monsters", "spawn_timer", "monsters_to_spawn",
+        "wave_active", "wave_completed", "is_boss_wave", "boss_tier",
+        "wave_start_animation_timer", "wave_complete_animation_timer",
+        "spawn_path", "continuous_wave", "monster_weight_cache",
+        "announcement_surfaces", "ground_monster_grid", "flying_monster_grid"
+    )
+    
     def __init__(self):
         """Initialize wave manager"""
         self.current_wave = 0
@@ -30,6 +51,10 @@ class WaveManager:
         self.wave_active = False
         self.wave_completed = True
         
+        # Per-wave values derived from the wave number in start_next_wave
+        self.is_boss_wave = False
+        self.boss_tier = 0  # Number of boss waves reached (wave // 10)
+        
         # Animation flags
         self.wave_start_animation_timer = 0
         self.wave_complete_animation_timer = 0
@@ -39,6 +64,18 @@ class WaveManager:
         
         # Developer mode settings - Set continuous_wave to True by default
         self.continuous_wave = True  # Auto-start next wave when current wave ends
+        
+        # (monster types, cumulative weights) per wave number (they only depend on the wave)
+        self.monster_weight_cache = {}
+        
+        # Private copies of the wave announcement texts, which fade by changing
+        # their alpha; cleared whenever a new wave starts
+        self.announcement_surfaces = {}
+        
+        # Live monsters bucketed by grid cell, rebuilt by build_monster_grid;
+        # flying monsters get their own grid since only some towers can hit them
+        self.ground_monster_grid = {}
+        self.flying_monster_grid = {}
     
     def start_next_wave(self):
         """
@@ -53,17 +90,24 @@ class WaveManager:
             self.wave_completed = False
             self.spawn_timer = 0
             
+            # Derive the boss flags once instead of at every spawn and frame
+            self.is_boss_wave = self.current_wave % 10 == 0
+            self.boss_tier = self.current_wave // 10
+            
+            # Announcement texts of the previous wave are no longer needed
+            self.announcement_surfaces.clear()
+            
             # Set wave start animation
             self.wave_start_animation_timer = 1.0  # 1 second animation
             
             # Calculate number of monsters to spawn
-            if self.current_wave % 10 == 0:
+            if self.is_boss_wave:
                 # Boss wave
                 self.monsters_to_spawn = 1
             else:
                 # Regular wave
                 base_count = WAVE_MONSTER_COUNT_BASE
-                multiplier = WAVE_MONSTER_COUNT_MULTIPLIER ** (self.current_wave // 10)
+                multiplier = WAVE_MONSTER_COUNT_MULTIPLIER ** self.boss_tier
                 self.monsters_to_spawn = int(base_count + self.current_wave * 0.5 * multiplier)
             
             return True
@@ -86,35 +130,44 @@ class WaveManager:
             self.wave_complete_animation_timer -= dt
         
         if self.wave_active:
-            # Spawn new monsters
-            self.spawn_timer += dt
-            if self.spawn_timer >= MONSTER_SPAWN_INTERVAL and self.monsters_to_spawn > 0:
-                self.spawn_monster(castle.position, animation_manager)
-                self.monsters_to_spawn -= 1
-                self.spawn_timer = 0
-            
-            # Update all active monsters and handle dead monsters
-            monsters_to_remove = []
-            
-            for monster in self.active_monsters:
-                monster_still_active = monster.update(dt, castle, animation_manager)
-                
-                if not monster_still_active:
-                    # Monster died
-                    monsters_to_remove.append(monster)
+            # Spawn new monsters (nothing to do once the wave is fully spawned)
+            if self.monsters_to_spawn > 0:
+                # Spawn every interval that has elapsed, keeping the remainder so a
+                # slow frame doesn't delay the rest of the wave, but cap the spawns
+                # per frame to spread a large backlog over the next few frames
+                self.spawn_timer += dt
+                spawns_this_frame = 0
+                while (self.spawn_timer >= MONSTER_SPAWN_INTERVAL and self.monsters_to_spawn > 0
+                       and spawns_this_frame < MAX_SPAWNS_PER_FRAME):
+                    self.spawn_monster(castle.position, animation_manager)
+                    self.monsters_to_spawn -= 1
+                    self.spawn_timer -= MONSTER_SPAWN_INTERVAL
+                    spawns_this_frame += 1
             
-            # Remove monsters
-            for monster in monsters_to_remove:
-                if monster in self.active_monsters:
+            # Update all active monsters in a single pass, compacting the survivors
+            # to the front of the list in place and handling finished monsters as
+            # we go (no separate removal pass and no new list per frame)
+            if self.active_monsters:
+                monsters = self.active_monsters
+                survivor_count = 0
+
+                for monster in monsters:
+                    if monster.update(dt, castle, animation_manager):
+                        monsters[survivor_count] = monster
+                        survivor_count += 1
+                        continue
+
                     # If monster died but wasn't handled by a tower, handle it here
                     if monster.is_dead and not monster.reached_castle:
-                        # Get game_instance reference to access resource_manager
+                        # Use the registered game to access resource_manager
                         # This is a fallback - towers should normally handle this
-                        from game import game_instance
+                        game_instance = registry.game_instance
                         if game_instance:
                             self.handle_monster_death(monster, game_instance.resource_manager, animation_manager)
-                    
-                    self.active_monsters.remove(monster)
+
+                    monster.removed = True
+
+                del monsters[survivor_count:]
             
             # Check if wave is complete
             if len(self.active_monsters) == 0 and self.monsters_to_spawn == 0:
@@ -132,12 +185,11 @@ class WaveManager:
         """
         # Generate random spawn position along the top of the screen in reference coordinates
         ref_spawn_x = random.randint(50, REF_WIDTH - 50)
-        ref_spawn_y = 50  # 50 pixels from the top
         
-        # Scale to actual screen coordinates
-        spawn_pos = scale_position((ref_spawn_x, ref_spawn_y))
+        # Scale to actual screen coordinates (same truncation as scale_position)
+        spawn_pos = (int(ref_spawn_x * SCALE_X), SPAWN_Y)
         
-        if self.current_wave % 10 == 0:
+        if self.is_boss_wave:
             # Boss wave
             boss_type = self.get_boss_type()
             monster = MonsterFactory.create_boss_monster(boss_type, spawn_pos, castle_position)
@@ -159,7 +211,7 @@ class WaveManager:
             String boss type
         """
         boss_types = ["Force", "Spirit", "Magic", "Void"]
-        return boss_types[(self.current_wave // 10 - 1) % len(boss_types)]
+        return boss_types[(self.boss_tier - 1) % len(boss_types)]
     
     def get_random_monster_type(self):
         """
@@ -168,52 +220,61 @@ class WaveManager:
         Returns:
             String monster type
         """
+        # Look up the cumulative weights for this wave, building them on first use
+        cached = self.monster_weight_cache.get(self.current_wave)
+        if cached is None:
+            weights = self.build_monster_weights(self.current_wave)
+            cached = (tuple(weights), tuple(accumulate(weights.values())))
+            self.monster_weight_cache[self.current_wave] = cached
+        monster_types, cumulative_weights = cached
+        
+        # Ensure total weight is at least 1
+        if not cumulative_weights or cumulative_weights[-1] <= 0:
+            return "Grunt"  # Default to Grunt if weights calculation went wrong
+        
+        # Choose random type based on weights: the first type whose cumulative
+        # weight reaches the roll, found by binary search
+        r = random.randint(1, cumulative_weights[-1])
+        return monster_types[bisect_left(cumulative_weights, r)]
+    
+    def build_monster_weights(self, wave_number):
+        """
+        Build the spawn weights of the monster types available in a wave
+        
+        Args:
+            wave_number: Wave number to build weights for
+            
+        Returns:
+            Dictionary mapping monster type to integer weight
+        """
         available_types = []
         
         # Always include Grunt
         available_types.append("Grunt")
         
         # Add Runner after wave 3
-        if self.current_wave >= 3:
+        if wave_number >= 3:
             available_types.append("Runner")
         
         # Add Tank after wave 5
-        if self.current_wave >= 5:
+        if wave_number >= 5:
             available_types.append("Tank")
         
         # Add Flyer after wave 8
-        if self.current_wave >= 8:
+        if wave_number >= 8:
             available_types.append("Flyer")
         
         # Weight later monsters to be more common in later waves
         # Using int() to ensure all weights are integers
         weights = {
-            "Grunt": int(100 - min(80, self.current_wave * 2)),
-            "Runner": int(min(60, max(10, self.current_wave * 3))),
-            "Tank": int(min(50, max(10, self.current_wave * 2))),
-            "Flyer": int(min(40, max(10, self.current_wave * 1.5)))
+            "Grunt": int(100 - min(80, wave_number * 2)),
+            "Runner": int(min(60, max(10, wave_number * 3))),
+            "Tank": int(min(50, max(10, wave_number * 2))),
+            "Flyer": int(min(40, max(10, wave_number * 1.5)))
         }
         
         # Filter weights to only include available types
-        weights = {k: v for k, v in weights.items() if k in available_types}
-        
-        # Choose random type based on weights
-        total_weight = sum(weights.values())
-        
-        # Ensure total_weight is at least 1
-        if total_weight <= 0:
-            return "Grunt"  # Default to Grunt if weights calculation went wrong
-        
-        r = random.randint(1, total_weight)
-        cumulative_weight = 0
-        
-        for monster_type, weight in weights.items():
-            cumulative_weight += weight
-            if r <= cumulative_weight:
-                return monster_type
-        
-        # Fallback
-        return "Grunt"
+        return {k: v for k, v in weights.items() if k in available_types}
     
     def handle_monster_death(self, monster, resource_manager, animation_manager=None):
         """
@@ -224,12 +285,13 @@ class WaveManager:
             resource_manager: ResourceManager to add loot
             animation_manager: Optional AnimationManager for visual effects
         """
-        # Already dead or not in active monsters
-        if not monster or not monster in self.active_monsters:
+        # Already handled or no longer an active monster (flag checks avoid a list scan)
+        if not monster or monster.death_handled or monster.removed:
             return
             
-        # Mark as dead to prevent duplicate handling
+        # Mark as dead and handled to prevent duplicate handling
         monster.is_dead = True
+        monster.death_handled = True
             
         # Create death animation if animation manager is provided
         if animation_manager:
@@ -239,11 +301,93 @@ class WaveManager:
         resource_manager.add_resource("Monster Coins", 1)
         
         # Handle boss loot
-        if isinstance(monster, BossMonster):
+        if monster.is_boss:
             loot = monster.drop_loot()
             for resource_type, amount in loot.items():
                 resource_manager.add_resource(resource_type, amount)
     
+    def build_monster_grid(self):
+        """
+        Bucket the live monsters into grid cells by their current position
+        
+        Called once per frame after monsters have moved, so towers can look up
+        nearby monsters with get_monsters_near instead of scanning all of them.
+        Ground and flying monsters go into separate grids.
+        """
+        cell_size = MONSTER_GRID_CELL_SIZE
+        ground_grid = {}
+        flying_grid = {}
+        
+        for monster in self.active_monsters:
+            if monster.is_dead:
+                continue
+            grid = flying_grid if monster.flying else ground_grid
+            position = monster.position
+            cell = (int(position[0] // cell_size), int(position[1] // cell_size))
+            bucket = grid.get(cell)
+            if bucket is None:
+                grid[cell] = [monster]
+            else:
+                bucket.append(monster)
+        
+        self.ground_monster_grid = ground_grid
+        self.flying_monster_grid = flying_grid
+    
+    def get_monsters_near(self, position, radius, include_flying=True):
+        """
+        Get monsters in the grid cells overlapping a circle's bounding box
+        
+        Args:
+            position: Tuple of (x, y) center coordinates
+            radius: Radius around the center
+            include_flying: Whether flying monsters should be included
+            
+        Returns:
+            List of candidate monsters (callers still check the exact distance)
+        """
+        cell_size = MONSTER_GRID_CELL_SIZE
+        min_x = int((position[0] - radius) // cell_size)
+        max_x = int((position[0] + radius) // cell_size)
+        min_y = int((position[1] - radius) // cell_size)
+        max_y = int((position[1] + radius) // cell_size)
+        
+        if include_flying:
+            grids = (self.ground_monster_grid, self.flying_monster_grid)
+        else:
+            grids = (self.ground_monster_grid,)
+        
+        nearby = []
+        for grid in grids:
+            # Most waves have no flyers, so skip an empty grid without probing cells
+            if not grid:
+                continue
+            for cell_x in range(min_x, max_x + 1):
+                for cell_y in range(min_y, max_y + 1):
+                    bucket = grid.get((cell_x, cell_y))
+                    if bucket:
+                        nearby.extend(bucket)
+        return nearby
+    
+    def get_announcement_surface(self, text, font_size, color):
+        """
+        Get a wave announcement text this wave manager can fade
+        
+        Args:
+            text: Text to render
+            font_size: Font size to render with
+            color: RGB color tuple for the text
+            
+        Returns:
+            Pygame surface owned by the wave manager, so its alpha may be changed
+        """
+        key = (text, font_size, color)
+        text_surface = self.announcement_surfaces.get(key)
+        if text_surface is None:
+            # Copy the shared cached render rather than changing its alpha
+            text_surface = render_text(text, font_size, color).copy()
+            self.announcement_surfaces[key] = text_surface
+        return text_surface
+    
     def draw(self, screen):
         """
         Draw all monsters and wave animations
@@ -251,6 +395,11 @@ class WaveManager:
         Args:
             screen: Pygame surface to draw on
         """
+        # Nothing to draw between waves once the announcements have faded
+        if (not self.active_monsters and self.wave_start_animation_timer <= 0
+                and self.wave_complete_animation_timer <= 0):
+            return
+        
         # Draw all monsters
         for monster in self.active_monsters:
             monster.draw(screen)
@@ -259,9 +408,8 @@ class WaveManager:
         if self.wave_start_animation_timer > 0:
             alpha = int(255 * min(1, self.wave_start_animation_timer))
             font_size = 36
-            font = pygame.font.Font(None, font_size)
             
-            if self.current_wave % 10 == 0:
+            if self.is_boss_wave:
                 # Boss wave announcement
                 text = f"BOSS WAVE {self.current_wave}"
                 color = (255, 100, 100)  # Red for boss waves
@@ -270,13 +418,10 @@ class WaveManager:
                 text = f"Wave {self.current_wave}"
                 color = (255, 255, 255)
             
-            text_surface = font.render(text, True, color)
+            text_surface = self.get_announcement_surface(text, font_size, color)
             
-            # Apply fading effect
-            if alpha < 255:
-                alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-                alpha_surface.fill((255, 255, 255, alpha))
-                text_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            # Fade with the surface-wide alpha
+            text_surface.set_alpha(alpha)
             
             text_rect = text_surface.get_rect(center=(screen.get_width() // 2, 100))
             screen.blit(text_surface, text_rect)
@@ -285,16 +430,12 @@ class WaveManager:
         if self.wave_complete_animation_timer > 0 and self.wave_completed:
             alpha = int(255 * min(1, self.wave_complete_animation_timer))
             font_size = 30
-            font = pygame.font.Font(None, font_size)
             
             text = f"Wave {self.current_wave} Complete!"
-            text_surface = font.render(text, True, (200, 255, 200))
+            text_surface = self.get_announcement_surface(text, font_size, (200, 255, 200))
             
             # Apply fading effect
-            if alpha < 255:
-                alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-                alpha_surface.fill((255, 255, 255, alpha))
-                text_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            text_surface.set_alpha(alpha)
             
             text_rect = text_surface.get_rect(center=(screen.get_width() // 2, 150))
             screen.blit(text_surface, text_rect)
@@ -302,16 +443,12 @@ class WaveManager:
             # Draw continuous wave mode indicator if enabled
             if self.continuous_wave:
                 font_size = 20
-                font = pygame.font.Font(None, font_size)
                 
                 next_wave_text = f"Starting Wave {self.current_wave + 1} Soon..."
-                next_wave_surface = font.render(next_wave_text, True, (200, 200, 255))
+                next_wave_surface = self.get_announcement_surface(next_wave_text, font_size, (200, 200, 255))
                 
                 # Apply fading effect
-                if alpha < 255:
-                    alpha_surface = pygame.Surface(next_wave_surface.get_size(), pygame.SRCALPHA)
-                    alpha_surface.fill((255, 255, 255, alpha))
-                    next_wave_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                next_wave_surface.set_alpha(alpha)
                 
                 next_wave_rect = next_wave_surface.get_rect(center=(screen.get_width() // 2, 180))
                 screen.blit(next_wave_surface, next_wave_rect)
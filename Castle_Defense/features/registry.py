@@ -0,0 +1,17 @@
+# features/registry.py
+"""
+Registry of the running Game for features that report back to it
+"""
+
+# Game instance, registered once by Game on startup
+game_instance = None
+
+def register_game(game):
+    """
+    Register the game instance that towers, the wave manager and the game UI report to
+    
+    Args:
+        game: Game instance with wave_manager and resource_manager
+    """
+    global game_instance
+    game_instance = game
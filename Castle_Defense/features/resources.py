@@ -11,6 +11,8 @@ class ResourceManager:
     def __init__(self):
         """Initialize with default resource amounts"""
         self.resources = INITIAL_RESOURCES.copy()
+        # Bumped whenever any amount changes, so UI can skip work while it's unchanged
+        self.epoch = 0
     
     def add_resource(self, resource_type, amount):
         """
@@ -25,6 +27,7 @@ class ResourceManager:
         """
         if resource_type in self.resources:
             self.resources[resource_type] += amount
+            self.epoch += 1
             return True
         return False
     
@@ -41,6 +44,7 @@ class ResourceManager:
         """
         if resource_type in self.resources and self.resources[resource_type] >= amount:
             self.resources[resource_type] -= amount
+            self.epoch += 1
             return True
         return False
     
@@ -55,13 +59,13 @@ class ResourceManager:
             True if all resources were spent, False if insufficient
         """
         # First check if we have enough of all resources
-        for resource_type, amount in cost_dict.items():
-            if resource_type not in self.resources or self.resources[resource_type] < amount:
-                return False
+        if not self.has_resources(cost_dict):
+            return False
         
         # If we have enough, spend them
         for resource_type, amount in cost_dict.items():
             self.resources[resource_type] -= amount
+        self.epoch += 1
         
         return True
     
@@ -75,8 +79,11 @@ class ResourceManager:
         Returns:
             True if we have enough of all resources, False otherwise
         """
+        # One dict lookup per resource; amounts are never None
+        resources = self.resources
         for resource_type, amount in cost_dict.items():
-            if resource_type not in self.resources or self.resources[resource_type] < amount:
+            stock = resources.get(resource_type)
+            if stock is None or stock < amount:
                 return False
         return True
     
@@ -92,6 +99,22 @@ class ResourceManager:
         """
         return self.resources.get(resource_type, 0)
     
+    def has_any(self, resource_types):
+        """
+        Check if any of the given resources is above zero
+        
+        Args:
+            resource_types: Iterable of resource type names
+            
+        Returns:
+            True as soon as one resource has a positive amount, False otherwise
+        """
+        resources = self.resources
+        for resource_type in resource_types:
+            if resources.get(resource_type, 0) > 0:
+                return True
+        return False
+    
     def has_resources_for_tower(self, resource_cost, monster_coin_cost):
         """
         Check if player has enough resources and Monster Coins for a tower
@@ -134,5 +157,6 @@ class ResourceManager:
         
         # Spend Monster Coins
         self.resources["Monster Coins"] -= monster_coin_cost
+        self.epoch += 1
         
         return True
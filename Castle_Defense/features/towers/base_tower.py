@@ -4,21 +4,101 @@ Base Tower class for Castle Defense
 """
 import pygame
 import math
+from operator import itemgetter
 from config import (
     TOWER_TYPES,
-    TOWER_UPGRADE_COST_MULTIPLIER,
-    TOWER_MONSTER_COIN_COSTS,
-    TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER,
     TOWER_DAMAGE_UPGRADE_MULTIPLIER,
     TOWER_ATTACK_SPEED_UPGRADE_MULTIPLIER,
     TOWER_RANGE_UPGRADE_MULTIPLIER,
     TOWER_AOE_UPGRADE_MULTIPLIER,
     ITEM_EFFECTS
 )
-from utils import distance, calculate_angle, scale_position, scale_size, scale_value
+from utils import calculate_angle, scale_position, scale_size, scale_value, render_text
+from features import registry
+from .tower_utils import get_scaled_upgrade_cost, get_scaled_monster_coin_cost
+
+# Scaled drawing sizes; the scale is fixed for the lifetime of the window
+TYPE_FONT_SIZE = scale_value(16)
+LEVEL_FONT_SIZE = scale_value(20)
+ITEM_FONT_SIZE = scale_value(14)
+TYPE_LABEL_OFFSET = scale_value(10)
+ITEM_INDICATOR_RADIUS = scale_value(8)
+ITEM_INDICATOR_OFFSET = scale_value(25)
+HIGHLIGHT_INFLATE = scale_value(4)
+HIGHLIGHT_WIDTH = scale_value(2)
+RANGE_LINE_WIDTH = scale_value(1)
+
+# Item indicator background colors (other items use gray)
+ITEM_INDICATOR_COLORS = {
+    "Unstoppable Force": (255, 100, 50),  # Orange
+    "Serene Spirit": (100, 200, 100)      # Green
+}
+
+# Item glow outlines keyed by (color, size, border width); alpha is applied per blit
+_glow_cache = {}
+
+def get_glow_surface(color, glow_size, border_width):
+    """
+    Get an opaque glow outline surface, building it on first use
+    
+    Args:
+        color: RGB color tuple of the glow
+        glow_size: Width and height of the glow in pixels
+        border_width: Width of the glow outline in pixels
+        
+    Returns:
+        Shared pygame Surface; callers set its alpha before blitting
+    """
+    key = (color, glow_size, border_width)
+    glow_surface = _glow_cache.get(key)
+    if glow_surface is None:
+        glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surface, color, (0, 0, glow_size, glow_size), border_width)
+        _glow_cache[key] = glow_surface
+    return glow_surface
+
+# Tower bodies with their level label composited in, keyed by (color, size, level)
+_body_cache = {}
+
+def get_body_surface(color, size, level):
+    """
+    Get a tower body surface with its level label, building it on first use
+    
+    Args:
+        color: RGB color tuple of the tower body
+        size: Tuple of (width, height) of the tower body
+        level: Tower level shown in the middle of the body
+        
+    Returns:
+        Shared pygame Surface; callers must not draw on it
+    """
+    key = (color, size, level)
+    body_surface = _body_cache.get(key)
+    if body_surface is None:
+        body_surface = pygame.Surface(size)
+        body_surface.fill(color)
+        text = render_text(f"Lv {level}", LEVEL_FONT_SIZE)
+        body_surface.blit(text, text.get_rect(center=(size[0] // 2, size[1] // 2)))
+        _body_cache[key] = body_surface
+    return body_surface
 
 class Tower:
     """Base class for all towers"""
+    # Attributes shared by every tower type; subclasses declare their own
+    # attributes (or empty slots) so no tower gets a __dict__
+    __slots__ = (
+        "position", "tower_type", "level", "damage_level", "attack_speed_level",
+        "range_level", "damage", "attack_speed", "attack_cooldown", "ref_range", "range",
+        "base_damage", "base_attack_speed", "base_range", "base_ref_range",
+        "attack_timer", "targets", "target_distances",
+        "current_target", "is_attacking",
+        "attack_animation_time", "item_slots", "has_item_effects",
+        "splash_damage_enabled", "splash_damage_radius", "splash_damage_radius_sq",
+        "item_glow_color",
+        "item_glow_intensity", "ref_size", "size", "rect", "color", "selected"
+    )
+    can_target_flying = False  # Overridden by towers that can hit flying monsters
+    
     def __init__(self, position, tower_type):
         """
         Initialize tower with position and type
@@ -40,6 +120,7 @@ class Tower:
         tower_config = TOWER_TYPES.get(tower_type, {})
         self.damage = tower_config.get("damage", 10)
         self.attack_speed = tower_config.get("attack_speed", 1.0)
+        self.attack_cooldown = 1.0 / self.attack_speed  # Seconds between attacks
         
         # Store both reference and scaled range
         self.ref_range = tower_config.get("range", 150)
@@ -54,6 +135,7 @@ class Tower:
         # Attack tracking
         self.attack_timer = 0
         self.targets = []
+        self.target_distances = []  # (squared distance, monster) scratch list for find_targets
         self.current_target = None  # Track current target for animations
         
         # Animation flags
@@ -67,6 +149,7 @@ class Tower:
         # Splash damage from Unstoppable Force (for single-target towers)
         self.splash_damage_enabled = False
         self.splash_damage_radius = 0
+        self.splash_damage_radius_sq = 0  # Squared radius for sqrt-free splash checks
         
         # Item visual effects
         self.item_glow_color = None
@@ -108,31 +191,32 @@ class Tower:
         return colors.get(tower_type, (100, 100, 100))
     
     def initialize_specific_properties(self):
-        """Initialize tower-specific properties"""
-        tower_config = TOWER_TYPES.get(self.tower_type, {})
+        """Initialize tower-specific properties (overridden by towers that have them)"""
+        pass
+    
+    @staticmethod
+    def get_glow_intensity():
+        """
+        Get the current pulse of the item glow, shared by all towers
         
-        # Initialize AoE properties for Splash tower
-        if self.tower_type == "Splash":
-            self.ref_aoe_radius = tower_config.get("aoe_radius", 50)
-            self.aoe_radius = scale_value(self.ref_aoe_radius)
-            # Store base AoE for item effects
-            self.base_ref_aoe_radius = self.ref_aoe_radius
-            self.base_aoe_radius = self.aoe_radius
-            # Add AoE upgrade level
-            self.aoe_radius_level = 1
-        
-        # Initialize slow properties for Frozen tower
-        elif self.tower_type == "Frozen":
-            self.slow_effect = tower_config.get("slow_effect", 0.5)
-            self.slow_duration = tower_config.get("slow_duration", 3.0)
-            # Store base slow effect for item effects
-            self.base_slow_effect = self.slow_effect
-            self.base_slow_duration = self.slow_duration
-            # Add slow upgrade levels
-            self.slow_effect_level = 1
-            self.slow_duration_level = 1
+        Returns:
+            Glow intensity between 0 and 1
+        """
+        return 0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.005)
+    
+    def is_ready_to_attack(self, dt):
+        """
+        Check whether the tower will come off cooldown during this update
+        
+        Args:
+            dt: Time delta in seconds
+            
+        Returns:
+            True if update() will look for targets this frame
+        """
+        return self.attack_timer + dt >= self.attack_cooldown
     
-    def update(self, dt, monsters, animation_manager=None):
+    def update(self, dt, monsters, animation_manager=None, glow_intensity=None):
         """
         Update tower state and attack monsters
         
@@ -140,6 +224,7 @@ class Tower:
             dt: Time delta in seconds
             monsters: List of monsters to target
             animation_manager: Optional AnimationManager for visual effects
+            glow_intensity: Optional item glow pulse computed once per frame
         """
         # Update attack animation flag if needed
         if self.is_attacking:
@@ -150,16 +235,17 @@ class Tower:
         # Update item glow effect
         if self.item_glow_color:
             # Pulsing glow effect
-            self.item_glow_intensity = 0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.005)
+            if glow_intensity is None:
+                glow_intensity = self.get_glow_intensity()
+            self.item_glow_intensity = glow_intensity
         
-        # Find targets
-        self.find_targets(monsters)
-        
-        # Update attack timer
+        # Update attack timer; targets are only needed once the tower can attack
         self.attack_timer += dt
-        if self.attack_timer >= 1.0 / self.attack_speed and self.targets:
-            self.attack_timer = 0
-            self.attack(animation_manager)
+        if self.attack_timer >= self.attack_cooldown:
+            self.find_targets(monsters)
+            if self.targets:
+                self.attack_timer = 0
+                self.attack(animation_manager)
     
     def find_targets(self, monsters):
         """
@@ -168,23 +254,43 @@ class Tower:
         Args:
             monsters: List of monsters to check
         """
-        self.targets = []
+        tower_x, tower_y = self.position
+        tower_range = self.range
+        range_sq = tower_range * tower_range
+        can_target_flying = self.can_target_flying
+        
+        # Refill the tower's own lists in place rather than allocating new ones
+        in_range = self.target_distances
+        in_range.clear()
+        targets = self.targets
+        targets.clear()
+        
+        add_candidate = in_range.append
         
         for monster in monsters:
-            # Skip dead monsters
-            if monster.is_dead:
+            # Skip dead monsters, and flying monsters unless we're an Archer or Sniper tower
+            if monster.is_dead or (monster.flying and not can_target_flying):
                 continue
-                
-            # Skip flying monsters unless we're an Archer or Sniper tower
-            if monster.flying and self.tower_type not in ["Archer", "Sniper"]:
+            
+            # Reject monsters outside the range's bounding box before any multiply
+            monster_x, monster_y = monster.position
+            dx = monster_x - tower_x
+            if dx > tower_range or dx < -tower_range:
+                continue
+            dy = monster_y - tower_y
+            if dy > tower_range or dy < -tower_range:
                 continue
             
-            # Check if monster is in range
-            if distance(self.position, monster.position) <= self.range:
-                self.targets.append(monster)
-        
-        # Sort targets by distance (closest first)
-        self.targets.sort(key=lambda m: distance(self.position, m.position))
+            # Check if monster is in range (squared distances, no sqrt)
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= range_sq:
+                add_candidate((distance_sq, monster))
+        
+        # Sort targets by distance (closest first), reusing the computed distances;
+        # a single candidate needs no sort
+        if len(in_range) > 1:
+            in_range.sort(key=itemgetter(0))
+        targets.extend(map(itemgetter(1), in_range))
     
     def attack(self, animation_manager=None):
         """
@@ -205,6 +311,60 @@ class Tower:
             if animation_manager and self.current_target:
                 animation_manager.create_tower_attack_animation(self, self.current_target)
     
+    def apply_item_splash(self, target, animation_manager=None):
+        """
+        Deal item splash damage (from Unstoppable Force) around a single-target hit
+        
+        Distances are compared squared against splash_damage_radius_sq, so no
+        square root is taken per monster.
+        
+        Args:
+            target: Monster hit by the attack
+            animation_manager: Optional AnimationManager for visual effects
+            
+        Returns:
+            List of monsters killed by the splash damage
+        """
+        splash_targets = []
+        if not self.splash_damage_enabled or self.splash_damage_radius <= 0:
+            return splash_targets
+        
+        target_x, target_y = target.position
+        splash_radius_sq = self.splash_damage_radius_sq
+        # Apply 50% damage to splash targets
+        splash_damage = self.damage * 0.5
+        
+        for monster in self.targets:
+            if monster is not target and not monster.is_dead:
+                # Check if monster is within splash radius of primary target
+                dx = monster.position[0] - target_x
+                dy = monster.position[1] - target_y
+                if dx * dx + dy * dy <= splash_radius_sq:
+                    if not monster.take_damage(splash_damage, "splash"):
+                        # Monster was killed by splash damage
+                        splash_targets.append(monster)
+                    elif animation_manager:
+                        # Monster was hit but not killed by splash
+                        animation_manager.create_monster_hit_animation(monster, "splash")
+        return splash_targets
+    
+    def handle_killed_monsters(self, killed_monsters, animation_manager=None):
+        """
+        Hand killed monsters to the wave manager for loot and death animations
+        
+        Args:
+            killed_monsters: List of monsters killed by this attack
+            animation_manager: Optional AnimationManager for visual effects
+        """
+        game = registry.game_instance
+        if not game:
+            return
+        
+        handle_monster_death = game.wave_manager.handle_monster_death
+        resource_manager = game.resource_manager
+        for monster in killed_monsters:
+            handle_monster_death(monster, resource_manager, animation_manager)
+    
     def calculate_damage_upgrade_cost(self):
         """
         Calculate upgrade cost for damage based on damage level
@@ -212,13 +372,8 @@ class Tower:
         Returns:
             Dictionary of resource costs
         """
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with damage level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.damage_level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with damage level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.damage_level))
     
     def calculate_damage_upgrade_monster_coin_cost(self):
         """
@@ -227,8 +382,7 @@ class Tower:
         Returns:
             Integer Monster Coin cost
         """
-        base_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 5)
-        return int(base_cost * (TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER ** (self.damage_level - 1)))
+        return get_scaled_monster_coin_cost(self.tower_type, self.damage_level)
     
     def calculate_attack_speed_upgrade_cost(self):
         """
@@ -237,13 +391,8 @@ class Tower:
         Returns:
             Dictionary of resource costs
         """
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with attack speed level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.attack_speed_level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with attack speed level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.attack_speed_level))
     
     def calculate_attack_speed_upgrade_monster_coin_cost(self):
         """
@@ -252,8 +401,7 @@ class Tower:
         Returns:
             Integer Monster Coin cost
         """
-        base_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 5)
-        return int(base_cost * (TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER ** (self.attack_speed_level - 1)))
+        return get_scaled_monster_coin_cost(self.tower_type, self.attack_speed_level)
     
     def calculate_range_upgrade_cost(self):
         """
@@ -262,13 +410,8 @@ class Tower:
         Returns:
             Dictionary of resource costs
         """
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with range level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.range_level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with range level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.range_level))
     
     def calculate_range_upgrade_monster_coin_cost(self):
         """
@@ -277,8 +420,7 @@ class Tower:
         Returns:
             Integer Monster Coin cost
         """
-        base_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 5)
-        return int(base_cost * (TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER ** (self.range_level - 1)))
+        return get_scaled_monster_coin_cost(self.tower_type, self.range_level)
     
     def upgrade_damage(self, resource_manager):
         """
@@ -377,13 +519,8 @@ class Tower:
             Dictionary of resource costs
         """
         # This is kept for backward compatibility
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with tower level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with tower level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.level))
     
     def add_item(self, item, slot_index, resource_manager=None):
         """
@@ -447,6 +584,7 @@ class Tower:
         # Reset stats to base values
         self.damage = self.base_damage
         self.attack_speed = self.base_attack_speed
+        self.attack_cooldown = 1.0 / self.attack_speed
         self.ref_range = self.base_ref_range
         self.range = self.base_range
         
@@ -461,12 +599,13 @@ class Tower:
         # Reset splash damage (for single-target towers)
         self.splash_damage_enabled = False
         self.splash_damage_radius = 0
+        self.splash_damage_radius_sq = 0
         
         # Reset item visual effects
         self.item_glow_color = None
         
         # No item effects to apply if both slots are empty
-        if not any(self.item_slots):
+        if not (self.item_slots[0] or self.item_slots[1]):
             self.has_item_effects = False
             return
             
@@ -503,6 +642,7 @@ class Tower:
                     # Scale splash radius with tower range
                     base_splash = item_effect.get("splash_damage_radius", 30)
                     self.splash_damage_radius = scale_value(base_splash)
+                    self.splash_damage_radius_sq = self.splash_damage_radius * self.splash_damage_radius
                     
             # Apply Serene Spirit effects (not implemented yet)
             elif item == "Serene Spirit":
@@ -524,6 +664,21 @@ class Tower:
             return self.item_slots[slot_index]
         return None
     
+    @staticmethod
+    def draw_towers(screen, towers):
+        """
+        Draw several towers, batching all of their labels into one blits call
+        
+        Args:
+            screen: Pygame surface to draw on
+            towers: Towers to draw
+        """
+        label_blits = []
+        for tower in towers:
+            tower.draw_shapes(screen)
+            tower.collect_label_blits(label_blits)
+        screen.blits(label_blits, doreturn=False)
+    
     def draw(self, screen):
         """
         Draw tower to screen
@@ -531,23 +686,23 @@ class Tower:
         Args:
             screen: Pygame surface to draw on
         """
-        # Draw tower base
-        pygame.draw.rect(screen, self.color, self.rect)
+        self.draw_shapes(screen)
+        screen.blits(self.collect_label_blits([]), doreturn=False)
+    
+    def draw_shapes(self, screen):
+        """
+        Draw everything except the text labels (body and level, glow, indicators, range)
         
+        Args:
+            screen: Pygame surface to draw on
+        """
         # Draw item glow effect if tower has items
         if self.item_glow_color and self.item_glow_intensity > 0:
-            # Create the glow as a transparent surface
+            # Reuse the cached glow outline; only its alpha pulses with intensity
             glow_size = int(self.size[0] * (1.2 + 0.1 * self.item_glow_intensity))
-            glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-            
-            # Calculate glow color with alpha based on intensity
-            glow_alpha = int(100 * self.item_glow_intensity)
-            glow_color = (*self.item_glow_color, glow_alpha)
-            
-            # Draw the glow
-            pygame.draw.rect(glow_surface, glow_color, 
-                           (0, 0, glow_size, glow_size), 
-                           int(self.size[0] * 0.2))
+            glow_surface = get_glow_surface(self.item_glow_color, glow_size,
+                                            int(self.size[0] * 0.2))
+            glow_surface.set_alpha(int(100 * self.item_glow_intensity))
             
             # Position the glow centered on the tower
             glow_pos = (
@@ -558,49 +713,16 @@ class Tower:
             # Draw the glow
             screen.blit(glow_surface, glow_pos)
         
-        # Draw tower
-        pygame.draw.rect(screen, self.color, self.rect)
-        
-        # Draw tower type indicator
-        font_size = scale_value(16)
-        font = pygame.font.Font(None, font_size)
-        text = font.render(self.tower_type, True, (255, 255, 255))
-        text_rect = text.get_rect(center=(self.rect.centerx, self.rect.top - scale_value(10)))
-        screen.blit(text, text_rect)
-        
-        # Draw tower level
-        font_size = scale_value(20)
-        font = pygame.font.Font(None, font_size)
-        text = font.render(f"Lv {self.level}", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(self.rect.centerx, self.rect.centery))
-        screen.blit(text, text_rect)
-        
-        # Draw item indicators if tower has items
-        if any(self.item_slots):
-            small_font = pygame.font.Font(None, scale_value(14))
+        # Draw tower body and level in one blit (over the inner edge of the glow)
+        screen.blit(get_body_surface(self.color, self.size, self.level), self.rect)
+        
+        # Draw item indicator backgrounds if tower has items (letters are labels)
+        if self.has_item_effects:
             for i, item in enumerate(self.item_slots):
                 if item:
-                    # Calculate position for item indicator (top-left and top-right corners)
-                    x_offset = -self.size[0]//2 + scale_value(8) if i == 0 else self.size[0]//2 - scale_value(8)
-                    item_pos = (self.rect.centerx + x_offset, self.rect.top - scale_value(25))
-                    
-                    # Get first letter of item for indicator
-                    item_letter = item[0]
-                    
                     # Draw background circle
-                    if item == "Unstoppable Force":
-                        bg_color = (255, 100, 50)  # Orange for Unstoppable Force
-                    elif item == "Serene Spirit":
-                        bg_color = (100, 200, 100)  # Green for Serene Spirit
-                    else:
-                        bg_color = (150, 150, 150)  # Gray for other items
-                        
-                    pygame.draw.circle(screen, bg_color, item_pos, scale_value(8))
-                    
-                    # Draw item letter
-                    text = small_font.render(item_letter, True, (255, 255, 255))
-                    text_rect = text.get_rect(center=item_pos)
-                    screen.blit(text, text_rect)
+                    bg_color = ITEM_INDICATOR_COLORS.get(item, (150, 150, 150))
+                    pygame.draw.circle(screen, bg_color, self.get_item_indicator_position(i), ITEM_INDICATOR_RADIUS)
         
         # Draw attack animation (flash or highlight when attacking)
         if self.is_attacking:
@@ -611,25 +733,64 @@ class Tower:
                 min(255, self.color[1] + 50 * intensity),
                 min(255, self.color[2] + 50 * intensity)
             )
-            highlight_rect = self.rect.inflate(scale_value(4), scale_value(4))
-            pygame.draw.rect(screen, highlight_color, highlight_rect, scale_value(2))
+            highlight_rect = self.rect.inflate(HIGHLIGHT_INFLATE, HIGHLIGHT_INFLATE)
+            pygame.draw.rect(screen, highlight_color, highlight_rect, HIGHLIGHT_WIDTH)
         
         # Draw range indicator (only when selected)
         if self.selected:
             # Draw main range circle
             pygame.draw.circle(screen, (255, 255, 255), 
                               (int(self.position[0]), int(self.position[1])), 
-                              int(self.range), scale_value(1))
+                              int(self.range), RANGE_LINE_WIDTH)
             
             # Draw special range indicators based on tower type and items
             if self.tower_type == "Splash":
                 # Draw AoE radius indicator for Splash Tower
                 pygame.draw.circle(screen, (255, 200, 0), 
                                   (int(self.position[0]), int(self.position[1])), 
-                                  int(self.aoe_radius), scale_value(1))
+                                  int(self.aoe_radius), RANGE_LINE_WIDTH)
                 
             elif self.tower_type in ["Archer", "Sniper"] and self.splash_damage_enabled:
                 # Draw splash damage radius for single-target towers with Unstoppable Force
                 pygame.draw.circle(screen, (255, 150, 50), 
                                   (int(self.position[0]), int(self.position[1])), 
-                                  int(self.splash_damage_radius), scale_value(1))
+                                  int(self.splash_damage_radius), RANGE_LINE_WIDTH)
+    
+    def collect_label_blits(self, label_blits):
+        """
+        Add this tower's text labels to a list of (surface, rect) blits
+        
+        Args:
+            label_blits: List to append (surface, rect) pairs to
+            
+        Returns:
+            The same list, for convenience
+        """
+        # Tower type indicator (labels are rendered once and shared between towers)
+        text = render_text(self.tower_type, TYPE_FONT_SIZE)
+        label_blits.append((text, text.get_rect(center=(self.rect.centerx, self.rect.top - TYPE_LABEL_OFFSET))))
+        
+        # Item letters on top of the indicator circles
+        if self.has_item_effects:
+            for i, item in enumerate(self.item_slots):
+                if item:
+                    text = render_text(item[0], ITEM_FONT_SIZE)
+                    label_blits.append((text, text.get_rect(center=self.get_item_indicator_position(i))))
+        
+        return label_blits
+    
+    def get_item_indicator_position(self, slot_index):
+        """
+        Get the center of an item slot indicator (top-left and top-right corners)
+        
+        Args:
+            slot_index: Item slot index (0 or 1)
+            
+        Returns:
+            Tuple of (x, y) coordinates
+        """
+        if slot_index == 0:
+            x_offset = -self.size[0]//2 + ITEM_INDICATOR_RADIUS
+        else:
+            x_offset = self.size[0]//2 - ITEM_INDICATOR_RADIUS
+        return (self.rect.centerx + x_offset, self.rect.top - ITEM_INDICATOR_OFFSET)
@@ -7,6 +7,14 @@ from .sniper_tower import SniperTower
 from .splash_tower import SplashTower
 from .frozen_tower import FrozenTower
 
+# Tower class for each tower type name
+TOWER_CLASSES = {
+    "Archer": ArcherTower,
+    "Sniper": SniperTower,
+    "Splash": SplashTower,
+    "Frozen": FrozenTower
+}
+
 class TowerFactory:
     """Factory class for creating tower instances"""
     
@@ -25,13 +33,7 @@ class TowerFactory:
         Raises:
             ValueError: If tower_type is invalid
         """
-        if tower_type == "Archer":
-            return ArcherTower(position)
-        elif tower_type == "Sniper":
-            return SniperTower(position)
-        elif tower_type == "Splash":
-            return SplashTower(position)
-        elif tower_type == "Frozen":
-            return FrozenTower(position)
-        else:
+        tower_class = TOWER_CLASSES.get(tower_type)
+        if tower_class is None:
             raise ValueError(f"Unknown tower type: {tower_type}")
+        return tower_class(position)
@@ -3,18 +3,31 @@
 Frozen Tower implementation for Castle Defense
 """
 from .base_tower import Tower
-from config import (
-    TOWER_TYPES,
-    TOWER_UPGRADE_COST_MULTIPLIER,
-    TOWER_MONSTER_COIN_COSTS,
-    TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER
-)
+from .tower_utils import get_scaled_upgrade_cost, get_scaled_monster_coin_cost
+from config import TOWER_TYPES
 
 class FrozenTower(Tower):
     """Tower that slows and damages targets"""
+    __slots__ = (
+        "slow_effect", "slow_duration", "base_slow_effect", "base_slow_duration",
+        "slow_effect_level", "slow_duration_level"
+    )
+    
     def __init__(self, position):
         super().__init__(position, "Frozen")
     
+    def initialize_specific_properties(self):
+        """Initialize slow properties"""
+        tower_config = TOWER_TYPES.get(self.tower_type, {})
+        self.slow_effect = tower_config.get("slow_effect", 0.5)
+        self.slow_duration = tower_config.get("slow_duration", 3.0)
+        # Store base slow effect for item effects
+        self.base_slow_effect = self.slow_effect
+        self.base_slow_duration = self.slow_duration
+        # Add slow upgrade levels
+        self.slow_effect_level = 1
+        self.slow_duration_level = 1
+    
     def attack(self, animation_manager=None):
         """
         Attack and slow all targets in range
@@ -49,13 +62,7 @@ class FrozenTower(Tower):
         
         # Handle killed monsters
         if killed_monsters:
-            # Get reference to wave_manager and resource_manager from the game instance
-            from game import Game
-            for game_instance in [obj for obj in globals().values() if isinstance(obj, Game)]:
-                for monster in killed_monsters:
-                    if animation_manager:
-                        animation_manager.create_monster_death_animation(monster)
-                    game_instance.wave_manager.handle_monster_death(monster, game_instance.resource_manager, animation_manager)
+            self.handle_killed_monsters(killed_monsters, animation_manager)
     
     def calculate_slow_effect_upgrade_cost(self):
         """
@@ -64,13 +71,8 @@ class FrozenTower(Tower):
         Returns:
             Dictionary of resource costs
         """
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with slow effect level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.slow_effect_level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with slow effect level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.slow_effect_level))
     
     def calculate_slow_effect_upgrade_monster_coin_cost(self):
         """
@@ -79,8 +81,7 @@ class FrozenTower(Tower):
         Returns:
             Integer Monster Coin cost
         """
-        base_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 15)  # Higher base for Frozen tower
-        return int(base_cost * (TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER ** (self.slow_effect_level - 1)))
+        return get_scaled_monster_coin_cost(self.tower_type, self.slow_effect_level, 15)  # Higher base for Frozen tower
     
     def calculate_slow_duration_upgrade_cost(self):
         """
@@ -89,13 +90,8 @@ class FrozenTower(Tower):
         Returns:
             Dictionary of resource costs
         """
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with slow duration level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.slow_duration_level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with slow duration level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.slow_duration_level))
     
     def calculate_slow_duration_upgrade_monster_coin_cost(self):
         """
@@ -104,8 +100,7 @@ class FrozenTower(Tower):
         Returns:
             Integer Monster Coin cost
         """
-        base_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 15)  # Higher base for Frozen tower
-        return int(base_cost * (TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER ** (self.slow_duration_level - 1)))
+        return get_scaled_monster_coin_cost(self.tower_type, self.slow_duration_level, 15)  # Higher base for Frozen tower
     
     def upgrade_slow_effect(self, resource_manager):
         """
@@ -2,10 +2,16 @@
 """
 Sniper Tower implementation for Castle Defense
 """
+from operator import attrgetter
 from .base_tower import Tower
 
+get_health = attrgetter("health")
+
 class SniperTower(Tower):
     """Tower with high damage, low attack speed"""
+    __slots__ = ()
+    can_target_flying = True
+    
     def __init__(self, position):
         super().__init__(position, "Sniper")
     
@@ -22,7 +28,7 @@ class SniperTower(Tower):
             return
             
         # Find highest health target
-        target = max(self.targets, key=lambda m: m.health)
+        target = max(self.targets, key=get_health)
         
         if target.is_dead:
             return
@@ -35,20 +41,7 @@ class SniperTower(Tower):
         primary_target_killed = not target.take_damage(self.damage)
         
         # Apply splash damage if enabled (from Unstoppable Force item)
-        splash_targets = []
-        if self.splash_damage_enabled and self.splash_damage_radius > 0:
-            for monster in self.targets:
-                if monster != target and not monster.is_dead:
-                    # Check if monster is within splash radius of primary target
-                    if distance(monster.position, target.position) <= self.splash_damage_radius:
-                        # Apply 50% damage to splash targets
-                        splash_damage = self.damage * 0.5
-                        if not monster.take_damage(splash_damage, "splash"):
-                            # Monster was killed by splash damage
-                            splash_targets.append(monster)
-                        elif animation_manager:
-                            # Monster was hit but not killed by splash
-                            animation_manager.create_monster_hit_animation(monster, "splash")
+        splash_targets = self.apply_item_splash(target, animation_manager)
         
         # Handle deaths and resource drops
         killed_monsters = []
@@ -62,16 +55,7 @@ class SniperTower(Tower):
         
         # Handle all killed monsters
         if killed_monsters:
-            # Get reference to wave_manager and resource_manager from the game instance
-            from game import Game
-            for game_instance in [obj for obj in globals().values() if isinstance(obj, Game)]:
-                for monster in killed_monsters:
-                    if animation_manager:
-                        animation_manager.create_monster_death_animation(monster)
-                    game_instance.wave_manager.handle_monster_death(monster, game_instance.resource_manager, animation_manager)
+            self.handle_killed_monsters(killed_monsters, animation_manager)
         elif animation_manager and not primary_target_killed:
             # Primary target still alive, create hit animation
             animation_manager.create_monster_hit_animation(target)
-
-# Import this at the module level to avoid circular import in attack()
-from utils import distance
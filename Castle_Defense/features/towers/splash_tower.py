@@ -3,19 +3,31 @@
 Splash Tower implementation for Castle Defense
 """
 from .base_tower import Tower
-from config import (
-    TOWER_TYPES,
-    TOWER_UPGRADE_COST_MULTIPLIER,
-    TOWER_MONSTER_COIN_COSTS,
-    TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER,
-    TOWER_AOE_UPGRADE_MULTIPLIER
-)
+from .tower_utils import get_scaled_upgrade_cost, get_scaled_monster_coin_cost
+from config import TOWER_TYPES, TOWER_AOE_UPGRADE_MULTIPLIER
+from utils import scale_value
 
 class SplashTower(Tower):
     """Tower with area damage"""
+    __slots__ = (
+        "ref_aoe_radius", "aoe_radius", "base_ref_aoe_radius", "base_aoe_radius",
+        "aoe_radius_level"
+    )
+    
     def __init__(self, position):
         super().__init__(position, "Splash")
     
+    def initialize_specific_properties(self):
+        """Initialize AoE properties"""
+        tower_config = TOWER_TYPES.get(self.tower_type, {})
+        self.ref_aoe_radius = tower_config.get("aoe_radius", 50)
+        self.aoe_radius = scale_value(self.ref_aoe_radius)
+        # Store base AoE for item effects
+        self.base_ref_aoe_radius = self.ref_aoe_radius
+        self.base_aoe_radius = self.aoe_radius
+        # Add AoE upgrade level
+        self.aoe_radius_level = 1
+    
     def attack(self, animation_manager=None):
         """
         Attack all targets within AoE radius of primary target
@@ -29,7 +41,8 @@ class SplashTower(Tower):
             return
             
         primary_target = self.targets[0]
-        primary_target_pos = primary_target.position
+        target_x, target_y = primary_target.position
+        aoe_radius_sq = self.aoe_radius * self.aoe_radius
         
         # Create attack animation before potentially killing monsters
         if animation_manager:
@@ -43,7 +56,10 @@ class SplashTower(Tower):
             if monster.is_dead:
                 continue
                 
-            if distance(monster.position, primary_target_pos) <= self.aoe_radius:
+            # Check if monster is within AoE radius of primary target
+            dx = monster.position[0] - target_x
+            dy = monster.position[1] - target_y
+            if dx * dx + dy * dy <= aoe_radius_sq:
                 if not monster.take_damage(self.damage, "splash"):
                     # Monster was killed
                     killed_monsters.append(monster)
@@ -54,13 +70,7 @@ class SplashTower(Tower):
         
         # Handle killed monsters
         if killed_monsters:
-            # Get reference to wave_manager and resource_manager from the game instance
-            from game import Game
-            for game_instance in [obj for obj in globals().values() if isinstance(obj, Game)]:
-                for monster in killed_monsters:
-                    if animation_manager:
-                        animation_manager.create_monster_death_animation(monster)
-                    game_instance.wave_manager.handle_monster_death(monster, game_instance.resource_manager, animation_manager)
+            self.handle_killed_monsters(killed_monsters, animation_manager)
     
     def calculate_aoe_radius_upgrade_cost(self):
         """
@@ -69,13 +79,8 @@ class SplashTower(Tower):
         Returns:
             Dictionary of resource costs
         """
-        base_cost = TOWER_TYPES.get(self.tower_type, {}).get("cost", {"Stone": 20})
-        
-        # Scale cost with AoE radius level
-        return {
-            resource_type: int(amount * (TOWER_UPGRADE_COST_MULTIPLIER ** (self.aoe_radius_level - 1)))
-            for resource_type, amount in base_cost.items()
-        }
+        # Scale cost with AoE radius level (memoized per tower type and level)
+        return dict(get_scaled_upgrade_cost(self.tower_type, self.aoe_radius_level))
     
     def calculate_aoe_radius_upgrade_monster_coin_cost(self):
         """
@@ -84,8 +89,7 @@ class SplashTower(Tower):
         Returns:
             Integer Monster Coin cost
         """
-        base_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 15)  # Higher base for Splash tower
-        return int(base_cost * (TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER ** (self.aoe_radius_level - 1)))
+        return get_scaled_monster_coin_cost(self.tower_type, self.aoe_radius_level, 15)  # Higher base for Splash tower
     
     def upgrade_aoe_radius(self, resource_manager):
         """
@@ -126,6 +130,3 @@ class SplashTower(Tower):
             screen: Pygame surface to draw on
         """
         super().draw(screen)
-
-# Import these at the module level to avoid circular imports in methods
-from utils import distance, scale_value
@@ -2,6 +2,13 @@
 """
 Utility functions for tower operations
 """
+from functools import lru_cache
+from config import (
+    TOWER_TYPES,
+    TOWER_UPGRADE_COST_MULTIPLIER,
+    TOWER_MONSTER_COIN_COSTS,
+    TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER
+)
 
 def calculate_upgrade_cost(base_cost, multiplier, level):
     """
@@ -34,6 +41,42 @@ def calculate_monster_coin_cost(base_cost, multiplier, level):
     """
     return int(base_cost * (multiplier ** (level - 1)))
 
+@lru_cache(maxsize=None)
+def get_scaled_upgrade_cost(tower_type, level):
+    """
+    Get the resource cost of a tower upgrade at a level, computed once per pair
+    
+    Args:
+        tower_type: String indicating tower type
+        level: Current level of the upgrade path
+        
+    Returns:
+        Tuple of (resource_type, amount) pairs
+    """
+    base_cost = TOWER_TYPES.get(tower_type, {}).get("cost", {"Stone": 20})
+    return tuple(calculate_upgrade_cost(base_cost, TOWER_UPGRADE_COST_MULTIPLIER, level).items())
+
+@lru_cache(maxsize=None)
+def get_scaled_monster_coin_cost(tower_type, level, default_base_cost=5):
+    """
+    Get the Monster Coin cost of a tower upgrade at a level, computed once per pair
+    
+    Args:
+        tower_type: String indicating tower type
+        level: Current level of the upgrade path
+        default_base_cost: Base cost used if the tower type has none configured
+        
+    Returns:
+        Integer Monster Coin cost
+    """
+    base_cost = TOWER_MONSTER_COIN_COSTS.get(tower_type, default_base_cost)
+    return calculate_monster_coin_cost(base_cost, TOWER_MONSTER_COIN_UPGRADE_MULTIPLIER, level)
+
+def clear_upgrade_cost_cache():
+    """Forget memoized upgrade costs after tower costs are changed at runtime"""
+    get_scaled_upgrade_cost.cache_clear()
+    get_scaled_monster_coin_cost.cache_clear()
+
 def get_target_by_strategy(strategy, monsters):
     """
     Get a target based on targeting strategy
@@ -7,6 +7,7 @@ from features.castle import Castle
 from features.building_factory import BuildingFactory
 from features.waves import WaveManager
 from features.towers.factory import TowerFactory
+from features.registry import register_game
 from ui.game_ui import GameUI, TowerPlacementUI
 from ui.menus import BuildingMenu, TowerMenu
 from ui.castle_menu import CastleMenu
@@ -25,6 +26,30 @@ import config_extension
 # Make the Game class globally accessible for tower attack callbacks
 game_instance = None
 
+# Window events that hide or show the whole window
+WINDOW_HIDDEN_EVENTS = frozenset((pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN))
+WINDOW_SHOWN_EVENTS = frozenset((pygame.WINDOWRESTORED, pygame.WINDOWSHOWN))
+
+# Shared stand-in for the event list on frames with an empty queue
+NO_EVENTS = ()
+
+# Cell size of the grid used to find towers near a placement position
+TOWER_GRID_CELL_SIZE = scale_value(64)
+
+# The only event types the game, its states, menus or the developer menu
+# react to; everything else is kept out of the queue
+HANDLED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWHIDDEN,
+    pygame.WINDOWSHOWN
+]
+
 class Game:
     """
     Main game class that manages the game state, updates, and rendering.
@@ -39,9 +64,17 @@ class Game:
         global game_instance
         game_instance = self
         
+        # Let towers report kills without searching for the game instance
+        register_game(self)
+        
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.running = True
+        self.window_visible = True  # False while minimized or hidden, to skip drawing
+        
+        # Don't queue event types nothing handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         
         # Game speed control (for developer menu)
         self.time_scale = 1.0
@@ -69,6 +102,14 @@ class Game:
         # Initialize buildings and towers
         self.buildings = []
         self.towers = []
+        self.tower_size = scale_size((40, 40))  # Tower footprint, defined in reference dimensions
+        
+        # Towers bucketed by the grid cells their rect overlaps. Towers are only
+        # ever appended, so the grid catches up incrementally and is rebuilt if
+        # the tower list is replaced (e.g. by loading a save)
+        self.tower_grid = {}
+        self.tower_grid_towers = None
+        self.tower_grid_count = 0
         
         # Create the castle first so we can use its position
         # Position buildings below the castle (outside the castle walls)
@@ -109,26 +150,13 @@ class Game:
         # Game state variables
         self.selected_entity = None
         
-        # Initialize state manager
+        # Initialize state manager; each state is created the first time it's entered
         self.state_manager = GameStateManager(self)
-        # Create states dictionary for access by state objects
-        self.states = {}
-        
-        # Add states to manager
         self.state_manager.add_state("main_menu", MainMenuState)
-        self.states["main_menu"] = self.state_manager.states["main_menu"]
-        
         self.state_manager.add_state("playing", PlayingState)
-        self.states["playing"] = self.state_manager.states["playing"]
-        
         self.state_manager.add_state("paused", PausedState)
-        self.states["paused"] = self.state_manager.states["paused"]
-        
         self.state_manager.add_state("tower_placement", TowerPlacementState)
-        self.states["tower_placement"] = self.state_manager.states["tower_placement"]
-        
         self.state_manager.add_state("game_over", GameOverState)
-        self.states["game_over"] = self.state_manager.states["game_over"]
         
         # Start with main menu state
         self.state_manager.change_state("main_menu")
@@ -140,15 +168,50 @@ class Game:
             raw_dt = self.clock.tick(FPS) / 1000.0  # Convert to seconds
             dt = raw_dt * self.time_scale  # Apply time scale for speed control
             
-            # Collect all events once
-            events = pygame.event.get()
+            # Collect all events once (most frames have none, so skip the list)
+            events = pygame.event.get() if pygame.event.peek() else NO_EVENTS
             self.handle_events(events)
             
-            # If game is running, update state
+            # If game is running, update state; only draw while the window can be seen
             if self.running:
                 self.update(dt, raw_dt)
-                self.draw()
-                pygame.display.flip()
+                if self.window_visible:
+                    self.draw()
+                    pygame.display.flip()
+        
+        # Don't quit with a save still being written
+        self.save_manager.shutdown()
+    
+    def coalesce_mouse_motion(self, events):
+        """
+        Collapse each run of consecutive MOUSEMOTION events into one
+        
+        Hover and drag handlers only read the latest position, so each run is
+        replaced by its last event carrying the summed relative movement.
+        Events on either side of a click or key press keep their order.
+        
+        Args:
+            events: List of pygame events
+            
+        Returns:
+            List of pygame events
+        """
+        if len(events) < 2:
+            return events
+        
+        coalesced = []
+        for event in events:
+            if (event.type == pygame.MOUSEMOTION and coalesced
+                    and coalesced[-1].type == pygame.MOUSEMOTION):
+                previous = coalesced[-1]
+                attributes = dict(event.dict)
+                if "rel" in attributes and "rel" in previous.dict:
+                    attributes["rel"] = (previous.rel[0] + event.rel[0],
+                                         previous.rel[1] + event.rel[1])
+                coalesced[-1] = pygame.event.Event(pygame.MOUSEMOTION, attributes)
+            else:
+                coalesced.append(event)
+        return coalesced
     
     def handle_events(self, events):
         """
@@ -157,23 +220,40 @@ class Game:
         Args:
             events: List of pygame events
         """
+        if not events:
+            return
+        
+        # Hit-test only the latest mouse position of each burst of motion
+        events = self.coalesce_mouse_motion(events)
+        
+        dev_menu = self.dev_menu
         for event in events:
-            if event.type == pygame.QUIT:
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 self.running = False
                 return
             
+            # Track whether the window can be seen at all
+            elif event_type in WINDOW_HIDDEN_EVENTS:
+                self.window_visible = False
+                continue
+            elif event_type in WINDOW_SHOWN_EVENTS:
+                self.window_visible = True
+                continue
+            
             # Check for developer menu toggle (Ctrl+D)
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_d and pygame.key.get_mods() & pygame.KMOD_CTRL:
-                self.dev_menu.toggle()
+            elif event_type == pygame.KEYDOWN and event.key == pygame.K_d and pygame.key.get_mods() & pygame.KMOD_CTRL:
+                dev_menu.toggle()
                 return
             
-            # Handle developer menu events first if it's visible
-            if self.dev_menu.visible:
-                self.dev_menu.handle_event(event)  # Pass a single event, not the list
+            # Handle developer menu events first if it's visible (read each time,
+            # since an event can close it)
+            if dev_menu.visible:
+                dev_menu.handle_event(event)  # Pass a single event, not the list
                 continue
         
         # Let the current state handle events if dev menu didn't handle them
-        if self.dev_menu.visible:
+        if dev_menu.visible:
             return
             
         self.state_manager.handle_events(events)
@@ -190,13 +270,6 @@ class Game:
         if raw_dt:
             self.dev_menu.update(raw_dt)
         
-        # Set pause state for buildings
-        if self.state_manager.current_state is self.states["paused"]:
-            for building in self.buildings:
-                if hasattr(building, 'update'):
-                    # Update buildings with game_paused=True
-                    building.update(0, self.resource_manager, raw_dt, True)
-        
         # Update current state
         self.state_manager.update(dt)
     
@@ -216,8 +289,8 @@ class Game:
         Args:
             tower_type: Type of tower to place
         """
-        self.state_manager.change_state("tower_placement")
-        tower_placement_state = self.state_manager.states["tower_placement"]
+        tower_placement_state = self.state_manager.get_state("tower_placement")
+        self.state_manager.change_to(tower_placement_state)
         tower_placement_state.set_tower_type(tower_type)
     
     def is_valid_tower_position(self, position):
@@ -230,9 +303,12 @@ class Game:
         Returns:
             True if position is valid, False otherwise
         """
+        # Check if tower is within castle boundaries
+        if not self.castle.is_position_within_castle(position):
+            return False
+        
         # Create a rect for the tower at this position
-        tower_ref_size = (40, 40)  # Defined in reference dimensions
-        tower_size = scale_size(tower_ref_size)
+        tower_size = self.tower_size
         tower_rect = pygame.Rect(
             position[0] - tower_size[0] // 2,
             position[1] - tower_size[1] // 2,
@@ -240,22 +316,71 @@ class Game:
             tower_size[1]
         )
         
-        # Check if tower is within castle boundaries
-        if not self.castle.is_position_within_castle(position):
+        # Check collision with buildings (pygame reads each object's rect
+        # attribute and loops in C)
+        if tower_rect.collidelist(self.buildings) != -1:
             return False
         
-        # Check collision with buildings
-        for building in self.buildings:
-            if tower_rect.colliderect(building.rect):
-                return False
-        
-        # Check collision with other towers
-        for tower in self.towers:
-            if tower_rect.colliderect(tower.rect):
+        # Check collision with the towers in the overlapping grid cells
+        self.update_tower_grid()
+        tower_grid = self.tower_grid
+        for cell in self.get_grid_cells(tower_rect):
+            nearby_towers = tower_grid.get(cell)
+            if nearby_towers and tower_rect.collidelist(nearby_towers) != -1:
                 return False
         
         return True
     
+    def get_grid_cells(self, rect):
+        """
+        Get the tower grid cells a rect overlaps
+        
+        Args:
+            rect: Pygame Rect
+            
+        Returns:
+            List of (cell_x, cell_y) tuples
+        """
+        cell_size = TOWER_GRID_CELL_SIZE
+        return [
+            (cell_x, cell_y)
+            for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1)
+            for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1)
+        ]
+    
+    def update_tower_grid(self):
+        """Add newly placed towers to the tower grid, rebuilding it if the tower list was replaced"""
+        towers = self.towers
+        if towers is not self.tower_grid_towers or len(towers) < self.tower_grid_count:
+            self.tower_grid = {}
+            self.tower_grid_towers = towers
+            self.tower_grid_count = 0
+        
+        tower_grid = self.tower_grid
+        for tower in towers[self.tower_grid_count:]:
+            for cell in self.get_grid_cells(tower.rect):
+                tower_grid.setdefault(cell, []).append(tower)
+        self.tower_grid_count = len(towers)
+    
+    def get_tower_at(self, position):
+        """
+        Find the tower under a point using the tower grid
+        
+        Args:
+            position: Tuple of (x, y) coordinates
+            
+        Returns:
+            Tower at the position or None
+        """
+        self.update_tower_grid()
+        cell_size = TOWER_GRID_CELL_SIZE
+        nearby_towers = self.tower_grid.get((position[0] // cell_size, position[1] // cell_size))
+        if nearby_towers:
+            for tower in nearby_towers:
+                if tower.rect.collidepoint(position):
+                    return tower
+        return None
+    
     def reset_castle(self):
         """
         Restore castle health after game over
@@ -3,10 +3,21 @@
 Save system for Castle Defense game
 """
 import os
+import json
 import pickle
 import datetime
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
 from features.building_factory import BuildingFactory
-from features.towers.factory import TowerFactory
+from features.towers.factory import TowerFactory, TOWER_CLASSES
+
+# Every pickle protocol used by older saves (2 and up) starts with this opcode
+PICKLE_HEADER = b"\x80"
+
+# Saves record each tower's class name; the factory takes the tower type name
+TOWER_TYPES_BY_CLASS_NAME = {
+    tower_class.__name__: tower_type for tower_type, tower_class in TOWER_CLASSES.items()
+}
 
 class SaveManager:
     """Manages game saving and loading"""
@@ -25,6 +36,17 @@ class SaveManager:
         # Create save directory if it doesn't exist
         if not os.path.exists(self.save_directory):
             os.makedirs(self.save_directory)
+        
+        # Save files sorted by name (which starts with the date), scanned once
+        # here and kept up to date as saves are written and deleted
+        self.save_files = sorted(f for f in os.listdir(self.save_directory) if f.endswith(".save"))
+        
+        # Save files are written on a single background worker, in order
+        self.save_executor = ThreadPoolExecutor(max_workers=1)
+        self.last_save = None  # Future of the most recently queued save
+        self.pending_saves = []  # (filename, future) of saves still to be indexed
+        self.last_autosave = None  # Future of the most recent autosave
+        self.last_autosave_wave = None  # Wave that was last autosaved
     
     def save_game(self, filename=None):
         """
@@ -34,7 +56,8 @@ class SaveManager:
             filename: Optional filename, auto-generated if None
             
         Returns:
-            Filename of saved game
+            Filename the game is being saved to; it is added to the save
+            index once the file has been written
         """
         # Generate filename if not provided
         if filename is None:
@@ -43,10 +66,11 @@ class SaveManager:
             wave_str = str(self.game.wave_manager.current_wave).zfill(3)
             filename = f"{date_str}-Wave{wave_str}.save"
         
-        # Create serializable game state
+        # Create serializable game state; it is written on another thread, so
+        # it must not share mutable containers with the running game
         game_state = {
             "wave": self.game.wave_manager.current_wave,
-            "resources": self.game.resource_manager.resources,
+            "resources": dict(self.game.resource_manager.resources),
             "castle": {
                 "health": self.game.castle.health,
                 "max_health": self.game.castle.max_health,
@@ -58,16 +82,80 @@ class SaveManager:
             "towers": [self.serialize_tower(t) for t in self.game.towers]
         }
         
-        # Save to file
+        # Write the file in the background so the frame doesn't wait on the disk
         filepath = os.path.join(self.save_directory, filename)
-        with open(filepath, "wb") as f:
-            pickle.dump(game_state, f)
+        self.last_save = self.save_executor.submit(self.write_save_file, filepath, game_state)
+        if filename.endswith(".save"):
+            self.pending_saves.append((filename, self.last_save))
         
-        # Clean up old saves
-        self.clean_old_saves()
+        # Index the saves that have finished by now and clean up old saves
+        self.index_finished_saves()
         
         return filename
     
+    def write_save_file(self, filepath, game_state):
+        """
+        Write a game state to disk (runs on the save worker thread)
+        
+        Args:
+            filepath: Path of the save file
+            game_state: Dictionary of plain game data
+            
+        Returns:
+            True if the save file was written, False otherwise
+        """
+        # The state is plain data, so JSON is enough and safe to load. Write
+        # to a temporary file first so a crash never leaves a corrupt save
+        temp_filepath = filepath + ".tmp"
+        try:
+            with open(temp_filepath, "w", encoding="utf-8") as f:
+                json.dump(game_state, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_filepath, filepath)
+            return True
+        except Exception as e:
+            # Nothing on the main thread would see the error, so report it
+            # here and don't leave a partial file behind
+            print(f"Error saving game: {e}")
+            try:
+                os.remove(temp_filepath)
+            except OSError:
+                pass
+            return False
+    
+    def index_finished_saves(self):
+        """Add saves that were written successfully to the save index, then clean up old saves"""
+        still_pending = []
+        for filename, future in self.pending_saves:
+            if not future.done():
+                still_pending.append((filename, future))
+            elif future.result() and filename not in self.save_files:
+                insort(self.save_files, filename)
+        self.pending_saves = still_pending
+        self.clean_old_saves()
+    
+    def wait_for_last_save(self):
+        """Block until the most recently queued save work has finished, logging any error"""
+        if self.last_save is not None:
+            try:
+                self.last_save.result()
+            except Exception as e:
+                print(f"Error writing save: {e}")
+    
+    def wait_for_saves(self):
+        """Block until every queued save has been written to disk (or has failed)"""
+        # Saves run in order on one worker, so the last one finishes after the rest
+        self.wait_for_last_save()
+        self.index_finished_saves()
+        # Indexing may have queued removals of old saves behind the writes
+        self.wait_for_last_save()
+    
+    def shutdown(self):
+        """Finish any queued save work and stop the save worker"""
+        self.wait_for_saves()
+        self.save_executor.shutdown(wait=True)
+    
     def load_game(self, filename):
         """
         Load a saved game
@@ -78,6 +166,9 @@ class SaveManager:
         Returns:
             True if load successful, False otherwise
         """
+        # The file may still be queued for writing
+        self.wait_for_saves()
+        
         filepath = os.path.join(self.save_directory, filename)
         if not os.path.exists(filepath):
             return False
@@ -85,16 +176,24 @@ class SaveManager:
         try:
             # Load game state
             with open(filepath, "rb") as f:
-                game_state = pickle.load(f)
+                data = f.read()
+            
+            if data.startswith(PICKLE_HEADER):
+                # Saves from older versions were pickled
+                game_state = pickle.loads(data)
+            else:
+                game_state = json.loads(data)
             
             # Restore wave
             self.game.wave_manager.current_wave = game_state["wave"]
+            self.last_autosave_wave = None
             self.game.wave_manager.active_monsters = []
             self.game.wave_manager.wave_active = False
             self.game.wave_manager.wave_completed = True
             
             # Restore resources
             self.game.resource_manager.resources = game_state["resources"]
+            self.game.resource_manager.epoch += 1
             
             # Restore castle
             castle_state = game_state["castle"]
@@ -112,7 +211,7 @@ class SaveManager:
             
             return True
         
-        except (pickle.PickleError, KeyError, AttributeError) as e:
+        except (pickle.PickleError, ValueError, KeyError, AttributeError) as e:
             print(f"Error loading save: {e}")
             return False
     
@@ -120,17 +219,50 @@ class SaveManager:
         """Check if we should autosave the game"""
         current_wave = self.game.wave_manager.current_wave
         if current_wave > 0 and current_wave % self.autosave_waves == 0 and self.game.wave_manager.wave_completed:
+            # Save each autosave wave once, and never queue behind an unfinished autosave
+            if current_wave == self.last_autosave_wave:
+                return
+            if self.last_autosave is not None and not self.last_autosave.done():
+                return
             self.save_game()
+            self.last_autosave = self.last_save
+            self.last_autosave_wave = current_wave
     
     def clean_old_saves(self):
         """Remove oldest save files if we have too many"""
-        save_files = [f for f in os.listdir(self.save_directory) if f.endswith(".save")]
-        save_files.sort()  # Sort by name, which includes date
+        while len(self.save_files) > self.max_saves:
+            oldest = self.save_files.pop(0)
+            # Queue behind any pending writes rather than touching the disk here
+            self.last_save = self.save_executor.submit(self.remove_save_file, oldest)
+    
+    def remove_save_file(self, filename):
+        """
+        Remove an old save file (runs on the save worker thread)
+        
+        Args:
+            filename: Save file to remove
+        """
+        try:
+            os.remove(os.path.join(self.save_directory, filename))
+        except FileNotFoundError:
+            pass  # Already removed outside the game
+        except Exception as e:
+            print(f"Error removing old save: {e}")
+    
+    def delete_save(self, filename):
+        """
+        Delete a save file
         
-        # Remove oldest files if we have too many
-        if len(save_files) > self.max_saves:
-            for i in range(0, len(save_files) - self.max_saves):
-                os.remove(os.path.join(self.save_directory, save_files[i]))
+        Args:
+            filename: Save file to delete
+            
+        Raises:
+            FileNotFoundError, PermissionError: If the file can't be removed
+        """
+        self.wait_for_saves()
+        os.remove(os.path.join(self.save_directory, filename))
+        if filename in self.save_files:
+            self.save_files.remove(filename)
     
     def serialize_building(self, building):
         """
@@ -181,7 +313,7 @@ class SaveManager:
             Building instance
         """
         building_type = building_data["type"]
-        position = building_data["position"]
+        position = tuple(building_data["position"])  # JSON stores tuples as lists
         
         try:
             building = BuildingFactory.create_building(building_type, position)
@@ -228,7 +360,7 @@ class SaveManager:
             "damage": tower.damage,
             "attack_speed": tower.attack_speed,
             "range": tower.range,
-            "item_slots": tower.item_slots
+            "item_slots": list(tower.item_slots)
         }
         
         # Add tower-specific data
@@ -252,17 +384,21 @@ class SaveManager:
             Tower instance
         """
         tower_type = tower_data["type"]
-        position = tower_data["position"]
+        position = tuple(tower_data["position"])  # JSON stores tuples as lists
         
         try:
-            tower = TowerFactory.create_tower(tower_type, position)
+            tower = TowerFactory.create_tower(
+                TOWER_TYPES_BY_CLASS_NAME.get(tower_type, tower_type), position
+            )
             
             # Set common properties
             tower.level = tower_data["level"]
             tower.damage = tower_data["damage"]
             tower.attack_speed = tower_data["attack_speed"]
+            tower.attack_cooldown = 1.0 / tower.attack_speed
             tower.range = tower_data["range"]
             tower.item_slots = tower_data["item_slots"]
+            tower.has_item_effects = any(tower.item_slots)
             
             # Set tower-specific properties
             if tower_type == "SplashTower" and hasattr(tower, 'aoe_radius'):
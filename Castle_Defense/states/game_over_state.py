@@ -5,11 +5,21 @@ Game over state for Castle Defense
 import pygame
 import math
 from .game_state import GameState
+from utils import get_font, render_text
+
+# One period of the title pulse, (sin(ticks * 0.003) + 1) * 0.2 + 0.8, sampled
+# so the draw loop can look it up instead of calling sin every frame
+PULSE_STEPS = 256
+PULSE_STEPS_PER_MS = 0.003 * PULSE_STEPS / (2 * math.pi)
+PULSE_TABLE = [(math.sin(i * 2 * math.pi / PULSE_STEPS) + 1) * 0.2 + 0.8 for i in range(PULSE_STEPS)]
 
 class GameOverState(GameState):
     """
     Game over state - displayed when the player loses, but allows continuing
     """
+    __slots__ = ("playing_state", "time_in_state", "auto_continue_time", "setback_wave",
+                 "current_wave", "frozen_background")
+    
     def __init__(self, game):
         """
         Initialize game over state
@@ -18,15 +28,18 @@ class GameOverState(GameState):
             game: Game instance
         """
         super().__init__(game)
+        self.playing_state = game.state_manager.get_state("playing")  # Drawn underneath this state
         self.time_in_state = 0
         self.auto_continue_time = 15.0  # Auto-continue after 15 seconds
         self.setback_wave = 1  # Default setback
         self.current_wave = 0  # Will be set when entering the state
+        self.frozen_background = None  # Dimmed snapshot of the game, taken on first draw
     
     def enter(self):
         """Called when entering game over state"""
         self.time_in_state = 0
         self.current_wave = self.game.wave_manager.current_wave
+        self.frozen_background = None
         
         # Calculate setback wave based on current progress
         if self.current_wave >= 11:
@@ -36,6 +49,11 @@ class GameOverState(GameState):
             # Otherwise, reset to wave 1
             self.setback_wave = 1
     
+    def exit(self):
+        """Called when leaving game over state"""
+        # Release the full-screen snapshot until the next visit
+        self.frozen_background = None
+    
     def handle_events(self, events):
         """
         Handle events during game over state
@@ -96,57 +114,58 @@ class GameOverState(GameState):
         Args:
             screen: Pygame surface to draw on
         """
-        # First draw the base game (frozen)
-        self.game.states["playing"].draw(screen)
-        
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.game.WINDOW_WIDTH, self.game.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Black with 70% opacity
-        screen.blit(overlay, (0, 0))
+        # The game is frozen behind the overlay, so draw it and the overlay
+        # once per visit and reuse the snapshot
+        if self.frozen_background is None:
+            self.playing_state.draw(screen)
+            
+            # Create semi-transparent overlay
+            overlay = pygame.Surface((self.game.WINDOW_WIDTH, self.game.WINDOW_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))  # Black with 70% opacity
+            screen.blit(overlay, (0, 0))
+            
+            self.frozen_background = screen.copy()
+        else:
+            screen.blit(self.frozen_background, (0, 0))
         
-        # Draw castle destroyed text with pulsing effect
-        pulse = (math.sin(pygame.time.get_ticks() * 0.003) + 1) * 0.2 + 0.8
+        # Draw castle destroyed text with pulsing effect (one cached label per size)
+        pulse = PULSE_TABLE[int(pygame.time.get_ticks() * PULSE_STEPS_PER_MS) % PULSE_STEPS]
         font_size = int(self.game.scale_value(60) * pulse)
-        font = pygame.font.Font(None, font_size)
-        text = font.render("Castle Destroyed!", True, (255, 80, 80))
+        text = render_text("Castle Destroyed!", font_size, (255, 80, 80))
         text_rect = text.get_rect(center=(self.game.WINDOW_WIDTH // 2, self.game.WINDOW_HEIGHT // 2 - 30))
         screen.blit(text, text_rect)
         
         # Draw rebuilding message
         small_font_size = self.game.scale_value(36)
-        font = pygame.font.Font(None, small_font_size)
-        rebuild_text = "Rebuilding..."
-        text = font.render(rebuild_text, True, (200, 200, 255))
+        text = render_text("Rebuilding...", small_font_size, (200, 200, 255))
         text_rect = text.get_rect(center=(self.game.WINDOW_WIDTH // 2, self.game.WINDOW_HEIGHT // 2 + 30))
         screen.blit(text, text_rect)
         
         # Draw wave setback info
         info_font_size = self.game.scale_value(28)
-        font = pygame.font.Font(None, info_font_size)
         if self.current_wave >= 11:
             setback_text = f"Setting back 10 waves (Wave {self.current_wave} → {self.setback_wave})"
         else:
             setback_text = f"Restarting from Wave {self.setback_wave}"
         
-        text = font.render(setback_text, True, (255, 255, 255))
+        text = render_text(setback_text, info_font_size)
         text_rect = text.get_rect(center=(self.game.WINDOW_WIDTH // 2, self.game.WINDOW_HEIGHT // 2 + 80))
         screen.blit(text, text_rect)
         
-        # Draw countdown
+        # Draw countdown (changes every frame, so render it directly instead of caching)
         remaining_time = max(0, self.auto_continue_time - self.time_in_state)
         countdown_text = f"Continuing in {remaining_time:.1f} seconds..."
-        countdown_surface = font.render(countdown_text, True, (200, 200, 200))
+        countdown_surface = get_font(info_font_size).render(countdown_text, True, (200, 200, 200))
         countdown_rect = countdown_surface.get_rect(center=(self.game.WINDOW_WIDTH // 2, self.game.WINDOW_HEIGHT // 2 + 120))
         screen.blit(countdown_surface, countdown_rect)
         
         # Draw "Press any key to continue" message
         prompt_font_size = self.game.scale_value(24)
-        font = pygame.font.Font(None, prompt_font_size)
-        text = font.render("Press ENTER to continue immediately", True, (200, 200, 200))
+        text = render_text("Press ENTER to continue immediately", prompt_font_size, (200, 200, 200))
         text_rect = text.get_rect(center=(self.game.WINDOW_WIDTH // 2, self.game.WINDOW_HEIGHT // 2 + 170))
         screen.blit(text, text_rect)
         
         # Draw ESC to quit
-        text = font.render("Press ESC to quit", True, (200, 200, 200))
+        text = render_text("Press ESC to quit", prompt_font_size, (200, 200, 200))
         text_rect = text.get_rect(center=(self.game.WINDOW_WIDTH // 2, self.game.WINDOW_HEIGHT // 2 + 200))
         screen.blit(text, text_rect)
@@ -8,6 +8,9 @@ class GameState(ABC):
     """
     Abstract base class for all game states
     """
+    # States live for the whole session; each subclass lists its own slots
+    __slots__ = ("game",)
+    
     def __init__(self, game):
         """
         Initialize with reference to the game instance
@@ -75,19 +78,41 @@ class GameStateManager:
             game: Game instance
         """
         self.game = game
-        self.states = {}
+        self.state_factories = {}  # State id -> (class, args, kwargs)
+        self.states = {}  # States that have been created so far
         self.current_state = None
     
     def add_state(self, state_id, state_class, *args, **kwargs):
         """
-        Add a state to the manager
+        Add a state to the manager; it is only created when first needed
         
         Args:
             state_id: String identifier for the state
             state_class: GameState class
             *args, **kwargs: Arguments to pass to state constructor
         """
-        self.states[state_id] = state_class(self.game, *args, **kwargs)
+        self.state_factories[state_id] = (state_class, args, kwargs)
+        self.states.pop(state_id, None)
+    
+    def get_state(self, state_id):
+        """
+        Get a state, creating it on first use
+        
+        Args:
+            state_id: String identifier for the state
+            
+        Returns:
+            GameState instance, or None if no such state was added
+        """
+        state = self.states.get(state_id)
+        if state is None:
+            factory = self.state_factories.get(state_id)
+            if factory is None:
+                return None
+            state_class, args, kwargs = factory
+            state = state_class(self.game, *args, **kwargs)
+            self.states[state_id] = state
+        return state
     
     def change_state(self, state_id):
         """
@@ -99,15 +124,25 @@ class GameStateManager:
         Returns:
             Boolean indicating if state change was successful
         """
-        if state_id not in self.states:
+        state = self.get_state(state_id)
+        if state is None:
             return False
         
+        self.change_to(state)
+        return True
+    
+    def change_to(self, state):
+        """
+        Change to a state instance obtained from get_state
+        
+        Args:
+            state: GameState instance to enter
+        """
         if self.current_state:
             self.current_state.exit()
         
-        self.current_state = self.states[state_id]
-        self.current_state.enter()
-        return True
+        self.current_state = state
+        state.enter()
     
     def handle_events(self, events):
         """
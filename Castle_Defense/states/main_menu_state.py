@@ -10,6 +10,8 @@ class MainMenuState(GameState):
     """
     Main menu state - displays the game's main menu
     """
+    __slots__ = ("menu",)
+    
     def __init__(self, game):
         """
         Initialize main menu state
@@ -4,11 +4,16 @@ Paused state for Castle Defense
 """
 import pygame
 from .game_state import GameState
+from utils import render_text
 
 class PausedState(GameState):
     """
     Paused game state - game is frozen but user can resume
     """
+    __slots__ = ("playing_state", "menu_options", "selected_option", "overlay_alpha", "overlay",
+                 "frozen_background", "option_rects", "panel_rect", "border_width",
+                 "title_font_size", "title_top", "option_font_size", "indicator_inflate")
+    
     def __init__(self, game):
         """
         Initialize paused state
@@ -17,7 +22,10 @@ class PausedState(GameState):
             game: Game instance
         """
         super().__init__(game)
+        self.playing_state = game.state_manager.get_state("playing")  # Drawn underneath this state
         self.overlay_alpha = 180  # Semi-transparent overlay
+        self.overlay = None  # Created on first draw
+        self.frozen_background = None  # Dimmed snapshot of the game while paused
         self.menu_options = [
             {
                 "text": "Resume Game",
@@ -33,26 +41,37 @@ class PausedState(GameState):
             }
         ]
         self.selected_option = 0
+        
+        # The menu layout never changes, so compute the option rects and
+        # scaled panel measurements once
+        self.option_rects = [self.get_option_rect(i) for i in range(len(self.menu_options))]
+        panel_width = self.game.scale_value(300)
+        panel_height = self.game.scale_value(250)
+        self.panel_rect = pygame.Rect(
+            (self.game.WINDOW_WIDTH - panel_width) // 2,
+            (self.game.WINDOW_HEIGHT - panel_height) // 2,
+            panel_width,
+            panel_height
+        )
+        self.border_width = self.game.scale_value(2)
+        self.title_font_size = self.game.scale_value(36)
+        self.title_top = self.panel_rect.top + self.game.scale_value(20)
+        self.option_font_size = self.game.scale_value(24)
+        self.indicator_inflate = (self.game.scale_value(20), self.game.scale_value(10))
     
     def enter(self):
         """Called when entering paused state"""
         # Update the game UI play/pause button state
         self.game.game_ui.is_paused = True
         self.game.game_ui.play_pause_button.text = "▶"  # Play icon
-        
-        # Set paused flag in playing state
-        if hasattr(self.game.states["playing"], "paused"):
-            self.game.states["playing"].paused = True
+        self.frozen_background = None
     
     def exit(self):
         """Called when exiting paused state"""
         # Update the game UI play/pause button state
         self.game.game_ui.is_paused = False
         self.game.game_ui.play_pause_button.text = "||"  # Pause icon
-        
-        # Clear paused flag in playing state
-        if hasattr(self.game.states["playing"], "paused"):
-            self.game.states["playing"].paused = False
+        self.frozen_background = None  # Release the full-screen snapshot
     
     def handle_events(self, events):
         """
@@ -64,12 +83,18 @@ class PausedState(GameState):
         Returns:
             Boolean indicating if events were handled
         """
-        # First check if play/pause button was clicked
+        game_ui = self.game.game_ui
         for event in events:
-            if self.game.game_ui.handle_event(event):
+            # First check if the play/pause button or speed slider used the event
+            was_hovered = game_ui.play_pause_button.hovered
+            if game_ui.handle_event(event):
+                # The game UI (e.g. the speed indicator) may have changed
+                self.frozen_background = None
                 return True
-        
-        for event in events:
+            if game_ui.play_pause_button.hovered != was_hovered:
+                # The snapshot shows the old button highlight
+                self.frozen_background = None
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     # Resume game on Escape
@@ -97,8 +122,7 @@ class PausedState(GameState):
                 if event.button == 1:  # Left click
                     # Check if clicking on menu options
                     mouse_pos = pygame.mouse.get_pos()
-                    for i, option in enumerate(self.menu_options):
-                        option_rect = self.get_option_rect(i)
+                    for option, option_rect in zip(self.menu_options, self.option_rects):
                         if option_rect.collidepoint(mouse_pos) and option["action"]:
                             option["action"]()
                             return True
@@ -112,8 +136,9 @@ class PausedState(GameState):
         Args:
             dt: Time delta in seconds
         """
-        # Update game UI for button hovering
-        self.game.game_ui.update(dt)
+        # Nothing animates while paused; the button hover state follows mouse
+        # motion events in handle_events
+        pass
     
     def draw(self, screen):
         """
@@ -122,13 +147,21 @@ class PausedState(GameState):
         Args:
             screen: Pygame surface to draw on
         """
-        # First draw the base game (frozen)
-        self.game.states["playing"].draw(screen)
-        
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.game.WINDOW_WIDTH, self.game.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, self.overlay_alpha))
-        screen.blit(overlay, (0, 0))
+        # The game is frozen behind the overlay, so draw it and the overlay once
+        # and reuse the snapshot. While the developer menu is open it can change
+        # the game, so keep drawing it live then
+        if self.frozen_background is None or self.game.dev_menu.visible:
+            self.playing_state.draw(screen)
+            
+            # Draw semi-transparent overlay (the same every frame, so create it once)
+            if self.overlay is None:
+                self.overlay = pygame.Surface((self.game.WINDOW_WIDTH, self.game.WINDOW_HEIGHT), pygame.SRCALPHA).convert_alpha()
+                self.overlay.fill((0, 0, 0, self.overlay_alpha))
+            screen.blit(self.overlay, (0, 0))
+            
+            self.frozen_background = None if self.game.dev_menu.visible else screen.copy()
+        else:
+            screen.blit(self.frozen_background, (0, 0))
         
         # Draw the play/pause button
         self.game.game_ui.play_pause_button.draw(screen)
@@ -146,31 +179,18 @@ class PausedState(GameState):
         Args:
             screen: Pygame surface to draw on
         """
-        # Draw background panel
-        panel_width = self.game.scale_value(300)
-        panel_height = self.game.scale_value(250)
-        panel_rect = pygame.Rect(
-            (self.game.WINDOW_WIDTH - panel_width) // 2,
-            (self.game.WINDOW_HEIGHT - panel_height) // 2,
-            panel_width,
-            panel_height
-        )
-        
         # Draw panel with border
+        panel_rect = self.panel_rect
         pygame.draw.rect(screen, (40, 40, 60), panel_rect)
-        pygame.draw.rect(screen, (100, 100, 150), panel_rect, self.game.scale_value(2))
+        pygame.draw.rect(screen, (100, 100, 150), panel_rect, self.border_width)
         
-        # Draw "PAUSED" text
-        font_size = self.game.scale_value(36)
-        font = pygame.font.Font(None, font_size)
-        text = font.render("PAUSED", True, (255, 255, 255))
-        text_rect = text.get_rect(midtop=(panel_rect.centerx, panel_rect.top + self.game.scale_value(20)))
-        screen.blit(text, text_rect)
+        # Collect the "PAUSED" title and option labels to blit in one batch
+        text = render_text("PAUSED", self.title_font_size)  # Cached label surface
+        label_blits = [(text, text.get_rect(midtop=(panel_rect.centerx, self.title_top)))]
+        indicator_rect = None
         
         # Draw menu options
-        option_font_size = self.game.scale_value(24)
-        option_font = pygame.font.Font(None, option_font_size)
-        option_spacing = self.game.scale_value(40)
+        option_font_size = self.option_font_size
         
         for i, option in enumerate(self.menu_options):
             # Determine if this option is selected
@@ -179,18 +199,23 @@ class PausedState(GameState):
             # Set text color - brighter for selected option
             text_color = (255, 255, 100) if is_selected else (200, 200, 200)
             
-            # Create text surface
-            text = option_font.render(option["text"], True, text_color)
+            # Get the cached text surface for this option and color
+            text = render_text(option["text"], option_font_size, text_color)
             
-            # Position and draw text
-            y_pos = panel_rect.top + self.game.scale_value(80) + i * option_spacing
+            # Position text
+            y_pos = self.option_rects[i].centery
             text_rect = text.get_rect(center=(panel_rect.centerx, y_pos))
-            screen.blit(text, text_rect)
+            label_blits.append((text, text_rect))
             
-            # Draw selection indicator if this option is selected
+            # Remember where the selection indicator goes
             if is_selected:
-                indicator_rect = text_rect.inflate(self.game.scale_value(20), self.game.scale_value(10))
-                pygame.draw.rect(screen, (100, 100, 180), indicator_rect, self.game.scale_value(2))
+                indicator_rect = text_rect.inflate(self.indicator_inflate)
+        
+        screen.blits(label_blits, doreturn=False)
+        
+        # Draw selection indicator around the selected option
+        if indicator_rect:
+            pygame.draw.rect(screen, (100, 100, 180), indicator_rect, self.border_width)
     
     def get_option_rect(self, index):
         """
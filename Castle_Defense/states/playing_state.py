@@ -6,11 +6,16 @@ import pygame
 from .game_state import GameState
 # Import the building classes directly
 from features.buildings import Mine, Coresmith, CastleUpgradeStation
+from features.towers import Tower
+from utils import render_text
 
 class PlayingState(GameState):
     """
     Main gameplay state where the player defends the castle
     """
+    __slots__ = ("castle", "wave_manager", "resource_manager", "animation_manager",
+                 "buildings", "towers", "background", "background_level")
+    
     def __init__(self, game):
         """
         Initialize playing state
@@ -27,8 +32,9 @@ class PlayingState(GameState):
         self.buildings = self.game.buildings
         self.towers = self.game.towers
         
-        # Track if game is paused
-        self.paused = False
+        # Background color and castle walls, rendered once per castle level
+        self.background = None
+        self.background_level = None
     
     def handle_events(self, events):
         """
@@ -40,12 +46,12 @@ class PlayingState(GameState):
         Returns:
             Boolean indicating if events were handled
         """
-        # First let the game UI handle events
+        game_ui = self.game.game_ui
         for event in events:
-            if self.game.game_ui.handle_event(event):
+            # Let the game UI handle each event first
+            if game_ui.handle_event(event):
                 return True
-        
-        for event in events:
+            
             # Space to start next wave
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
@@ -91,22 +97,18 @@ class PlayingState(GameState):
                         break
                 
                 if not building_clicked:
-                    # Check if clicking on a tower
-                    tower_clicked = False
-                    for tower in self.towers:
-                        if tower.rect.collidepoint(mouse_pos):
-                            # Deselect previous entity
-                            if self.game.selected_entity and hasattr(self.game.selected_entity, 'selected'):
-                                self.game.selected_entity.selected = False
-                            
-                            self.game.selected_entity = tower
-                            tower.selected = True  # Set selected flag for range display
-                            self.game.tower_menu.set_tower(tower, self.resource_manager)
-                            self.game.tower_menu.toggle()
-                            tower_clicked = True
-                            break
-                    
-                    if not tower_clicked:
+                    # Check if clicking on a tower, looking only in the clicked grid cell
+                    tower = self.game.get_tower_at(mouse_pos)
+                    if tower is not None:
+                        # Deselect previous entity
+                        if self.game.selected_entity and hasattr(self.game.selected_entity, 'selected'):
+                            self.game.selected_entity.selected = False
+                        
+                        self.game.selected_entity = tower
+                        tower.selected = True  # Set selected flag for range display
+                        self.game.tower_menu.set_tower(tower, self.resource_manager)
+                        self.game.tower_menu.toggle()
+                    else:
                         # Check for deselection
                         if self.game.selected_entity and hasattr(self.game.selected_entity, 'selected'):
                             self.game.selected_entity.selected = False
@@ -126,9 +128,6 @@ class PlayingState(GameState):
         Args:
             dt: Time delta in seconds
         """
-        # Update game UI
-        self.game.game_ui.update(dt)
-        
         # Update animation manager
         self.animation_manager.update(dt)
         
@@ -139,16 +138,28 @@ class PlayingState(GameState):
         raw_dt = dt / self.game.time_scale if self.game.time_scale > 0 else dt
         
         # Update buildings - use raw_dt for consistent production regardless of game speed
-        # Also pass the pause state
+        resource_manager = self.resource_manager
         for building in self.buildings:
-            building.update(dt, self.resource_manager, raw_dt, self.paused)
+            building.update(dt, resource_manager, raw_dt)
         
         # Update wave manager and monsters
         self.wave_manager.update(dt, self.castle, self.animation_manager)
         
-        # Update towers
+        # Update towers, sharing one item glow pulse per frame. Towers still on
+        # cooldown don't target, so only ready towers check the monsters in
+        # nearby grid cells, and the grid is only built when one needs it
+        glow_intensity = Tower.get_glow_intensity()
+        monster_grid_built = False
         for tower in self.towers:
-            tower.update(dt, self.wave_manager.active_monsters, self.animation_manager)
+            if tower.is_ready_to_attack(dt):
+                if not monster_grid_built:
+                    self.wave_manager.build_monster_grid()
+                    monster_grid_built = True
+                nearby_monsters = self.wave_manager.get_monsters_near(
+                    tower.position, tower.range, tower.can_target_flying)
+            else:
+                nearby_monsters = ()
+            tower.update(dt, nearby_monsters, self.animation_manager, glow_intensity)
         
         # Check for auto-save
         self.game.save_manager.check_autosave()
@@ -169,19 +180,21 @@ class PlayingState(GameState):
         Args:
             screen: Pygame surface to draw on
         """
-        # Clear screen with background color
-        screen.fill(self.game.BACKGROUND_COLOR)
-        
-        # Draw castle first (as the base area)
-        self.castle.draw(screen)
+        # Clear screen with the background and castle (as the base area), which
+        # only change when the castle levels up
+        if self.background is None or self.background_level != self.castle.level:
+            self.background = pygame.Surface(screen.get_size()).convert(screen)
+            self.background.fill(self.game.BACKGROUND_COLOR)
+            self.castle.draw(self.background)
+            self.background_level = self.castle.level
+        screen.blit(self.background, (0, 0))
         
         # Draw buildings
         for building in self.buildings:
             building.draw(screen)
         
-        # Draw towers
-        for tower in self.towers:
-            tower.draw(screen)
+        # Draw towers, with all of their labels blitted in one batch
+        Tower.draw_towers(screen, self.towers)
         
         # Draw monsters
         self.wave_manager.draw(screen)
@@ -202,9 +215,8 @@ class PlayingState(GameState):
         
         # Draw game speed indicator if not at normal speed
         if self.game.time_scale != 1.0:
-            font = pygame.font.Font(None, self.game.scale_value(24))
             speed_text = f"Game Speed: {self.game.time_scale:.1f}x"
             speed_color = (255, 200, 100) if self.game.time_scale > 1.0 else (100, 200, 255)
-            speed_surface = font.render(speed_text, True, speed_color)
+            speed_surface = render_text(speed_text, self.game.scale_value(24), speed_color)
             speed_rect = speed_surface.get_rect(topright=(self.game.WINDOW_WIDTH - 20, 20))
             screen.blit(speed_surface, speed_rect)
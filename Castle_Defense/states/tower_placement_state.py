@@ -12,6 +12,9 @@ class TowerPlacementState(GameState):
     """
     State for placing towers on the game map
     """
+    __slots__ = ("playing_state", "tower_type", "tower_preview", "valid_preview_surface",
+                 "invalid_preview_surface", "tower_cost", "monster_coin_cost")
+    
     def __init__(self, game):
         """
         Initialize tower placement state
@@ -20,8 +23,13 @@ class TowerPlacementState(GameState):
             game: Game instance
         """
         super().__init__(game)
+        self.playing_state = game.state_manager.get_state("playing")  # Drawn underneath this state
         self.tower_type = None
         self.tower_preview = None
+        self.valid_preview_surface = None
+        self.invalid_preview_surface = None
+        self.tower_cost = {}
+        self.monster_coin_cost = 0
     
     def enter(self):
         """
@@ -30,6 +38,10 @@ class TowerPlacementState(GameState):
         # This will be set by the method that triggers state change
         self.tower_type = None
         self.tower_preview = None
+        self.valid_preview_surface = None
+        self.invalid_preview_surface = None
+        self.tower_cost = {}
+        self.monster_coin_cost = 0
     
     def exit(self):
         """
@@ -37,6 +49,10 @@ class TowerPlacementState(GameState):
         """
         self.tower_type = None
         self.tower_preview = None
+        self.valid_preview_surface = None
+        self.invalid_preview_surface = None
+        self.tower_cost = {}
+        self.monster_coin_cost = 0
     
     def set_tower_type(self, tower_type):
         """
@@ -47,12 +63,26 @@ class TowerPlacementState(GameState):
         """
         self.tower_type = tower_type
         
+        # Look up the tower costs once for this placement
+        self.tower_cost = self.game.TOWER_TYPES.get(tower_type, {}).get("cost", {})
+        self.monster_coin_cost = TOWER_MONSTER_COIN_COSTS.get(tower_type, 0)
+        
         # Create appropriate tower preview using the factory
         if tower_type:
             try:
                 self.tower_preview = TowerFactory.create_tower(tower_type, (0, 0))
             except ValueError:
                 self.tower_preview = None
+        
+        # Build the transparent preview surfaces once per tower type
+        if self.tower_preview:
+            size = self.tower_preview.rect.size
+            # Valid position - use tower color with 50% transparency
+            self.valid_preview_surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self.valid_preview_surface.fill((*self.tower_preview.color, 128))
+            # Invalid position - use red with 50% transparency
+            self.invalid_preview_surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self.invalid_preview_surface.fill((255, 0, 0, 128))
     
     def handle_events(self, events):
         """
@@ -64,16 +94,11 @@ class TowerPlacementState(GameState):
         Returns:
             Boolean indicating if events were handled
         """
-        mouse_pos = pygame.mouse.get_pos()
-        if self.tower_preview:
-            self.tower_preview.position = mouse_pos
-            self.tower_preview.rect.center = mouse_pos
-        
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    # Attempt to place tower
-                    if self.place_tower(mouse_pos):
+                    # Attempt to place tower where the click happened
+                    if self.place_tower(event.pos):
                         self.game.state_manager.change_state("playing")
                         return True
                 elif event.button == 3:  # Right click
@@ -96,8 +121,12 @@ class TowerPlacementState(GameState):
         Args:
             dt: Time delta in seconds
         """
-        # Most of the logic is in handle_events and draw
-        pass
+        # Keep the preview under the cursor; the rest of the logic is in
+        # handle_events and draw
+        if self.tower_preview:
+            mouse_pos = pygame.mouse.get_pos()
+            self.tower_preview.position = mouse_pos
+            self.tower_preview.rect.center = mouse_pos
     
     def draw(self, screen):
         """
@@ -107,41 +136,25 @@ class TowerPlacementState(GameState):
             screen: Pygame surface to draw on
         """
         # First draw the base game
-        self.game.states["playing"].draw(screen)
+        self.playing_state.draw(screen)
         
-        # Then draw the tower preview
+        # Then draw the tower preview, which update() keeps under the cursor
         if self.tower_preview:
-            mouse_pos = pygame.mouse.get_pos()
-            self.tower_preview.position = mouse_pos
-            self.tower_preview.rect.center = mouse_pos
+            mouse_pos = self.tower_preview.position
             
             # Draw with transparency based on valid position and resources
             is_valid = self.is_valid_tower_position(mouse_pos)
             
-            # Get tower costs
-            tower_cost = self.game.TOWER_TYPES.get(self.tower_type, {}).get("cost", {})
-            monster_coin_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 0)
-            
             # Check if we have all required resources
             has_resources = self.game.resource_manager.has_resources_for_tower(
-                tower_cost, monster_coin_cost
+                self.tower_cost, self.monster_coin_cost
             )
             
-            # Create transparent surface
-            alpha_surface = pygame.Surface(self.tower_preview.rect.size, pygame.SRCALPHA)
-            
+            # Blit the matching transparent preview surface to the screen
             if is_valid and has_resources:
-                # Valid position - use tower color with transparency
-                color = list(self.tower_preview.color) + [128]  # 50% transparency
+                alpha_surface = self.valid_preview_surface
             else:
-                # Invalid position - use red with transparency
-                color = [255, 0, 0, 128]  # Red with 50% transparency
-            
-            # Draw the tower preview on the transparent surface
-            pygame.draw.rect(alpha_surface, color, 
-                            (0, 0, self.tower_preview.rect.width, self.tower_preview.rect.height))
-            
-            # Blit the transparent surface to the screen
+                alpha_surface = self.invalid_preview_surface
             screen.blit(alpha_surface, self.tower_preview.rect.topleft)
             
             # Draw range indicator using scaled range
@@ -188,12 +201,8 @@ class TowerPlacementState(GameState):
         if not self.is_valid_tower_position(position):
             return False
         
-        # Get tower costs
-        tower_cost = self.game.TOWER_TYPES.get(self.tower_type, {}).get("cost", {})
-        monster_coin_cost = TOWER_MONSTER_COIN_COSTS.get(self.tower_type, 0)
-        
         # Check if player has enough resources and spend them
-        if not self.game.resource_manager.spend_resources_for_tower(tower_cost, monster_coin_cost):
+        if not self.game.resource_manager.spend_resources_for_tower(self.tower_cost, self.monster_coin_cost):
             return False
         
         # Create and place the tower using the factory
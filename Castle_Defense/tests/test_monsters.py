@@ -69,6 +69,36 @@ class MonsterSystemTests(unittest.TestCase):
         self.assertFalse(wave_manager.wave_active)
         self.assertTrue(wave_manager.wave_completed)
     
+    def test_wave_manager_monster_weights_cached(self):
+        """Test monster type weights are built once per wave"""
+        wave_manager = WaveManager()
+        wave_manager.current_wave = 4
+        
+        monster_type = wave_manager.get_random_monster_type()
+        self.assertIn(monster_type, ["Grunt", "Runner"])
+        self.assertIn(4, wave_manager.monster_weight_cache)
+        monster_types, cumulative_weights = wave_manager.monster_weight_cache[4]
+        self.assertEqual(set(monster_types), {"Grunt", "Runner"})
+        self.assertEqual(len(cumulative_weights), len(monster_types))
+    
+    def test_wave_manager_monsters_near(self):
+        """Test grid lookup only returns monsters in cells around a position"""
+        wave_manager = WaveManager()
+        near = Monster((100, 100), self.target_pos, "Test", self.test_stats)
+        far = Monster((700, 500), self.target_pos, "Test", self.test_stats)
+        flyer = Monster((110, 100), self.target_pos, "Test", dict(self.test_stats, flying=True))
+        wave_manager.active_monsters = [near, far, flyer]
+        wave_manager.build_monster_grid()
+        
+        nearby = wave_manager.get_monsters_near((120, 110), 50)
+        self.assertIn(near, nearby)
+        self.assertIn(flyer, nearby)
+        self.assertNotIn(far, nearby)
+        
+        ground_only = wave_manager.get_monsters_near((120, 110), 50, include_flying=False)
+        self.assertIn(near, ground_only)
+        self.assertNotIn(flyer, ground_only)
+    
     def test_monster_take_damage(self):
         """Test monster taking damage"""
         monster = Monster(self.start_pos, self.target_pos, "Test", self.test_stats)
@@ -0,0 +1,123 @@
+# tests/test_save_system.py
+"""
+Tests for saving and loading games
+"""
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+import pygame
+from save_system import SaveManager
+from features.castle import Castle
+from features.resources import ResourceManager
+from features.monsters import WaveManager
+from features.building_factory import BuildingFactory
+from features.towers.factory import TowerFactory
+
+class SaveSystemTests(unittest.TestCase):
+    """Test cases for the save system"""
+
+    def setUp(self):
+        """Set up a game to save in a temporary directory"""
+        pygame.init()
+
+        # SaveManager keeps its saves relative to the working directory
+        self.original_directory = os.getcwd()
+        self.save_root = tempfile.mkdtemp()
+        os.chdir(self.save_root)
+
+        self.game = SimpleNamespace(
+            wave_manager=WaveManager(),
+            resource_manager=ResourceManager(),
+            castle=Castle(),
+            buildings=[BuildingFactory.create_building("Mine", (100, 100))],
+            towers=[
+                TowerFactory.create_tower("Splash", (200, 200)),
+                TowerFactory.create_tower("Frozen", (300, 200))
+            ]
+        )
+        self.save_manager = SaveManager(self.game)
+
+    def tearDown(self):
+        """Stop the save worker and remove the temporary saves"""
+        self.save_manager.shutdown()
+        os.chdir(self.original_directory)
+        shutil.rmtree(self.save_root)
+
+    def test_save_and_load_json(self):
+        """Test that a saved game loads back with the same state"""
+        game = self.game
+        game.wave_manager.current_wave = 7
+        game.resource_manager.resources["Stone"] = 123
+        game.castle.health = 456
+        game.towers[0].aoe_radius = 99
+        game.towers[1].add_item("Serene Spirit", 1)
+
+        filename = self.save_manager.save_game("test.save")
+        self.save_manager.wait_for_saves()
+        self.assertIn(filename, self.save_manager.save_files)
+
+        # Change the game, then load the save over it
+        game.wave_manager.current_wave = 1
+        game.resource_manager.resources["Stone"] = 0
+        game.castle.health = 1
+        game.towers = []
+
+        self.assertTrue(self.save_manager.load_game(filename))
+        self.assertEqual(game.wave_manager.current_wave, 7)
+        self.assertEqual(game.resource_manager.resources["Stone"], 123)
+        self.assertEqual(game.castle.health, 456)
+        self.assertEqual([type(t).__name__ for t in game.towers], ["SplashTower", "FrozenTower"])
+        self.assertEqual(game.towers[0].aoe_radius, 99)
+        self.assertEqual(game.towers[1].position, (300, 200))
+        self.assertEqual(game.towers[1].item_slots, [None, "Serene Spirit"])
+        self.assertEqual(type(game.buildings[0]).__name__, "Mine")
+
+    def test_load_legacy_pickle(self):
+        """Test that saves pickled by older versions still load"""
+        game_state = {
+            "wave": 3,
+            "resources": {"Stone": 50},
+            "castle": {
+                "health": 800,
+                "max_health": 1000,
+                "damage_reduction": 0.1,
+                "health_regen": 2,
+                "level": 2
+            },
+            "buildings": [],
+            "towers": [{
+                "type": "ArcherTower",
+                "position": (150, 150),
+                "level": 2,
+                "damage": 15,
+                "attack_speed": 2.0,
+                "range": 200,
+                "item_slots": [None, None]
+            }]
+        }
+        with open(os.path.join(self.save_manager.save_directory, "legacy.save"), "wb") as f:
+            pickle.dump(game_state, f, protocol=2)
+
+        self.assertTrue(self.save_manager.load_game("legacy.save"))
+        self.assertEqual(self.game.wave_manager.current_wave, 3)
+        self.assertEqual(self.game.castle.level, 2)
+        self.assertEqual(len(self.game.towers), 1)
+        self.assertEqual(self.game.towers[0].damage, 15)
+        self.assertEqual(self.game.towers[0].attack_cooldown, 0.5)
+
+    def test_failed_save_is_not_indexed(self):
+        """Test that a save that can't be written is cleaned up and not listed"""
+        # A set can't be written as JSON
+        self.game.resource_manager.resources["Stone"] = {1}
+
+        filename = self.save_manager.save_game("broken.save")
+        self.save_manager.wait_for_saves()
+
+        self.assertNotIn(filename, self.save_manager.save_files)
+        self.assertEqual(os.listdir(self.save_manager.save_directory), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,22 @@ Base menu class for Castle Defense
 """
 import pygame
 from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from utils import get_font
+
+FONT_SIZE = 24  # Menu title font size
+SMALL_FONT_SIZE = 18  # Menu label font size
+
+# Label colors shared by the menus
+LABEL_COLOR = (255, 255, 255)
+PROGRESS_COLOR = (100, 200, 255)  # Upgrade and crafting timers
+AFFORDABLE_COLOR = (100, 255, 100)
+UNAFFORDABLE_COLOR = (255, 100, 100)
 
 class Menu:
     """Base class for all menus"""
+    __slots__ = ("screen", "active", "position", "size", "rect", "buttons", "font", "small_font",
+                 "title", "title_surface", "title_surface_text", "label_blits", "label_key")
+    
     def __init__(self, screen):
         """
         Initialize menu
@@ -20,9 +33,13 @@ class Menu:
         self.size = (200, 300)
         self.rect = pygame.Rect(self.position, self.size)
         self.buttons = []
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(FONT_SIZE)
+        self.small_font = get_font(SMALL_FONT_SIZE)
         self.title = "Menu"
+        self.title_surface = None  # Rendered title, rebuilt when the title changes
+        self.title_surface_text = None
+        self.label_blits = []  # Subclass labels, rebuilt when label_key changes
+        self.label_key = None
     
     def toggle(self):
         """Toggle menu visibility"""
@@ -47,9 +64,8 @@ class Menu:
                 self.active = False
                 return True
             
-            # Check button clicks
+            # Check button clicks (hover states are kept current by MOUSEMOTION)
             for button in self.buttons:
-                button.update(event.pos)
                 if button.rect.collidepoint(event.pos):
                     button.click()
                     return True
@@ -70,10 +86,12 @@ class Menu:
         pygame.draw.rect(self.screen, (50, 50, 50), self.rect)
         pygame.draw.rect(self.screen, (200, 200, 200), self.rect, 2)
         
-        # Draw title
-        title_surface = self.font.render(self.title, True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.rect.centerx, self.rect.top + 20))
-        self.screen.blit(title_surface, title_rect)
+        # Draw title, only rendering it again after it has changed
+        if self.title_surface_text != self.title:
+            self.title_surface = self.font.render(self.title, True, LABEL_COLOR)
+            self.title_surface_text = self.title
+        title_rect = self.title_surface.get_rect(center=(self.rect.centerx, self.rect.top + 20))
+        self.screen.blit(self.title_surface, title_rect)
         
         # Draw buttons
         for button in self.buttons:
@@ -3,13 +3,21 @@
 Building menu implementation for Castle Defense
 """
 import pygame
-from .base_menu import Menu
+from functools import partial
+from .base_menu import (
+    Menu, SMALL_FONT_SIZE, LABEL_COLOR, PROGRESS_COLOR, AFFORDABLE_COLOR, UNAFFORDABLE_COLOR
+)
 from .elements import Button
 from features.buildings import Mine, Coresmith
 from config import ITEM_COSTS
+from utils import render_text, format_cost
+
+ITEM_COST_COLOR = (200, 200, 200)  # Affordable coresmith item costs
 
 class BuildingMenu(Menu):
     """Menu for interacting with buildings"""
+    __slots__ = ("building", "building_type", "resource_manager", "item_costs")
+    
     def __init__(self, screen):
         """
         Initialize building menu
@@ -21,6 +29,7 @@ class BuildingMenu(Menu):
         self.building = None
         self.building_type = None
         self.resource_manager = None
+        self.item_costs = []  # (item name, cost) pairs, one per crafting button
     
     def set_building(self, building, building_type, resource_manager):
         """
@@ -35,6 +44,7 @@ class BuildingMenu(Menu):
         self.building_type = building_type
         self.resource_manager = resource_manager
         self.title = f"{building_type.capitalize()} Menu"
+        self.label_key = None
         
         # Clear existing buttons
         self.buttons = []
@@ -59,16 +69,16 @@ class BuildingMenu(Menu):
             
         elif building_type == "coresmith":
             # Item crafting buttons
-            for i, item_name in enumerate(ITEM_COSTS.keys()):
+            self.item_costs = list(ITEM_COSTS.items())
+            for i, (item_name, costs) in enumerate(self.item_costs):
                 # Check if player has resources for this item
-                has_resources = self.resource_manager.has_resources(ITEM_COSTS[item_name])
-                is_crafting = self.building.crafting and self.building.current_item == item_name
+                has_resources = self.resource_manager.has_resources(costs)
                 
                 craft_button = Button(
                     (self.rect.left + 20, y_pos + i*40),
                     (self.rect.width - 40, 30),
                     f"Craft {item_name}",
-                    lambda item=item_name: self.craft_item(item)
+                    partial(self.craft_item, item_name)
                 )
                 
                 # Disable button if already crafting or not enough resources
@@ -108,22 +118,51 @@ class BuildingMenu(Menu):
             
         elif self.building_type == "coresmith":
             # Update coresmith crafting buttons
-            for i, item_name in enumerate(ITEM_COSTS.keys()):
-                has_resources = self.resource_manager.has_resources(ITEM_COSTS[item_name])
-                self.buttons[i].set_disabled(not has_resources or self.building.crafting)
+            crafting = self.building.crafting
+            for button, (item_name, costs) in zip(self.buttons, self.item_costs):
+                has_resources = self.resource_manager.has_resources(costs)
+                button.set_disabled(not has_resources or crafting)
     
     def draw(self):
         """Draw building menu with building-specific info"""
+        if not self.active:
+            return
+        
         super().draw()
         
-        if not self.active or not self.building:
+        if not self.building:
             return
         
-        # Update button states based on current resources
-        self.update_button_states()
+        # Button states and labels only change with the building's state or
+        # the player's resources, so rebuild them only when those change
+        building = self.building
+        resource_epoch = self.resource_manager.epoch
+        if self.building_type == "mine":
+            label_key = (building, building.level, building.upgrading,
+                         int(building.upgrade_timer), resource_epoch)
+        elif self.building_type == "coresmith":
+            label_key = (building, building.crafting, building.current_item,
+                         int(building.crafting_timer), resource_epoch)
+        else:
+            label_key = (building, resource_epoch)
+        if label_key != self.label_key:
+            # Update button states based on current resources
+            self.update_button_states()
+            self.label_blits = self.collect_label_blits()
+            self.label_key = label_key
+        
+        self.screen.blits(self.label_blits, doreturn=False)
+    
+    def collect_label_blits(self):
+        """
+        Collect the building-specific information labels
         
-        # Draw building-specific information
+        Returns:
+            List of (surface, position) pairs
+        """
         y_pos = self.rect.top + 120
+        x_pos = self.rect.left + 20
+        label_blits = []
         
         if self.building_type == "mine":
             # Draw mine info
@@ -136,26 +175,26 @@ class BuildingMenu(Menu):
             ]
             
             for i, text in enumerate(texts):
-                surface = self.small_font.render(text, True, (255, 255, 255))
-                self.screen.blit(surface, (self.rect.left + 20, y_pos + i*20))
+                surface = render_text(text, SMALL_FONT_SIZE, LABEL_COLOR)
+                label_blits.append((surface, (x_pos, y_pos + i*20)))
             
             # Draw upgrade progress if upgrading
             if mine.upgrading:
                 progress_text = f"Upgrading: {int(mine.upgrade_timer)}/{int(mine.upgrade_time)}s"
-                surface = self.small_font.render(progress_text, True, (100, 200, 255))
-                self.screen.blit(surface, (self.rect.left + 20, y_pos + 80))
+                surface = render_text(progress_text, SMALL_FONT_SIZE, PROGRESS_COLOR)
+                label_blits.append((surface, (x_pos, y_pos + 80)))
                 
             # Draw upgrade cost
             else:
                 upgrade_cost = mine.get_upgrade_cost()
-                cost_text = "Upgrade Cost: " + ", ".join(f"{amt} {res}" for res, amt in upgrade_cost.items())
+                cost_text = "Upgrade Cost: " + format_cost(upgrade_cost)
                 
                 # Color based on whether player has enough resources
                 has_resources = self.resource_manager.has_resources(upgrade_cost)
-                cost_color = (100, 255, 100) if has_resources else (255, 100, 100)
+                cost_color = AFFORDABLE_COLOR if has_resources else UNAFFORDABLE_COLOR
                 
-                surface = self.small_font.render(cost_text, True, cost_color)
-                self.screen.blit(surface, (self.rect.left + 20, y_pos + 80))
+                surface = render_text(cost_text, SMALL_FONT_SIZE, cost_color)
+                label_blits.append((surface, (x_pos, y_pos + 80)))
         
         elif self.building_type == "coresmith":
             # Draw coresmith info
@@ -164,23 +203,27 @@ class BuildingMenu(Menu):
             # Draw crafting progress if crafting
             if coresmith.crafting:
                 text = f"Crafting: {coresmith.current_item}"
-                surface = self.small_font.render(text, True, (255, 255, 255))
-                self.screen.blit(surface, (self.rect.left + 20, y_pos))
+                surface = render_text(text, SMALL_FONT_SIZE, LABEL_COLOR)
+                label_blits.append((surface, (x_pos, y_pos)))
                 
                 progress_text = f"Time: {int(coresmith.crafting_timer)}/{int(coresmith.crafting_time)}s"
-                surface = self.small_font.render(progress_text, True, (100, 200, 255))
-                self.screen.blit(surface, (self.rect.left + 20, y_pos + 20))
+                surface = render_text(progress_text, SMALL_FONT_SIZE, PROGRESS_COLOR)
+                label_blits.append((surface, (x_pos, y_pos + 20)))
             
             # Draw item costs
             y_pos += 60
-            surface = self.small_font.render("Item Costs:", True, (255, 255, 255))
-            self.screen.blit(surface, (self.rect.left + 20, y_pos))
+            surface = render_text("Item Costs:", SMALL_FONT_SIZE, LABEL_COLOR)
+            label_blits.append((surface, (x_pos, y_pos)))
             
-            for i, (item_name, costs) in enumerate(ITEM_COSTS.items()):
+            # Bind the lookups used for every item once
+            check_resources = self.resource_manager.has_resources
+            add_label = label_blits.append
+            for i, (item_name, costs) in enumerate(self.item_costs):
                 # Check if player has enough resources
-                has_resources = self.resource_manager.has_resources(costs)
-                cost_color = (200, 200, 200) if has_resources else (255, 100, 100)
+                cost_color = ITEM_COST_COLOR if check_resources(costs) else UNAFFORDABLE_COLOR
                 
-                cost_text = f"{item_name}: " + ", ".join(f"{amt} {res}" for res, amt in costs.items())
-                surface = self.small_font.render(cost_text, True, cost_color)
-                self.screen.blit(surface, (self.rect.left + 20, y_pos + 20 + i*20))
+                cost_text = f"{item_name}: " + format_cost(costs)
+                surface = render_text(cost_text, SMALL_FONT_SIZE, cost_color)
+                add_label((surface, (x_pos, y_pos + 20 + i*20)))
+        
+        return label_blits
@@ -4,10 +4,20 @@ Castle upgrade menu UI for Castle Defense
 """
 import pygame
 from ui.menus import Menu, Button
+from ui.base_menu import AFFORDABLE_COLOR, UNAFFORDABLE_COLOR
 from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from utils import render_text, format_cost
+
+SECTION_TITLE_FONT_SIZE = 20
+SECTION_STAT_FONT_SIZE = 18
+SECTION_TITLE_COLOR = (255, 255, 200)
+CURRENT_STAT_COLOR = (200, 200, 255)
+NEXT_STAT_COLOR = (150, 255, 150)
 
 class CastleMenu(Menu):
     """Menu for upgrading the castle"""
+    __slots__ = ("castle", "resource_manager")
+    
     def __init__(self, screen):
         """
         Initialize castle menu
@@ -35,6 +45,7 @@ class CastleMenu(Menu):
         """
         self.castle = castle
         self.resource_manager = resource_manager
+        self.label_key = None
         
         # Clear existing buttons
         self.buttons = []
@@ -125,19 +136,44 @@ class CastleMenu(Menu):
     
     def draw(self):
         """Draw castle menu with upgrade options"""
+        if not self.active:
+            return
+        
         super().draw()
         
-        if not self.active or not self.castle:
+        if not self.castle:
             return
         
-        # Update button states
-        self.update_button_states()
+        # Button states and labels only change with the castle's stats or the
+        # player's resources, so rebuild them only when those change
+        castle = self.castle
+        label_key = (
+            castle, castle.health_upgrade_level, castle.damage_reduction_upgrade_level,
+            castle.health_regen_upgrade_level, int(castle.health), castle.max_health,
+            castle.damage_reduction, castle.health_regen,
+            self.resource_manager.epoch
+        )
+        if label_key != self.label_key:
+            # Update button states
+            self.update_button_states()
+            self.label_blits = self.collect_label_blits()
+            self.label_key = label_key
+        
+        self.screen.blits(self.label_blits, doreturn=False)
+    
+    def collect_label_blits(self):
+        """
+        Collect the castle stat labels
         
-        # Draw castle stats
+        Returns:
+            List of (surface, position) pairs
+        """
         y_pos = self.rect.top + 60
+        label_blits = []
         
         # Draw health upgrade info
-        self.draw_upgrade_section(
+        self.collect_upgrade_section_blits(
+            label_blits,
             y_pos + 35,
             f"Wall Strength (Lv {self.castle.health_upgrade_level})",
             f"Current HP: {int(self.castle.health)}/{int(self.castle.max_health)}",
@@ -149,7 +185,8 @@ class CastleMenu(Menu):
         damage_reduction_pct = int(self.castle.damage_reduction * 100)
         next_dr_pct = int(min(0.9, self.castle.damage_reduction * 1.2) * 100)
         
-        self.draw_upgrade_section(
+        self.collect_upgrade_section_blits(
+            label_blits,
             y_pos + 135,
             f"Armor (Lv {self.castle.damage_reduction_upgrade_level})",
             f"Reduction: {damage_reduction_pct}%",
@@ -160,47 +197,49 @@ class CastleMenu(Menu):
         # Draw health regen upgrade info
         next_regen = self.castle.health_regen * 1.3
         
-        self.draw_upgrade_section(
+        self.collect_upgrade_section_blits(
+            label_blits,
             y_pos + 235,
             f"Repair (Lv {self.castle.health_regen_upgrade_level})",
             f"Regen: {self.castle.health_regen:.1f} HP/s",
             f"Next: {next_regen:.1f} HP/s",
             self.castle.get_health_regen_upgrade_cost()
         )
+        
+        return label_blits
     
-    def draw_upgrade_section(self, y_pos, title, current, next_level, cost):
+    def collect_upgrade_section_blits(self, label_blits, y_pos, title, current, next_level, cost):
         """
-        Draw an upgrade section with title, stats, and cost
+        Collect the labels of an upgrade section with title, stats, and cost
         
         Args:
+            label_blits: List of (surface, position) pairs to append to
             y_pos: Y position to start drawing
             title: Section title
             current: Current stat text
             next_level: Next level stat text
             cost: Dictionary of costs
         """
-        # Draw section title
-        title_font = pygame.font.Font(None, 20)
-        title_surface = title_font.render(title, True, (255, 255, 200))
-        self.screen.blit(title_surface, (self.rect.left + 20, y_pos))
+        # Section title
+        title_surface = render_text(title, SECTION_TITLE_FONT_SIZE, SECTION_TITLE_COLOR)
+        label_blits.append((title_surface, (self.rect.left + 20, y_pos)))
         
-        # Draw current stat
+        # Current stat
         y_pos += 20
-        stat_font = pygame.font.Font(None, 18)
-        current_surface = stat_font.render(current, True, (200, 200, 255))
-        self.screen.blit(current_surface, (self.rect.left + 30, y_pos))
+        current_surface = render_text(current, SECTION_STAT_FONT_SIZE, CURRENT_STAT_COLOR)
+        label_blits.append((current_surface, (self.rect.left + 30, y_pos)))
         
-        # Draw next level stat
+        # Next level stat
         y_pos += 18
-        next_surface = stat_font.render(next_level, True, (150, 255, 150))
-        self.screen.blit(next_surface, (self.rect.left + 30, y_pos))
+        next_surface = render_text(next_level, SECTION_STAT_FONT_SIZE, NEXT_STAT_COLOR)
+        label_blits.append((next_surface, (self.rect.left + 30, y_pos)))
         
-        # Draw cost
+        # Cost
         y_pos += 25
         # Check if we have enough resources
         has_resources = self.resource_manager.has_resources(cost)
-        cost_color = (100, 255, 100) if has_resources else (255, 100, 100)
+        cost_color = AFFORDABLE_COLOR if has_resources else UNAFFORDABLE_COLOR
         
-        cost_text = "Cost: " + ", ".join(f"{amt} {res}" for res, amt in cost.items())
-        cost_surface = stat_font.render(cost_text, True, cost_color)
-        self.screen.blit(cost_surface, (self.rect.left + 25, y_pos))
+        cost_text = "Cost: " + format_cost(cost)
+        cost_surface = render_text(cost_text, SECTION_STAT_FONT_SIZE, cost_color)
+        label_blits.append((cost_surface, (self.rect.left + 25, y_pos)))
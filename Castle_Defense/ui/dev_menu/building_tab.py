@@ -472,8 +472,8 @@ class BuildingTab(Tab):
         """Callback for mine boss core cost slider"""
         self.mine_upgrade_cost["Boss Cores"] = int(value)
         # Update the config value
-        module = __import__('sys').modules['config']
-        module.MINE_UPGRADE_COST = self.mine_upgrade_cost.copy()
+        from config_extension import update_mine_upgrade_cost
+        update_mine_upgrade_cost("Boss Cores", int(value))
     
     def _set_coresmith_crafting_time(self, value):
         """Callback for coresmith crafting time slider"""
@@ -499,16 +499,17 @@ class BuildingTab(Tab):
         # Reset Mine values
         from config_extension import (
             set_mine_initial_production,
-            set_mine_production_multiplier
+            set_mine_production_multiplier,
+            reset_mine_upgrade_cost
         )
         set_mine_initial_production(self.original_mine_initial_production)
         set_mine_production_multiplier(self.original_mine_production_multiplier)
+        reset_mine_upgrade_cost()
         
         # Reset other config values
         module = __import__('sys').modules['config']
         module.MINE_UPGRADE_TIME_MULTIPLIER = self.original_mine_upgrade_time_multiplier
         module.MINE_INITIAL_UPGRADE_TIME = self.original_mine_initial_upgrade_time
-        module.MINE_UPGRADE_COST = self.original_mine_upgrade_cost.copy()
         module.CORESMITH_CRAFTING_TIME = self.original_coresmith_crafting_time
         
         # Reset local values
@@ -443,10 +443,8 @@ class BuildingsTab(Tab):
         """Callback for mine upgrade cost slider"""
         self.mine_upgrade_cost["Boss Cores"] = int(value)
         # Update global mine upgrade cost
-        # We'd need a dedicated function or direct modification here as well
-        import sys
-        module = sys.modules['config']
-        module.MINE_UPGRADE_COST = self.mine_upgrade_cost.copy()
+        from config_extension import update_mine_upgrade_cost
+        update_mine_upgrade_cost("Boss Cores", int(value))
     
     # Coresmith Settings Callbacks
     def _set_coresmith_crafting_time(self, value):
@@ -562,6 +560,7 @@ class BuildingsTab(Tab):
         from config_extension import (
             set_mine_initial_production,
             set_mine_production_multiplier,
+            reset_mine_upgrade_cost,
             reset_castle_upgrade_costs,
             set_castle_health_upgrade_multiplier,
             set_castle_damage_reduction_upgrade_multiplier,
@@ -571,13 +570,13 @@ class BuildingsTab(Tab):
         # Update Mine settings
         set_mine_initial_production(self.original_mine_initial_production)
         set_mine_production_multiplier(self.original_mine_production_multiplier)
+        reset_mine_upgrade_cost()
         
         # Update module values directly for values without dedicated functions
         import sys
         module = sys.modules['config']
         module.MINE_UPGRADE_TIME_MULTIPLIER = self.original_mine_upgrade_time_multiplier
         module.MINE_INITIAL_UPGRADE_TIME = self.original_mine_initial_upgrade_time
-        module.MINE_UPGRADE_COST = self.original_mine_upgrade_cost.copy()
         module.CORESMITH_CRAFTING_TIME = self.original_coresmith_crafting_time
         
         # Reset Castle settings
@@ -4,6 +4,7 @@ UI components for the developer menu
 """
 import pygame
 import math
+from utils import get_font
 
 class Button:
     """Button control for the developer menu"""
@@ -26,7 +27,7 @@ class Button:
         self.hover_color = (100, 100, 100)
         self.rect = pygame.Rect(position, size)
         self.hovered = False
-        self.font = pygame.font.Font(None, 18)
+        self.font = get_font(18)
     
     def update(self, mouse_pos):
         """Update button state based on mouse position"""
@@ -103,7 +104,7 @@ class Slider:
         self.update_handle()
         
         self.dragging = False
-        self.font = pygame.font.Font(None, 18)
+        self.font = get_font(18)
     
     def update_handle(self):
         """Update the position of the slider handle based on value"""
@@ -226,7 +227,7 @@ class Checkbox:
         
         self.box_size = 16
         self.box_rect = pygame.Rect(position[0], position[1], self.box_size, self.box_size)
-        self.font = pygame.font.Font(None, 18)
+        self.font = get_font(18)
     
     def handle_event(self, event):
         """
@@ -297,7 +298,7 @@ class TextInput:
         self.cursor_visible = True
         self.cursor_timer = 0
         
-        self.font = pygame.font.Font(None, 18)
+        self.font = get_font(18)
     
     def handle_event(self, event):
         """
@@ -411,7 +412,7 @@ class DropdownMenu:
         self.expanded = False
         self.hover_index = -1
         
-        self.font = pygame.font.Font(None, 18)
+        self.font = get_font(18)
     
     def handle_event(self, event):
         """
@@ -550,7 +551,7 @@ class TabButton:
         self.rect = pygame.Rect(position[0], position[1], width, self.height)
         self.active = False
         self.hovered = False
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font(20)
     
     def update(self, mouse_pos):
         """Update button state based on mouse position"""
@@ -584,8 +585,8 @@ class Tab:
         """
         self.rect = rect
         self.controls = []
-        self.font = pygame.font.Font(None, 20)
-        self.title_font = pygame.font.Font(None, 24)
+        self.font = get_font(20)
+        self.title_font = get_font(24)
     
     def handle_event(self, event):
         """
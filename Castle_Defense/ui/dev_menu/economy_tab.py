@@ -10,6 +10,13 @@ from config import (
     LOOT_WAVE_SCALING,
     ITEM_COSTS
 )
+from config_extension import (
+    set_loot_monster_base_coin_drop,
+    set_loot_boss_base_coin_drop,
+    set_loot_wave_scaling,
+    update_item_cost,
+    update_item_costs_all
+)
 
 class EconomyTab(Tab):
     """Tab for adjusting resource generation and costs"""
@@ -110,6 +117,7 @@ class EconomyTab(Tab):
         
         # Item dropdown
         item_names = list(self.item_costs.keys())
+        self.item_names = tuple(item_names)  # Indexed by the dropdown callbacks
         self.item_dropdown = DropdownMenu(
             (self.rect.left + 20, y_pos),
             width,
@@ -164,26 +172,23 @@ class EconomyTab(Tab):
         """Callback for monster coin drop slider"""
         self.loot_monster_coin_drop = value
         # Update global monster coin drop
-        from config_extension import set_loot_monster_base_coin_drop
         set_loot_monster_base_coin_drop(value)
     
     def _set_boss_coin_drop(self, value):
         """Callback for boss coin drop slider"""
         self.loot_boss_coin_drop = int(value)
         # Update global boss coin drop
-        from config_extension import set_loot_boss_base_coin_drop
         set_loot_boss_base_coin_drop(int(value))
     
     def _set_loot_wave_scaling(self, value):
         """Callback for loot wave scaling slider"""
         self.loot_wave_scaling = value
         # Update global loot wave scaling
-        from config_extension import set_loot_wave_scaling
         set_loot_wave_scaling(value)
     
     def _item_selected(self, index):
         """Callback for item dropdown"""
-        item_name = list(self.item_costs.keys())[index]
+        item_name = self.item_names[index]
         # Update sliders with values for selected item
         if item_name == "Unstoppable Force":
             self.stone_cost_slider.value = self.item_costs[item_name].get("Stone", 0)
@@ -200,41 +205,32 @@ class EconomyTab(Tab):
     
     def _set_stone_cost(self, value):
         """Callback for stone cost slider"""
-        item_name = list(self.item_costs.keys())[self.item_dropdown.selected_index]
+        item_name = self.item_names[self.item_dropdown.selected_index]
         # Update item stone cost
         self.item_costs[item_name]["Stone"] = int(value)
         # Update global item costs
-        from config_extension import update_item_cost
         update_item_cost(item_name, "Stone", int(value))
     
     def _set_core_cost(self, value):
         """Callback for core cost slider"""
-        item_name = list(self.item_costs.keys())[self.item_dropdown.selected_index]
+        item_name = self.item_names[self.item_dropdown.selected_index]
         # Determine which core type based on item
         core_type = "Force Core" if item_name == "Unstoppable Force" else "Spirit Core"
         # Update item core cost
         self.item_costs[item_name][core_type] = int(value)
         # Update global item costs
-        from config_extension import update_item_cost
         update_item_cost(item_name, core_type, int(value))
     
     def reset(self):
         """Reset all economy values to original values"""
         # Reset loot drops
-        from config_extension import (
-            set_loot_monster_base_coin_drop,
-            set_loot_boss_base_coin_drop,
-            set_loot_wave_scaling
-        )
         set_loot_monster_base_coin_drop(self.original_loot_monster_coin_drop)
         set_loot_boss_base_coin_drop(self.original_loot_boss_coin_drop)
         set_loot_wave_scaling(self.original_loot_wave_scaling)
         
         # Reset item costs
         for item, costs in self.original_item_costs.items():
-            for resource, amount in costs.items():
-                from config_extension import update_item_cost
-                update_item_cost(item, resource, amount)
+            update_item_costs_all(item, costs)
         
         # Reset local values
         self.item_costs = {
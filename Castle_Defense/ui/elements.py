@@ -3,6 +3,7 @@
 Basic UI elements for Castle Defense
 """
 import pygame
+from utils import get_font
 
 class Button:
     """Interactive button for menus"""
@@ -34,7 +35,7 @@ class Button:
         self.rect = pygame.Rect(position, size)
         self.hovered = False
         self.disabled = disabled
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font(20)
     
     def update(self, mouse_pos):
         """
@@ -136,7 +137,7 @@ class Slider:
         self.update_handle()
         
         self.dragging = False
-        self.font = pygame.font.Font(None, 18)
+        self.font = get_font(18)
     
     def update_handle(self):
         """Update the position of the slider handle based on value"""
@@ -5,6 +5,32 @@ Game UI components for Castle Defense
 import pygame
 from config import WINDOW_WIDTH, WINDOW_HEIGHT, TOWER_TYPES, TOWER_MONSTER_COIN_COSTS
 from ui.menus import Button, Slider
+from features import registry
+from utils import render_text, format_cost
+
+# Font sizes for the HUD text
+FONT_SIZE = 24
+SMALL_FONT_SIZE = 20
+TITLE_FONT_SIZE = 28
+
+# Wave info panel size
+WAVE_INFO_WIDTH = 200
+WAVE_INFO_HEIGHT = 70
+BOSS_WAVE_INFO_HEIGHT = 100
+
+# Castle health bar size
+HEALTH_BAR_WIDTH = 200
+HEALTH_BAR_HEIGHT = 20
+
+# Resources shown in each section of the resource panel
+COMMON_RESOURCES = ("Stone", "Iron", "Copper", "Thorium", "Monster Coins")
+CORE_RESOURCES = ("Force Core", "Spirit Core", "Magic Core", "Void Core")
+ITEM_RESOURCES = ("Unstoppable Force", "Serene Spirit")
+ALWAYS_SHOWN_RESOURCES = frozenset(("Stone", "Monster Coins"))  # Shown even at zero
+
+# The next wave prompt pulses over 2 seconds, changing brightness every 50 ms
+PULSE_STEP_MS = 50
+PULSE_STEPS = 40
 
 class GameUI:
     """Main game UI that displays resources, castle health, and wave info"""
@@ -16,12 +42,49 @@ class GameUI:
             screen: Pygame surface to draw on
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
-        self.title_font = pygame.font.Font(None, 28)
-        
         # Create background surfaces for UI sections
         self.resource_bg_rect = pygame.Rect(WINDOW_WIDTH - 250, 10, 240, 200)
+        self.resource_panel = self.create_panel_surface(
+            self.resource_bg_rect.size, (20, 20, 50, 180), (100, 100, 200))  # Dark blue
+        self.resource_header = render_text("Resources", TITLE_FONT_SIZE, (220, 220, 255))
+        self.resource_header_rect = self.resource_header.get_rect(
+            midtop=(self.resource_bg_rect.centerx, self.resource_bg_rect.top + 10))
+        
+        # Wave info panel, with a taller variant for the boss wave warning
+        self.wave_info_rects = {}
+        self.wave_info_panels = {}
+        for boss_next, height in ((False, WAVE_INFO_HEIGHT), (True, BOSS_WAVE_INFO_HEIGHT)):
+            rect = pygame.Rect(WINDOW_WIDTH // 2 - WAVE_INFO_WIDTH // 2, 10, WAVE_INFO_WIDTH, height)
+            self.wave_info_rects[boss_next] = rect
+            self.wave_info_panels[boss_next] = self.create_panel_surface(
+                rect.size, (50, 20, 20, 180), (200, 100, 100))  # Dark red
+        
+        # Next wave prompt, pre-rendered for each step of the pulse over one shared background
+        prompt_text = "Press SPACE to start next wave"
+        self.next_wave_prompt_surfaces = []
+        for step in range(PULSE_STEPS):
+            pulse = step / PULSE_STEPS  # 0 to 1 over the pulse
+            pulse_value = 0.7 + 0.3 * abs(pulse - 0.5) * 2  # 0.7 to 1.0 pulsing
+            brightness = int(255 * pulse_value)
+            self.next_wave_prompt_surfaces.append(render_text(prompt_text, FONT_SIZE, (brightness, brightness, 0)))
+        self.next_wave_prompt_rect = self.next_wave_prompt_surfaces[0].get_rect(center=(WINDOW_WIDTH // 2, 150))
+        self.next_wave_prompt_bg_rect = self.next_wave_prompt_rect.inflate(20, 10)
+        self.next_wave_prompt_bg = pygame.Surface(self.next_wave_prompt_bg_rect.size, pygame.SRCALPHA)
+        self.next_wave_prompt_bg.fill((0, 0, 0, 150))  # Semi-transparent black
+        
+        # Castle health bar, drawn again only when the filled width changes
+        self.health_bar_rect = pygame.Rect(WINDOW_WIDTH // 2 - HEALTH_BAR_WIDTH // 2, WINDOW_HEIGHT - 30,
+                                           HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT)
+        self.health_bar_surface = pygame.Surface(self.health_bar_rect.size)
+        self.health_bar_fill_width = None
+        
+        # Resource, castle and wave labels, collected again only when the values they show change
+        self.resource_label_key = None
+        self.resource_label_blits = []
+        self.castle_label_key = None
+        self.castle_label_blits = []
+        self.wave_label_key = None
+        self.wave_label_blits = []
         
         # Play/Pause button
         self.play_pause_button = Button(
@@ -46,11 +109,35 @@ class GameUI:
             self.set_game_speed,
             lambda x: f"{x:.1f}x"  # Format function
         )
+        # Every speed the slider can snap to, from min to max in steps
+        slider = self.game_speed_slider
+        step_count = round((slider.max_value - slider.min_value) / slider.step)
+        self.game_speed_values = tuple(slider.min_value + i * slider.step for i in range(step_count + 1))
+        
+        # Area that clicks on the slider track or handle land in, refreshed on draw
+        self.game_speed_slider_hit_rect = self.game_speed_slider.slider_rect.union(
+            self.game_speed_slider.handle_rect)
+    
+    def create_panel_surface(self, size, fill_color, border_color):
+        """
+        Create a semi-transparent panel background with a border
+        
+        Args:
+            size: Tuple of (width, height)
+            fill_color: RGBA color tuple for the background
+            border_color: RGB color tuple for the border
+            
+        Returns:
+            Pygame surface with the panel drawn on it
+        """
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill(fill_color)
+        pygame.draw.rect(panel, border_color, panel.get_rect(), 2)
+        return panel
     
     def toggle_pause(self):
         """Toggle the game between paused and playing states"""
-        # Get the game instance from the game module
-        from game import game_instance
+        game_instance = registry.game_instance
         
         # Toggle pause state
         if self.is_paused:
@@ -71,11 +158,8 @@ class GameUI:
         Args:
             value: New game speed value
         """
-        # Get the game instance from the game module
-        from game import game_instance
-        
         # Set the game's time scale
-        game_instance.time_scale = value
+        registry.game_instance.time_scale = value
     
     def handle_event(self, event):
         """
@@ -87,46 +171,36 @@ class GameUI:
         Returns:
             True if event was handled, False otherwise
         """
+        # Keep the play/pause hover state in step with the mouse; motion is never consumed
+        if event.type == pygame.MOUSEMOTION:
+            self.play_pause_button.hovered = self.play_pause_button.rect.collidepoint(event.pos)
+            return False
+        
+        # Otherwise only clicks are handled here
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return False
+        mouse_pos = event.pos
+        
         # Handle play/pause button
-        if self.play_pause_button.rect.collidepoint(pygame.mouse.get_pos()):
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                self.play_pause_button.click()
-                return True
+        if event.button == 1 and self.play_pause_button.rect.collidepoint(mouse_pos):
+            self.play_pause_button.click()
+            return True
         
         # Handle game speed slider
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            if self.game_speed_slider.slider_rect.collidepoint(mouse_pos) or \
-               self.game_speed_slider.handle_rect.collidepoint(mouse_pos):
-                # Set slider value based on click position
-                slider_width = self.game_speed_slider.slider_rect.width
-                slider_left = self.game_speed_slider.slider_rect.left
-                slider_pos = (mouse_pos[0] - slider_left) / slider_width
-                value = self.game_speed_slider.min_value + slider_pos * (self.game_speed_slider.max_value - self.game_speed_slider.min_value)
-                # Round to nearest step
-                value = round(value / self.game_speed_slider.step) * self.game_speed_slider.step
-                # Clamp to min/max
-                value = max(self.game_speed_slider.min_value, min(self.game_speed_slider.max_value, value))
-                self.game_speed_slider.value = value
-                self.set_game_speed(value)
-                return True
+        if self.game_speed_slider_hit_rect.collidepoint(mouse_pos):
+            # Set slider value based on click position, snapped to the nearest step
+            slider_rect = self.game_speed_slider.slider_rect
+            last_index = len(self.game_speed_values) - 1
+            index = round((mouse_pos[0] - slider_rect.left) * last_index / slider_rect.width)
+            # Clamp to the ends, since the handle can stick out past the track
+            index = max(0, min(last_index, index))
+            value = self.game_speed_values[index]
+            self.game_speed_slider.value = value
+            self.set_game_speed(value)
+            return True
         
         return False
     
-    def update(self, dt):
-        """
-        Update UI elements
-        
-        Args:
-            dt: Time delta in seconds
-        """
-        # Update button hover state
-        mouse_pos = pygame.mouse.get_pos()
-        if self.play_pause_button.rect.collidepoint(mouse_pos):
-            self.play_pause_button.hovered = True
-        else:
-            self.play_pause_button.hovered = False
-    
     def draw(self, resource_manager, castle, wave_manager):
         """
         Draw all UI components
@@ -157,50 +231,48 @@ class GameUI:
         Args:
             resource_manager: ResourceManager with resource data
         """
-        # Create semi-transparent background for resources panel
-        bg_surface = pygame.Surface((self.resource_bg_rect.width, self.resource_bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((20, 20, 50, 180))  # Dark blue with transparency
-        self.screen.blit(bg_surface, self.resource_bg_rect)
-        
-        # Draw panel border
-        pygame.draw.rect(self.screen, (100, 100, 200), self.resource_bg_rect, 2)
-        
-        # Draw "Resources" header
-        header = self.title_font.render("Resources", True, (220, 220, 255))
-        header_rect = header.get_rect(midtop=(self.resource_bg_rect.centerx, self.resource_bg_rect.top + 10))
-        self.screen.blit(header, header_rect)
-        
-        # Position for the first resource entry
-        x = self.resource_bg_rect.right - 20
-        y = self.resource_bg_rect.top + 40
-        
-        # Categorize resources
-        common_resources = ["Stone", "Iron", "Copper", "Thorium", "Monster Coins"]
-        special_resources = ["Force Core", "Spirit Core", "Magic Core", "Void Core"]
-        item_resources = ["Unstoppable Force", "Serene Spirit"]
-        
-        # Display common resources first
-        y = self.draw_resource_category(resource_manager, common_resources, x, y, "Materials:")
-        
-        # Display special resources (cores) if any exist
-        has_cores = any(resource_manager.get_resource(core) > 0 for core in special_resources)
-        if has_cores:
-            y += 10  # Add spacing between categories
-            y = self.draw_resource_category(resource_manager, special_resources, x, y, "Cores:")
-        
-        # Display crafted items if any exist
-        has_items = any(resource_manager.get_resource(item) > 0 for item in item_resources)
-        if has_items:
-            y += 10  # Add spacing between categories
-            y = self.draw_resource_category(resource_manager, item_resources, x, y, "Items:")
+        # Draw the semi-transparent panel with its border
+        self.screen.blit(self.resource_panel, self.resource_bg_rect)
+        
+        # Lay the labels out again only when an amount has changed
+        label_key = (resource_manager, resource_manager.epoch)
+        if label_key != self.resource_label_key:
+            self.resource_label_key = label_key
+            
+            # Collect the "Resources" header and every resource label, then blit them in one batch
+            label_blits = [(self.resource_header, self.resource_header_rect)]
+            
+            # Position for the first resource entry
+            x = self.resource_bg_rect.right - 20
+            y = self.resource_bg_rect.top + 40
+            
+            # Display common resources first
+            y = self.collect_resource_category_blits(label_blits, resource_manager, COMMON_RESOURCES, x, y, "Materials:")
+            
+            # Display special resources (cores) if any exist
+            has_cores = resource_manager.has_any(CORE_RESOURCES)
+            if has_cores:
+                y += 10  # Add spacing between categories
+                y = self.collect_resource_category_blits(label_blits, resource_manager, CORE_RESOURCES, x, y, "Cores:")
+            
+            # Display crafted items if any exist
+            has_items = resource_manager.has_any(ITEM_RESOURCES)
+            if has_items:
+                y += 10  # Add spacing between categories
+                y = self.collect_resource_category_blits(label_blits, resource_manager, ITEM_RESOURCES, x, y, "Items:")
+            
+            self.resource_label_blits = label_blits
+        
+        self.screen.blits(self.resource_label_blits, doreturn=False)
     
-    def draw_resource_category(self, resource_manager, resources, x, y, category_name):
+    def collect_resource_category_blits(self, label_blits, resource_manager, resources, x, y, category_name):
         """
-        Draw a category of resources
+        Collect the labels for a category of resources
         
         Args:
+            label_blits: List of (surface, rect) pairs to append the labels to
             resource_manager: ResourceManager with resource data
-            resources: List of resource types to display
+            resources: Tuple of resource types to display
             x: X coordinate for right alignment
             y: Y coordinate for top alignment
             category_name: Name of the resource category
@@ -208,22 +280,21 @@ class GameUI:
         Returns:
             Updated y position after drawing resources
         """
-        # Draw category header
-        category_text = self.small_font.render(category_name, True, (200, 200, 255))
-        category_rect = category_text.get_rect(topright=(x, y))
-        self.screen.blit(category_text, category_rect)
+        # Category header
+        category_text = render_text(category_name, SMALL_FONT_SIZE, (200, 200, 255))
+        label_blits.append((category_text, (x - category_text.get_width(), y)))
         y += 20
         
-        # Draw each resource in the category
+        # Each resource in the category
+        get_resource = resource_manager.get_resource
         for resource_type in resources:
-            amount = resource_manager.get_resource(resource_type)
-            if amount > 0 or resource_type in ["Stone", "Monster Coins"]:
+            amount = get_resource(resource_type)
+            if amount > 0 or resource_type in ALWAYS_SHOWN_RESOURCES:
                 text = f"{resource_type}: {amount}"
-                surface = self.font.render(text, True, (255, 255, 255))
+                surface = render_text(text, FONT_SIZE, (255, 255, 255))
                 
                 # Right-align the text
-                text_rect = surface.get_rect(topright=(x, y))
-                self.screen.blit(surface, text_rect)
+                label_blits.append((surface, (x - surface.get_width(), y)))
                 
                 y += 25
         
@@ -236,40 +307,46 @@ class GameUI:
         Args:
             castle: Castle instance with health data
         """
-        # Draw health bar
-        bar_width = 200
-        bar_height = 20
-        x = WINDOW_WIDTH // 2 - bar_width // 2
-        y = WINDOW_HEIGHT - 30
-        
-        # Background
-        pygame.draw.rect(self.screen, (100, 0, 0), (x, y, bar_width, bar_height))
-        
-        # Health
+        # Draw health bar, composing it again only when the filled width changes
+        y = self.health_bar_rect.y
         health_percent = castle.health / castle.max_health
-        pygame.draw.rect(self.screen, (0, 200, 0), 
-                         (x, y, int(bar_width * health_percent), bar_height))
-        
-        # Border
-        pygame.draw.rect(self.screen, (255, 255, 255), (x, y, bar_width, bar_height), 1)
-        
-        # Text
-        text = f"Castle: {int(castle.health)}/{int(castle.max_health)}"
-        surface = self.font.render(text, True, (255, 255, 255))
-        text_rect = surface.get_rect(center=(WINDOW_WIDTH // 2, y - 15))
-        self.screen.blit(surface, text_rect)
-        
-        # Additional castle stats
-        stats_text = f"Damage Reduction: {int(castle.damage_reduction * 100)}%  Regen: {castle.health_regen:.1f}/s"
-        stats_surface = self.small_font.render(stats_text, True, (200, 200, 200))
-        stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH // 2, y - 35))
-        self.screen.blit(stats_surface, stats_rect)
-        
-        # Add castle menu hint - now pointing to the Castle Upgrade Station
-        hint_text = "Visit Castle Upgrade Station to improve defenses"
-        hint_surface = self.small_font.render(hint_text, True, (255, 255, 200))
-        hint_rect = hint_surface.get_rect(center=(WINDOW_WIDTH // 2, y - 55))
-        self.screen.blit(hint_surface, hint_rect)
+        fill_width = int(HEALTH_BAR_WIDTH * health_percent)
+        if fill_width != self.health_bar_fill_width:
+            self.health_bar_fill_width = fill_width
+            bar = self.health_bar_surface
+            
+            # Background
+            bar.fill((100, 0, 0))
+            
+            # Health
+            pygame.draw.rect(bar, (0, 200, 0), (0, 0, fill_width, HEALTH_BAR_HEIGHT))
+            
+            # Border
+            pygame.draw.rect(bar, (255, 255, 255), bar.get_rect(), 1)
+        self.screen.blit(self.health_bar_surface, self.health_bar_rect)
+        
+        # Text, formatted again only when the displayed values change
+        label_key = (int(castle.health), int(castle.max_health), castle.damage_reduction, castle.health_regen)
+        if label_key != self.castle_label_key:
+            self.castle_label_key = label_key
+            
+            text = f"Castle: {int(castle.health)}/{int(castle.max_health)}"
+            surface = render_text(text, FONT_SIZE, (255, 255, 255))
+            text_rect = surface.get_rect(center=(WINDOW_WIDTH // 2, y - 15))
+            
+            # Additional castle stats
+            stats_text = f"Damage Reduction: {int(castle.damage_reduction * 100)}%  Regen: {castle.health_regen:.1f}/s"
+            stats_surface = render_text(stats_text, SMALL_FONT_SIZE, (200, 200, 200))
+            stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH // 2, y - 35))
+            
+            # Add castle menu hint - now pointing to the Castle Upgrade Station
+            hint_text = "Visit Castle Upgrade Station to improve defenses"
+            hint_surface = render_text(hint_text, SMALL_FONT_SIZE, (255, 255, 200))
+            hint_rect = hint_surface.get_rect(center=(WINDOW_WIDTH // 2, y - 55))
+            
+            self.castle_label_blits = [(surface, text_rect), (stats_surface, stats_rect), (hint_surface, hint_rect)]
+        
+        self.screen.blits(self.castle_label_blits, doreturn=False)
     
     def draw_wave_info(self, wave_manager):
         """
@@ -278,48 +355,41 @@ class GameUI:
         Args:
             wave_manager: WaveManager with wave data
         """
-        # Create wave info container
-        wave_info_width = 200
-        wave_info_bg = pygame.Rect(
-            WINDOW_WIDTH // 2 - wave_info_width // 2, 
-            10, 
-            wave_info_width, 
-            100 if (wave_manager.current_wave + 1) % 10 == 0 else 70
-        )
+        # Draw the semi-transparent panel with its border
+        boss_next = (wave_manager.current_wave + 1) % 10 == 0
+        wave_info_bg = self.wave_info_rects[boss_next]
+        self.screen.blit(self.wave_info_panels[boss_next], wave_info_bg)
+        
+        # Labels, collected again only when the wave or monster count changes
+        label_key = (wave_manager.current_wave, len(wave_manager.active_monsters))
+        if label_key != self.wave_label_key:
+            self.wave_label_key = label_key
+            
+            # Wave number - centered at top
+            text = f"Wave: {wave_manager.current_wave}"
+            surface = render_text(text, TITLE_FONT_SIZE, (255, 255, 255))
+            text_rect = surface.get_rect(midtop=(wave_info_bg.centerx, wave_info_bg.top + 10))
+            label_blits = [(surface, text_rect)]
+            
+            # Monsters remaining - below wave number
+            text = f"Monsters: {len(wave_manager.active_monsters)}"
+            surface = render_text(text, FONT_SIZE, (255, 255, 255))
+            text_rect = surface.get_rect(midtop=(wave_info_bg.centerx, wave_info_bg.top + 40))
+            label_blits.append((surface, text_rect))
+            
+            # Next wave is boss wave indicator - below monsters
+            if boss_next:
+                text = "BOSS WAVE NEXT!"
+                surface = render_text(text, FONT_SIZE, (255, 100, 100))
+                text_rect = surface.get_rect(midtop=(wave_info_bg.centerx, wave_info_bg.top + 70))
+                label_blits.append((surface, text_rect))
+            
+            self.wave_label_blits = label_blits
         
-        # Draw semi-transparent background
-        bg_surface = pygame.Surface((wave_info_bg.width, wave_info_bg.height), pygame.SRCALPHA)
-        bg_surface.fill((50, 20, 20, 180))  # Dark red with transparency
-        self.screen.blit(bg_surface, wave_info_bg)
-        
-        # Draw border
-        pygame.draw.rect(self.screen, (200, 100, 100), wave_info_bg, 2)
-        
-        # Wave number - centered at top
-        text = f"Wave: {wave_manager.current_wave}"
-        surface = self.title_font.render(text, True, (255, 255, 255))
-        text_rect = surface.get_rect(midtop=(wave_info_bg.centerx, wave_info_bg.top + 10))
-        self.screen.blit(surface, text_rect)
-        
-        # Monsters remaining - below wave number
-        text = f"Monsters: {len(wave_manager.active_monsters)}"
-        surface = self.font.render(text, True, (255, 255, 255))
-        text_rect = surface.get_rect(midtop=(wave_info_bg.centerx, wave_info_bg.top + 40))
-        self.screen.blit(surface, text_rect)
-        
-        # Next wave is boss wave indicator - below monsters
-        if (wave_manager.current_wave + 1) % 10 == 0:
-            text = "BOSS WAVE NEXT!"
-            surface = self.font.render(text, True, (255, 100, 100))
-            text_rect = surface.get_rect(midtop=(wave_info_bg.centerx, wave_info_bg.top + 70))
-            self.screen.blit(surface, text_rect)
+        self.screen.blits(self.wave_label_blits, doreturn=False)
     
     def draw_game_speed_slider(self):
         """Draw the game speed slider"""
-        # Draw label
-        label_surface = self.font.render("Game Speed:", True, (255, 255, 255))
-        self.screen.blit(label_surface, (20, 80))
-        
         # Draw slider background
         slider_rect = pygame.Rect(20, 105, 150, 10)
         pygame.draw.rect(self.screen, (60, 60, 60), slider_rect)
@@ -334,35 +404,26 @@ class GameUI:
         handle_rect = pygame.Rect(handle_x - 5, slider_rect.top - 5, 10, 20)
         pygame.draw.rect(self.screen, (150, 150, 200), handle_rect)
         
-        # Draw value
+        # Draw label and value together; neither overlaps the slider
+        label_surface = render_text("Game Speed:", FONT_SIZE, (255, 255, 255))
         value_text = f"{self.game_speed_slider.value:.1f}x"
-        value_surface = self.font.render(value_text, True, (255, 255, 255))
-        self.screen.blit(value_surface, (175, 100))
+        value_surface = render_text(value_text, FONT_SIZE, (255, 255, 255))
+        self.screen.blits(((label_surface, (20, 80)), (value_surface, (175, 100))), doreturn=False)
         
         # Store handle rect for interactions
         self.game_speed_slider.slider_rect = slider_rect
         self.game_speed_slider.handle_rect = handle_rect
+        self.game_speed_slider_hit_rect = slider_rect.union(handle_rect)
     
     def draw_next_wave_prompt(self):
         """Draw prompt to start next wave"""
         # Create a pulsing effect for the prompt
-        pulse = (pygame.time.get_ticks() % 2000) / 2000  # 0 to 1 over 2 seconds
-        pulse_value = 0.7 + 0.3 * abs(pulse - 0.5) * 2  # 0.7 to 1.0 pulsing
-        
-        text_color = (int(255 * pulse_value), int(255 * pulse_value), 0)
-        
-        text = "Press SPACE to start next wave"
-        surface = self.font.render(text, True, text_color)
-        text_rect = surface.get_rect(center=(WINDOW_WIDTH // 2, 150))
+        step = pygame.time.get_ticks() // PULSE_STEP_MS % PULSE_STEPS
         
-        # Add a background to make text more visible
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 150))  # Semi-transparent black
-        self.screen.blit(bg_surface, bg_rect)
-        
-        # Draw text
-        self.screen.blit(surface, text_rect)
+        # Add a background to make text more visible, then draw the text
+        self.screen.blits(((self.next_wave_prompt_bg, self.next_wave_prompt_bg_rect),
+                           (self.next_wave_prompt_surfaces[step], self.next_wave_prompt_rect)),
+                          doreturn=False)
 
 
 class TowerPlacementUI:
@@ -377,7 +438,6 @@ class TowerPlacementUI:
         """
         self.screen = screen
         self.game = game
-        self.font = pygame.font.Font(None, 20)
         
         # Create buttons for each tower type
         self.buttons = []
@@ -393,6 +453,17 @@ class TowerPlacementUI:
                 tower_type,
                 lambda t=tower_type: self.select_tower(t)
             ))
+        
+        # Area covered by the buttons, so clicks elsewhere skip the button loop
+        self.buttons_rect = self.buttons[0].rect.unionall([button.rect for button in self.buttons])
+        
+        # Cost label blit for each tower type, with the cost it was built from
+        self.cost_label_keys = {}
+        self.cost_label_blits = {}
+        
+        # Affordability border color for each tower type, with the resource epoch and cost it was checked at
+        self.border_color_keys = {}
+        self.border_colors = {}
     
     def select_tower(self, tower_type):
         """
@@ -414,18 +485,19 @@ class TowerPlacementUI:
             True if event was handled, False otherwise
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
+            if not self.buttons_rect.collidepoint(mouse_pos):
+                return False
             
+            # Hover state is already current from the last mouse motion
             for button in self.buttons:
-                button.update(mouse_pos)
                 if button.rect.collidepoint(mouse_pos):
                     button.click()
                     return True
         
         elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
             for button in self.buttons:
-                button.update(mouse_pos)
+                button.update(event.pos)
         
         return False
     
@@ -436,7 +508,9 @@ class TowerPlacementUI:
         Args:
             resource_manager: ResourceManager to check if player has enough resources
         """
-        # Draw tower selection buttons
+        # Draw tower selection buttons, collecting the cost labels to blit in one batch
+        cost_blits = []
+        resource_epoch = resource_manager.epoch
         for button in self.buttons:
             button.draw(self.screen)
             
@@ -447,18 +521,28 @@ class TowerPlacementUI:
             tower_cost = TOWER_TYPES.get(tower_type, {}).get("cost", {})
             monster_coin_cost = TOWER_MONSTER_COIN_COSTS.get(tower_type, 0)
             
-            # Draw cost under button
-            cost_text = ", ".join(f"{amt} {res}" for res, amt in tower_cost.items())
-            
-            # Add Monster Coin cost
-            if monster_coin_cost > 0:
-                cost_text += f", {monster_coin_cost} Monster Coins"
+            # Cost under button, built again only when the costs are changed (from the developer menu)
+            label_key = (tuple(tower_cost.items()), monster_coin_cost)
+            if self.cost_label_keys.get(tower_type) != label_key:
+                self.cost_label_keys[tower_type] = label_key
+                cost_text = format_cost(tower_cost)
+                
+                # Add Monster Coin cost
+                if monster_coin_cost > 0:
+                    cost_text += f", {monster_coin_cost} Monster Coins"
                 
-            cost_surface = self.font.render(cost_text, True, (200, 200, 200))
-            cost_rect = cost_surface.get_rect(center=(button.rect.centerx, button.rect.bottom + 15))
-            self.screen.blit(cost_surface, cost_rect)
+                cost_surface = render_text(cost_text, SMALL_FONT_SIZE, (200, 200, 200))
+                cost_rect = cost_surface.get_rect(center=(button.rect.centerx, button.rect.bottom + 15))
+                self.cost_label_blits[tower_type] = (cost_surface, cost_rect)
+            cost_blits.append(self.cost_label_blits[tower_type])
             
-            # Indicate if player has enough resources
-            has_resources = resource_manager.has_resources_for_tower(tower_cost, monster_coin_cost)
-            color = (0, 255, 0) if has_resources else (255, 0, 0)
-            pygame.draw.rect(self.screen, color, button.rect, 2)
+            # Indicate if player has enough resources, checked again only when resources or costs change
+            border_key = (resource_epoch, label_key)
+            if self.border_color_keys.get(tower_type) != border_key:
+                self.border_color_keys[tower_type] = border_key
+                has_resources = resource_manager.has_resources_for_tower(tower_cost, monster_coin_cost)
+                self.border_colors[tower_type] = (0, 255, 0) if has_resources else (255, 0, 0)
+            pygame.draw.rect(self.screen, self.border_colors[tower_type], button.rect, 2)
+        
+        # The cost labels sit below the buttons, so they can go on last
+        self.screen.blits(cost_blits, doreturn=False)
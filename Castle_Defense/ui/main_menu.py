@@ -7,7 +7,7 @@ import os
 import math
 import random
 from effects.particles import ParticleSystem, Particle
-from utils import scale_position, scale_size, scale_value
+from utils import scale_position, scale_size, scale_value, get_font
 from ui.menus import Button
 
 class MainMenu:
@@ -24,9 +24,9 @@ class MainMenu:
         self.game = game_instance
         
         # Initialize fonts
-        self.title_font = pygame.font.Font(None, scale_value(80))
-        self.button_font = pygame.font.Font(None, scale_value(36))
-        self.info_font = pygame.font.Font(None, scale_value(24))
+        self.title_font = get_font(scale_value(80))
+        self.button_font = get_font(scale_value(36))
+        self.info_font = get_font(scale_value(24))
         
         # Setup dimensions
         self.width = screen.get_width()
@@ -742,7 +742,7 @@ class StoneButton(Button):
         self.press_animation = 0
         
         # Use a larger font
-        self.font = pygame.font.Font(None, scale_value(28))
+        self.font = get_font(scale_value(28))
     
     def click(self):
         """Handle button click with animation"""
@@ -860,8 +860,8 @@ class LoadGamePanel:
         )
         
         # Initialize fonts
-        self.title_font = pygame.font.Font(None, scale_value(36))
-        self.item_font = pygame.font.Font(None, scale_value(24))
+        self.title_font = get_font(scale_value(36))
+        self.item_font = get_font(scale_value(24))
         
         # Save items and buttons
         self.save_items = []
@@ -884,7 +884,8 @@ class LoadGamePanel:
         self.load_buttons = []
         self.delete_buttons = []
         
-        # Get save files
+        # Get save files (once any queued saves have reached the disk)
+        self.game.save_manager.wait_for_saves()
         save_dir = self.game.save_manager.save_directory
         try:
             save_files = [f for f in os.listdir(save_dir) if f.endswith('.save')]
@@ -1008,8 +1009,7 @@ class LoadGamePanel:
             filename: Save file to delete
         """
         try:
-            save_path = os.path.join(self.game.save_manager.save_directory, filename)
-            os.remove(save_path)
+            self.game.save_manager.delete_save(filename)
             # Refresh the save list
             self.refresh_save_list()
         except (FileNotFoundError, PermissionError) as e:
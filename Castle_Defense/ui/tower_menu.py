@@ -3,7 +3,10 @@
 Tower menu implementation for Castle Defense
 """
 import pygame
-from .base_menu import Menu
+from functools import partial
+from .base_menu import (
+    Menu, FONT_SIZE, SMALL_FONT_SIZE, LABEL_COLOR, AFFORDABLE_COLOR, UNAFFORDABLE_COLOR
+)
 from .elements import Button
 from features.towers import ArcherTower, SniperTower, SplashTower, FrozenTower
 from config import (
@@ -13,9 +16,30 @@ from config import (
     ITEM_COSTS, 
     ITEM_EFFECTS
 )
+from utils import render_text, format_cost
+
+# Upgrade paths offered for each tower class, in button order, as (path, button
+# text, cost label). For each path the tower provides upgrade_<path>,
+# calculate_<path>_upgrade_cost and calculate_<path>_upgrade_monster_coin_cost
+BASE_UPGRADE_PATHS = (
+    ("damage", "Upgrade Damage", "Damage"),
+    ("attack_speed", "Upgrade Speed", "Speed"),
+    ("range", "Upgrade Range", "Range"),
+)
+UPGRADE_PATHS = {
+    SplashTower: BASE_UPGRADE_PATHS + (
+        ("aoe_radius", "Upgrade AoE", "AoE"),
+    ),
+    FrozenTower: BASE_UPGRADE_PATHS + (
+        ("slow_effect", "Upgrade Slow Effect", "Slow"),
+        ("slow_duration", "Upgrade Slow Duration", "Duration"),
+    ),
+}
 
 class TowerMenu(Menu):
     """Menu for interacting with towers"""
+    __slots__ = ("tower", "tower_class", "resource_manager", "upgrades", "add_item_buttons")
+    
     def __init__(self, screen):
         """
         Initialize tower menu
@@ -25,7 +49,10 @@ class TowerMenu(Menu):
         """
         super().__init__(screen)
         self.tower = None
+        self.tower_class = None  # Class of the tower, for its tower-specific stats
         self.resource_manager = None
+        self.upgrades = []  # (cost label, cost method, Monster Coin cost method) per upgrade button
+        self.add_item_buttons = []  # (button, item name) per add item button
         # Increase size to accommodate item slots and Monster Coin costs
         self.size = (280, 450)
         self.rect = pygame.Rect(self.position, self.size)
@@ -39,122 +66,64 @@ class TowerMenu(Menu):
             resource_manager: ResourceManager instance for resource costs
         """
         self.tower = tower
+        self.tower_class = type(tower)
         self.resource_manager = resource_manager
         self.title = f"{tower.tower_type} Tower"
+        self.label_key = None
         
         # Clear existing buttons
         self.buttons = []
         
-        # Create upgrade buttons
+        # Upgrade button layout
         y_pos = self.rect.top + 50
-        button_width = (self.rect.width - 40)
-        
-        # Get damage upgrade costs
-        damage_cost = tower.calculate_damage_upgrade_cost()
-        damage_mc_cost = tower.calculate_damage_upgrade_monster_coin_cost()
-        has_damage_resources = (self.resource_manager.has_resources(damage_cost) and 
-                               self.resource_manager.get_resource("Monster Coins") >= damage_mc_cost)
-        
-        # Damage upgrade button
-        damage_button = Button(
-            (self.rect.left + 20, y_pos),
-            (button_width, 30),
-            "Upgrade Damage",
-            self.upgrade_damage
-        )
-        damage_button.set_disabled(not has_damage_resources)
-        self.buttons.append(damage_button)
-        
-        # Get attack speed upgrade costs
-        speed_cost = tower.calculate_attack_speed_upgrade_cost()
-        speed_mc_cost = tower.calculate_attack_speed_upgrade_monster_coin_cost()
-        has_speed_resources = (self.resource_manager.has_resources(speed_cost) and
-                              self.resource_manager.get_resource("Monster Coins") >= speed_mc_cost)
-        
-        # Attack speed upgrade button
-        speed_button = Button(
-            (self.rect.left + 20, y_pos + 40),
-            (button_width, 30),
-            "Upgrade Speed",
-            self.upgrade_attack_speed
-        )
-        speed_button.set_disabled(not has_speed_resources)
-        self.buttons.append(speed_button)
-        
-        # Get range upgrade costs
-        range_cost = tower.calculate_range_upgrade_cost()
-        range_mc_cost = tower.calculate_range_upgrade_monster_coin_cost()
-        has_range_resources = (self.resource_manager.has_resources(range_cost) and
-                              self.resource_manager.get_resource("Monster Coins") >= range_mc_cost)
-        
-        # Range upgrade button
-        range_button = Button(
-            (self.rect.left + 20, y_pos + 80),
-            (button_width, 30),
-            "Upgrade Range",
-            self.upgrade_range
-        )
-        range_button.set_disabled(not has_range_resources)
-        self.buttons.append(range_button)
-        
-        # Tower-specific upgrade buttons
-        if isinstance(self.tower, SplashTower):
-            # Get AoE upgrade costs
-            aoe_cost = tower.calculate_aoe_radius_upgrade_cost()
-            aoe_mc_cost = tower.calculate_aoe_radius_upgrade_monster_coin_cost()
-            has_aoe_resources = (self.resource_manager.has_resources(aoe_cost) and
-                               self.resource_manager.get_resource("Monster Coins") >= aoe_mc_cost)
-            
-            aoe_button = Button(
-                (self.rect.left + 20, y_pos + 120),
-                (button_width, 30),
-                "Upgrade AoE",
-                self.upgrade_aoe
-            )
-            aoe_button.set_disabled(not has_aoe_resources)
-            self.buttons.append(aoe_button)
-        
-        elif isinstance(self.tower, FrozenTower):
-            # Get slow effect upgrade costs
-            slow_cost = tower.calculate_slow_effect_upgrade_cost()
-            slow_mc_cost = tower.calculate_slow_effect_upgrade_monster_coin_cost()
-            has_slow_resources = (self.resource_manager.has_resources(slow_cost) and
-                                self.resource_manager.get_resource("Monster Coins") >= slow_mc_cost)
-            
-            slow_button = Button(
-                (self.rect.left + 20, y_pos + 120),
-                (button_width, 30),
-                "Upgrade Slow Effect",
-                self.upgrade_slow
-            )
-            slow_button.set_disabled(not has_slow_resources)
-            self.buttons.append(slow_button)
-            
-            # Get slow duration upgrade costs
-            duration_cost = tower.calculate_slow_duration_upgrade_cost()
-            duration_mc_cost = tower.calculate_slow_duration_upgrade_monster_coin_cost()
-            has_duration_resources = (self.resource_manager.has_resources(duration_cost) and
-                                    self.resource_manager.get_resource("Monster Coins") >= duration_mc_cost)
+        button_x = self.rect.left + 20
+        button_size = (self.rect.width - 40, 30)
+        
+        # Look up the player's Monster Coins and bind the resource check once
+        # for every upgrade path
+        monster_coins = resource_manager.get_resource("Monster Coins")
+        check_resources = resource_manager.has_resources
+        
+        # Create a button for each of the tower's upgrade paths
+        self.upgrades = []
+        upgrade_paths = UPGRADE_PATHS.get(self.tower_class, BASE_UPGRADE_PATHS)
+        for i, (path, button_text, cost_label) in enumerate(upgrade_paths):
+            cost_method = getattr(tower, f"calculate_{path}_upgrade_cost")
+            mc_cost_method = getattr(tower, f"calculate_{path}_upgrade_monster_coin_cost")
+            has_resources = check_resources(cost_method()) and monster_coins >= mc_cost_method()
             
-            duration_button = Button(
-                (self.rect.left + 20, y_pos + 160),
-                (button_width, 30),
-                "Upgrade Slow Duration",
-                self.upgrade_slow_duration
+            upgrade_button = Button(
+                (button_x, y_pos + i * 40),
+                button_size,
+                button_text,
+                partial(self.upgrade, getattr(tower, f"upgrade_{path}"))
             )
-            duration_button.set_disabled(not has_duration_resources)
-            self.buttons.append(duration_button)
-            
+            upgrade_button.set_disabled(not has_resources)
+            self.buttons.append(upgrade_button)
+            self.upgrades.append((cost_label, cost_method, mc_cost_method))
+        
         # Add item slot buttons
+        self.rebuild_item_buttons()
+    
+    def rebuild_item_buttons(self):
+        """Rebuild the item slot buttons, keeping the upgrade buttons before them"""
+        tower = self.tower
+        resource_manager = self.resource_manager
+        self.label_key = None
+        
+        # Drop the old item buttons, which come after the upgrade buttons
+        del self.buttons[len(self.upgrades):]
+        self.add_item_buttons = []
+        
+        button_x = self.rect.left + 20
+        button_size = (self.rect.width - 40, 30)
+        
         # Calculate position for item slots section (below upgrades)
-        items_y_pos = y_pos + 170
-        if isinstance(self.tower, FrozenTower):
-            # Adjust for extra button in FrozenTower
+        items_y_pos = self.rect.top + 220
+        if len(self.upgrades) > 4:
+            # Adjust for the fifth upgrade button
             items_y_pos += 40
         
-        # Add heading for item slots
-        item_header_y = items_y_pos
-        
         # Item slot 1
         slot1_y = items_y_pos + 30
         # Get current item in slot 0
@@ -163,10 +132,10 @@ class TowerMenu(Menu):
         if current_item1:
             # Create button to remove item
             remove_item1_button = Button(
-                (self.rect.left + 20, slot1_y),
-                (button_width, 30),
+                (button_x, slot1_y),
+                button_size,
                 f"Remove {current_item1}",
-                lambda: self.remove_item_from_slot(0)
+                partial(self.remove_item_from_slot, 0)
             )
             self.buttons.append(remove_item1_button)
         else:
@@ -176,13 +145,14 @@ class TowerMenu(Menu):
                 has_item = resource_manager.get_resource(item_name) > 0
                 
                 add_item_button = Button(
-                    (self.rect.left + 20, slot1_y + i*35),
-                    (button_width, 30),
+                    (button_x, slot1_y + i*35),
+                    button_size,
                     f"Add {item_name} to Slot 1",
-                    lambda item=item_name: self.add_item_to_slot(item, 0)
+                    partial(self.add_item_to_slot, item_name, 0)
                 )
                 add_item_button.set_disabled(not has_item)
                 self.buttons.append(add_item_button)
+                self.add_item_buttons.append((add_item_button, item_name))
                 
         # Item slot 2
         slot2_y = slot1_y + (0 if current_item1 else 70) + 40
@@ -192,10 +162,10 @@ class TowerMenu(Menu):
         if current_item2:
             # Create button to remove item
             remove_item2_button = Button(
-                (self.rect.left + 20, slot2_y),
-                (button_width, 30),
+                (button_x, slot2_y),
+                button_size,
                 f"Remove {current_item2}",
-                lambda: self.remove_item_from_slot(1)
+                partial(self.remove_item_from_slot, 1)
             )
             self.buttons.append(remove_item2_button)
         else:
@@ -205,13 +175,14 @@ class TowerMenu(Menu):
                 has_item = resource_manager.get_resource(item_name) > 0
                 
                 add_item_button = Button(
-                    (self.rect.left + 20, slot2_y + i*35),
-                    (button_width, 30),
+                    (button_x, slot2_y + i*35),
+                    button_size,
                     f"Add {item_name} to Slot 2",
-                    lambda item=item_name: self.add_item_to_slot(item, 1)
+                    partial(self.add_item_to_slot, item_name, 1)
                 )
                 add_item_button.set_disabled(not has_item)
                 self.buttons.append(add_item_button)
+                self.add_item_buttons.append((add_item_button, item_name))
     
     def add_item_to_slot(self, item, slot_index):
         """
@@ -223,8 +194,8 @@ class TowerMenu(Menu):
         """
         if self.tower and self.resource_manager:
             if self.tower.add_item(item, slot_index, self.resource_manager):
-                # Refresh menu to show updated slots
-                self.set_tower(self.tower, self.resource_manager)
+                # Refresh the item slot buttons to show updated slots
+                self.rebuild_item_buttons()
     
     def remove_item_from_slot(self, slot_index):
         """
@@ -236,117 +207,38 @@ class TowerMenu(Menu):
         if self.tower and self.resource_manager:
             removed_item = self.tower.remove_item(slot_index, self.resource_manager)
             if removed_item:
-                # Refresh menu to show updated slots
-                self.set_tower(self.tower, self.resource_manager)
-    
-    def upgrade_damage(self):
-        """Upgrade tower damage"""
-        if self.tower and self.resource_manager:
-            if self.tower.upgrade_damage(self.resource_manager):
-                # Update button states after successful upgrade
-                self.update_button_states()
-    
-    def upgrade_attack_speed(self):
-        """Upgrade tower attack speed"""
-        if self.tower and self.resource_manager:
-            if self.tower.upgrade_attack_speed(self.resource_manager):
-                # Update button states after successful upgrade
-                self.update_button_states()
+                # Refresh the item slot buttons to show updated slots
+                self.rebuild_item_buttons()
     
-    def upgrade_range(self):
-        """Upgrade tower range"""
+    def upgrade(self, upgrade_method):
+        """
+        Upgrade one of the tower's stats
+        
+        Args:
+            upgrade_method: Bound tower method performing the upgrade, e.g. tower.upgrade_damage
+        """
+        # A successful upgrade raises the tower's level and spends resources,
+        # so the next draw refreshes the button states and labels
         if self.tower and self.resource_manager:
-            if self.tower.upgrade_range(self.resource_manager):
-                # Update button states after successful upgrade
-                self.update_button_states()
-    
-    def upgrade_aoe(self):
-        """Upgrade splash tower AoE radius"""
-        if isinstance(self.tower, SplashTower) and self.resource_manager:
-            if self.tower.upgrade_aoe_radius(self.resource_manager):
-                # Update button states after successful upgrade
-                self.update_button_states()
-    
-    def upgrade_slow(self):
-        """Upgrade frozen tower slow effect"""
-        if isinstance(self.tower, FrozenTower) and self.resource_manager:
-            if self.tower.upgrade_slow_effect(self.resource_manager):
-                # Update button states after successful upgrade
-                self.update_button_states()
-    
-    def upgrade_slow_duration(self):
-        """Upgrade frozen tower slow duration"""
-        if isinstance(self.tower, FrozenTower) and self.resource_manager:
-            if self.tower.upgrade_slow_duration(self.resource_manager):
-                # Update button states after successful upgrade
-                self.update_button_states()
+            upgrade_method(self.resource_manager)
     
     def update_button_states(self):
         """Update button disabled states based on current resources"""
         if not self.tower or not self.resource_manager:
             return
         
-        # Update base upgrade buttons
-        
-        # Damage upgrade button (index 0)
-        damage_cost = self.tower.calculate_damage_upgrade_cost()
-        damage_mc_cost = self.tower.calculate_damage_upgrade_monster_coin_cost()
-        has_damage_resources = (self.resource_manager.has_resources(damage_cost) and 
-                               self.resource_manager.get_resource("Monster Coins") >= damage_mc_cost)
-        self.buttons[0].set_disabled(not has_damage_resources)
-        
-        # Attack speed upgrade button (index 1)
-        speed_cost = self.tower.calculate_attack_speed_upgrade_cost()
-        speed_mc_cost = self.tower.calculate_attack_speed_upgrade_monster_coin_cost()
-        has_speed_resources = (self.resource_manager.has_resources(speed_cost) and
-                              self.resource_manager.get_resource("Monster Coins") >= speed_mc_cost)
-        self.buttons[1].set_disabled(not has_speed_resources)
-        
-        # Range upgrade button (index 2)
-        range_cost = self.tower.calculate_range_upgrade_cost()
-        range_mc_cost = self.tower.calculate_range_upgrade_monster_coin_cost()
-        has_range_resources = (self.resource_manager.has_resources(range_cost) and
-                              self.resource_manager.get_resource("Monster Coins") >= range_mc_cost)
-        self.buttons[2].set_disabled(not has_range_resources)
-        
-        # Tower-specific upgrade buttons
-        if isinstance(self.tower, SplashTower):
-            # AoE upgrade button (index 3)
-            aoe_cost = self.tower.calculate_aoe_radius_upgrade_cost()
-            aoe_mc_cost = self.tower.calculate_aoe_radius_upgrade_monster_coin_cost()
-            has_aoe_resources = (self.resource_manager.has_resources(aoe_cost) and
-                               self.resource_manager.get_resource("Monster Coins") >= aoe_mc_cost)
-            self.buttons[3].set_disabled(not has_aoe_resources)
-            
-        elif isinstance(self.tower, FrozenTower):
-            # Slow effect upgrade button (index 3)
-            slow_cost = self.tower.calculate_slow_effect_upgrade_cost()
-            slow_mc_cost = self.tower.calculate_slow_effect_upgrade_monster_coin_cost()
-            has_slow_resources = (self.resource_manager.has_resources(slow_cost) and
-                                self.resource_manager.get_resource("Monster Coins") >= slow_mc_cost)
-            self.buttons[3].set_disabled(not has_slow_resources)
-            
-            # Slow duration upgrade button (index 4)
-            duration_cost = self.tower.calculate_slow_duration_upgrade_cost()
-            duration_mc_cost = self.tower.calculate_slow_duration_upgrade_monster_coin_cost()
-            has_duration_resources = (self.resource_manager.has_resources(duration_cost) and
-                                    self.resource_manager.get_resource("Monster Coins") >= duration_mc_cost)
-            self.buttons[4].set_disabled(not has_duration_resources)
-        
-        # Update item buttons (they're after the upgrade buttons)
-        item_button_start = 3
-        if isinstance(self.tower, SplashTower):
-            item_button_start = 4
-        elif isinstance(self.tower, FrozenTower):
-            item_button_start = 5
-            
-        for i in range(item_button_start, len(self.buttons)):
-            # If button contains "Add" in text, check if we have the item
-            button_text = self.buttons[i].text
-            if "Add " in button_text:
-                item_name = button_text.split("Add ")[1].split(" to")[0]
-                has_item = self.resource_manager.get_resource(item_name) > 0
-                self.buttons[i].set_disabled(not has_item)
+        # Update upgrade buttons (they come first, in upgrade path order)
+        resource_manager = self.resource_manager
+        monster_coins = resource_manager.get_resource("Monster Coins")
+        check_resources = resource_manager.has_resources
+        for button, (cost_label, cost_method, mc_cost_method) in zip(self.buttons, self.upgrades):
+            has_resources = check_resources(cost_method()) and monster_coins >= mc_cost_method()
+            button.set_disabled(not has_resources)
+        
+        # Update add item buttons, checking if we have the item
+        for button, item_name in self.add_item_buttons:
+            has_item = resource_manager.get_resource(item_name) > 0
+            button.set_disabled(not has_item)
     
     def draw(self):
         """Draw tower menu with tower-specific info"""
@@ -355,213 +247,123 @@ class TowerMenu(Menu):
         if not self.active or not self.tower:
             return
         
-        # Update button states based on current resources
-        self.update_button_states()
+        # Button states and labels only change with the tower's upgrades or the
+        # player's resources; upgrades and item changes all go through the
+        # resource manager, so its epoch covers them
+        label_key = (self.tower, self.tower.level, self.resource_manager.epoch)
+        if label_key != self.label_key:
+            # Update button states based on current resources
+            self.update_button_states()
+            self.label_blits = self.collect_label_blits()
+            self.label_key = label_key
+        
+        # Draw the cost, stats and item labels in one batch
+        self.screen.blits(self.label_blits, doreturn=False)
+    
+    def collect_label_blits(self):
+        """
+        Collect the tower's upgrade cost, stats and item slot labels
         
-        # Draw tower stats
+        Returns:
+            List of (surface, position) pairs
+        """
         tower = self.tower
         y_pos = self.rect.top + 220
+        label_blits = []
         
-        # Draw upgrade information header
-        upgrade_header = self.font.render("Upgrade Costs:", True, (255, 200, 100))
+        # Upgrade information header
+        upgrade_header = render_text("Upgrade Costs:", FONT_SIZE, (255, 200, 100))
         upgrade_header_rect = upgrade_header.get_rect(midleft=(self.rect.left + 20, y_pos - 20))
-        self.screen.blit(upgrade_header, upgrade_header_rect)
+        label_blits.append((upgrade_header, upgrade_header_rect))
         
-        # Draw upgrade cost explanation
-        cost_info = self.small_font.render("(Requires both resources and Monster Coins)", True, (200, 200, 200))
+        # Upgrade cost explanation
+        cost_info = render_text("(Requires both resources and Monster Coins)", SMALL_FONT_SIZE, (200, 200, 200))
         cost_info_rect = cost_info.get_rect(midleft=(self.rect.left + 30, y_pos))
-        self.screen.blit(cost_info, cost_info_rect)
+        label_blits.append((cost_info, cost_info_rect))
         y_pos += 25
         
-        # Draw damage upgrade costs
-        damage_cost = tower.calculate_damage_upgrade_cost()
-        damage_mc_cost = tower.calculate_damage_upgrade_monster_coin_cost()
-        
-        # Check if player has enough resources and Monster Coins
-        has_damage_resources = self.resource_manager.has_resources(damage_cost)
-        has_damage_mc = self.resource_manager.get_resource("Monster Coins") >= damage_mc_cost
-        
-        # Resource costs
-        resource_color = (100, 255, 100) if has_damage_resources else (255, 100, 100)
-        damage_cost_text = "Damage: " + ", ".join(f"{amt} {res}" for res, amt in damage_cost.items())
-        damage_cost_surface = self.small_font.render(damage_cost_text, True, resource_color)
-        self.screen.blit(damage_cost_surface, (self.rect.left + 20, y_pos))
-        
-        # Monster Coin cost
-        mc_color = (100, 255, 100) if has_damage_mc else (255, 100, 100)
-        mc_text = f"+ {damage_mc_cost} Monster Coins"
-        mc_surface = self.small_font.render(mc_text, True, mc_color)
-        self.screen.blit(mc_surface, (self.rect.left + 35, y_pos + 15))
-        y_pos += 35
-        
-        # Draw speed upgrade costs
-        speed_cost = tower.calculate_attack_speed_upgrade_cost()
-        speed_mc_cost = tower.calculate_attack_speed_upgrade_monster_coin_cost()
-        
-        # Check if player has enough resources and Monster Coins
-        has_speed_resources = self.resource_manager.has_resources(speed_cost)
-        has_speed_mc = self.resource_manager.get_resource("Monster Coins") >= speed_mc_cost
-        
-        # Resource costs
-        resource_color = (100, 255, 100) if has_speed_resources else (255, 100, 100)
-        speed_cost_text = "Speed: " + ", ".join(f"{amt} {res}" for res, amt in speed_cost.items())
-        speed_cost_surface = self.small_font.render(speed_cost_text, True, resource_color)
-        self.screen.blit(speed_cost_surface, (self.rect.left + 20, y_pos))
-        
-        # Monster Coin cost
-        mc_color = (100, 255, 100) if has_speed_mc else (255, 100, 100)
-        mc_text = f"+ {speed_mc_cost} Monster Coins"
-        mc_surface = self.small_font.render(mc_text, True, mc_color)
-        self.screen.blit(mc_surface, (self.rect.left + 35, y_pos + 15))
-        y_pos += 35
-        
-        # Draw range upgrade costs
-        range_cost = tower.calculate_range_upgrade_cost()
-        range_mc_cost = tower.calculate_range_upgrade_monster_coin_cost()
-        
-        # Check if player has enough resources and Monster Coins
-        has_range_resources = self.resource_manager.has_resources(range_cost)
-        has_range_mc = self.resource_manager.get_resource("Monster Coins") >= range_mc_cost
-        
-        # Resource costs
-        resource_color = (100, 255, 100) if has_range_resources else (255, 100, 100)
-        range_cost_text = "Range: " + ", ".join(f"{amt} {res}" for res, amt in range_cost.items())
-        range_cost_surface = self.small_font.render(range_cost_text, True, resource_color)
-        self.screen.blit(range_cost_surface, (self.rect.left + 20, y_pos))
-        
-        # Monster Coin cost
-        mc_color = (100, 255, 100) if has_range_mc else (255, 100, 100)
-        mc_text = f"+ {range_mc_cost} Monster Coins"
-        mc_surface = self.small_font.render(mc_text, True, mc_color)
-        self.screen.blit(mc_surface, (self.rect.left + 35, y_pos + 15))
-        y_pos += 35
-        
-        # Draw tower-specific upgrade costs
-        if isinstance(tower, SplashTower):
-            aoe_cost = tower.calculate_aoe_radius_upgrade_cost()
-            aoe_mc_cost = tower.calculate_aoe_radius_upgrade_monster_coin_cost()
+        # Costs of each upgrade path
+        monster_coins = self.resource_manager.get_resource("Monster Coins")
+        check_resources = self.resource_manager.has_resources
+        for cost_label, cost_method, mc_cost_method in self.upgrades:
+            cost = cost_method()
+            mc_cost = mc_cost_method()
             
             # Check if player has enough resources and Monster Coins
-            has_aoe_resources = self.resource_manager.has_resources(aoe_cost)
-            has_aoe_mc = self.resource_manager.get_resource("Monster Coins") >= aoe_mc_cost
+            has_resources = check_resources(cost)
+            has_mc = monster_coins >= mc_cost
             
             # Resource costs
-            resource_color = (100, 255, 100) if has_aoe_resources else (255, 100, 100)
-            aoe_cost_text = "AoE: " + ", ".join(f"{amt} {res}" for res, amt in aoe_cost.items())
-            aoe_cost_surface = self.small_font.render(aoe_cost_text, True, resource_color)
-            self.screen.blit(aoe_cost_surface, (self.rect.left + 20, y_pos))
+            resource_color = AFFORDABLE_COLOR if has_resources else UNAFFORDABLE_COLOR
+            cost_text = f"{cost_label}: " + format_cost(cost)
+            cost_surface = render_text(cost_text, SMALL_FONT_SIZE, resource_color)
+            label_blits.append((cost_surface, (self.rect.left + 20, y_pos)))
             
             # Monster Coin cost
-            mc_color = (100, 255, 100) if has_aoe_mc else (255, 100, 100)
-            mc_text = f"+ {aoe_mc_cost} Monster Coins"
-            mc_surface = self.small_font.render(mc_text, True, mc_color)
-            self.screen.blit(mc_surface, (self.rect.left + 35, y_pos + 15))
-            y_pos += 35
-            
-        elif isinstance(tower, FrozenTower):
-            slow_cost = tower.calculate_slow_effect_upgrade_cost()
-            slow_mc_cost = tower.calculate_slow_effect_upgrade_monster_coin_cost()
-            
-            # Check if player has enough resources and Monster Coins
-            has_slow_resources = self.resource_manager.has_resources(slow_cost)
-            has_slow_mc = self.resource_manager.get_resource("Monster Coins") >= slow_mc_cost
-            
-            # Resource costs
-            resource_color = (100, 255, 100) if has_slow_resources else (255, 100, 100)
-            slow_cost_text = "Slow: " + ", ".join(f"{amt} {res}" for res, amt in slow_cost.items())
-            slow_cost_surface = self.small_font.render(slow_cost_text, True, resource_color)
-            self.screen.blit(slow_cost_surface, (self.rect.left + 20, y_pos))
-            
-            # Monster Coin cost
-            mc_color = (100, 255, 100) if has_slow_mc else (255, 100, 100)
-            mc_text = f"+ {slow_mc_cost} Monster Coins"
-            mc_surface = self.small_font.render(mc_text, True, mc_color)
-            self.screen.blit(mc_surface, (self.rect.left + 35, y_pos + 15))
-            y_pos += 35
-            
-            duration_cost = tower.calculate_slow_duration_upgrade_cost()
-            duration_mc_cost = tower.calculate_slow_duration_upgrade_monster_coin_cost()
-            
-            # Check if player has enough resources and Monster Coins
-            has_duration_resources = self.resource_manager.has_resources(duration_cost)
-            has_duration_mc = self.resource_manager.get_resource("Monster Coins") >= duration_mc_cost
-            
-            # Resource costs
-            resource_color = (100, 255, 100) if has_duration_resources else (255, 100, 100)
-            duration_cost_text = "Duration: " + ", ".join(f"{amt} {res}" for res, amt in duration_cost.items())
-            duration_cost_surface = self.small_font.render(duration_cost_text, True, resource_color)
-            self.screen.blit(duration_cost_surface, (self.rect.left + 20, y_pos))
-            
-            # Monster Coin cost
-            mc_color = (100, 255, 100) if has_duration_mc else (255, 100, 100)
-            mc_text = f"+ {duration_mc_cost} Monster Coins"
-            mc_surface = self.small_font.render(mc_text, True, mc_color)
-            self.screen.blit(mc_surface, (self.rect.left + 35, y_pos + 15))
+            mc_color = AFFORDABLE_COLOR if has_mc else UNAFFORDABLE_COLOR
+            mc_text = f"+ {mc_cost} Monster Coins"
+            mc_surface = render_text(mc_text, SMALL_FONT_SIZE, mc_color)
+            label_blits.append((mc_surface, (self.rect.left + 35, y_pos + 15)))
             y_pos += 35
         
-        # Adjust y_pos for stats based on tower type
-        if isinstance(tower, SplashTower):
-            y_pos += 5
-        elif isinstance(tower, FrozenTower):
-            y_pos += 5
-        else:
-            y_pos += 5
+        y_pos += 5
         
-        # Draw stats header
-        header_text = "Tower Stats:"
-        header_surface = self.font.render(header_text, True, (255, 255, 255))
+        # Stats header
+        header_surface = render_text("Tower Stats:", FONT_SIZE, LABEL_COLOR)
         header_rect = header_surface.get_rect(midleft=(self.rect.left + 20, y_pos))
-        self.screen.blit(header_surface, header_rect)
+        label_blits.append((header_surface, header_rect))
         
         y_pos += 25
         
-        # Base stats with item effect indicators
+        # Base stats with item effect indicators, each line formatted in one
+        # pass with the base value only shown when it differs
         base_damage = tower.base_damage
         base_attack_speed = tower.base_attack_speed
         base_range = tower.base_range
         
         texts = [
             f"Overall Level: {tower.level}",
-            f"Damage (Lv {tower.damage_level}): {tower.damage:.1f}" + (f" (Base: {base_damage:.1f})" if tower.damage != base_damage else ""),
-            f"Attack Speed (Lv {tower.attack_speed_level}): {tower.attack_speed:.2f}/s" + (f" (Base: {base_attack_speed:.2f})" if tower.attack_speed != base_attack_speed else ""),
-            f"Range (Lv {tower.range_level}): {tower.range:.0f}" + (f" (Base: {base_range:.0f})" if tower.range != base_range else "")
+            f"Damage (Lv {tower.damage_level}): {tower.damage:.1f}{'' if tower.damage == base_damage else f' (Base: {base_damage:.1f})'}",
+            f"Attack Speed (Lv {tower.attack_speed_level}): {tower.attack_speed:.2f}/s{'' if tower.attack_speed == base_attack_speed else f' (Base: {base_attack_speed:.2f})'}",
+            f"Range (Lv {tower.range_level}): {tower.range:.0f}{'' if tower.range == base_range else f' (Base: {base_range:.0f})'}"
         ]
         
         # Add tower-specific stats
-        if isinstance(tower, SplashTower):
+        if self.tower_class is SplashTower:
             base_aoe = tower.base_aoe_radius
-            texts.append(f"AoE Radius (Lv {tower.aoe_radius_level}): {tower.aoe_radius:.0f}" + (f" (Base: {base_aoe:.0f})" if tower.aoe_radius != base_aoe else ""))
-        elif isinstance(tower, FrozenTower):
+            texts.append(f"AoE Radius (Lv {tower.aoe_radius_level}): {tower.aoe_radius:.0f}{'' if tower.aoe_radius == base_aoe else f' (Base: {base_aoe:.0f})'}")
+        elif self.tower_class is FrozenTower:
             base_slow = tower.base_slow_effect
             base_duration = tower.base_slow_duration
-            texts.append(f"Slow Effect (Lv {tower.slow_effect_level}): {tower.slow_effect*100:.0f}%" + (f" (Base: {base_slow*100:.0f}%)" if tower.slow_effect != base_slow else ""))
-            texts.append(f"Slow Duration (Lv {tower.slow_duration_level}): {tower.slow_duration:.1f}s" + (f" (Base: {base_duration:.1f}s)" if tower.slow_duration != base_duration else ""))
+            texts.append(f"Slow Effect (Lv {tower.slow_effect_level}): {tower.slow_effect*100:.0f}%{'' if tower.slow_effect == base_slow else f' (Base: {base_slow*100:.0f}%)'}")
+            texts.append(f"Slow Duration (Lv {tower.slow_duration_level}): {tower.slow_duration:.1f}s{'' if tower.slow_duration == base_duration else f' (Base: {base_duration:.1f}s)'}")
         
         for i, text in enumerate(texts):
-            surface = self.small_font.render(text, True, (255, 255, 255))
-            self.screen.blit(surface, (self.rect.left + 20, y_pos + i*20))
-            
-        # Draw items section header
+            surface = render_text(text, SMALL_FONT_SIZE, LABEL_COLOR)
+            label_blits.append((surface, (self.rect.left + 20, y_pos + i*20)))
+        
+        # Items section header
         items_y = y_pos + len(texts)*20 + 20
-        header_text = "Item Slots:"
-        header_surface = self.font.render(header_text, True, (255, 255, 255))
+        header_surface = render_text("Item Slots:", FONT_SIZE, LABEL_COLOR)
         header_rect = header_surface.get_rect(midleft=(self.rect.left + 20, items_y))
-        self.screen.blit(header_surface, header_rect)
+        label_blits.append((header_surface, header_rect))
         
         items_y += 25
         
-        # Draw current items
+        # Current items
         for i in range(2):
             item = tower.get_item_in_slot(i)
             
             slot_text = f"Slot {i+1}: " + (item if item else "Empty")
-            slot_color = (255, 255, 255) if item else (150, 150, 150)
+            slot_color = LABEL_COLOR if item else (150, 150, 150)
             
-            slot_surface = self.small_font.render(slot_text, True, slot_color)
-            self.screen.blit(slot_surface, (self.rect.left + 20, items_y + i*45))
+            slot_surface = render_text(slot_text, SMALL_FONT_SIZE, slot_color)
+            label_blits.append((slot_surface, (self.rect.left + 20, items_y + i*45)))
             
-            # If item is equipped, draw its effect
+            # If item is equipped, add its effect
             if item:
                 effect_desc = ITEM_EFFECTS.get(item, {}).get("description", "")
-                effect_surface = self.small_font.render(f"  - {effect_desc}", True, (200, 200, 255))
-                self.screen.blit(effect_surface, (self.rect.left + 30, items_y + i*45 + 20))
+                effect_surface = render_text(f"  - {effect_desc}", SMALL_FONT_SIZE, (200, 200, 255))
+                label_blits.append((effect_surface, (self.rect.left + 30, items_y + i*45 + 20)))
+        
+        return label_blits
@@ -6,6 +6,12 @@ import math
 import pygame
 from config import SCALE_X, SCALE_Y, REF_WIDTH, REF_HEIGHT
 
+# Default-font objects by size and rendered label surfaces, shared by all callers
+_font_cache = {}
+_text_cache = {}
+_cost_text_cache = {}
+MAX_CACHED_TEXTS = 512  # Labels with changing numbers would otherwise grow the cache forever
+
 def distance(pos1, pos2):
     """
     Calculate Euclidean distance between two points
@@ -125,3 +131,61 @@ def unscale_position(pos):
         Tuple of (x, y) coordinates in reference dimensions
     """
     return (int(pos[0] / SCALE_X), int(pos[1] / SCALE_Y))
+
+def get_font(font_size):
+    """
+    Get the default font at a size, creating it only on first use
+    
+    Args:
+        font_size: Font size
+        
+    Returns:
+        Pygame font
+    """
+    font = _font_cache.get(font_size)
+    if font is None:
+        font = pygame.font.Font(None, font_size)
+        _font_cache[font_size] = font
+    return font
+
+def render_text(text, font_size, color=(255, 255, 255)):
+    """
+    Render text with the default font, reusing the surface for repeated labels
+    
+    The returned surface is shared, so callers must not draw on it or change its alpha.
+    
+    Args:
+        text: Text to render
+        font_size: Font size
+        color: RGB color tuple for the text
+        
+    Returns:
+        Pygame surface with the rendered text
+    """
+    key = (text, font_size, color)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        if len(_text_cache) >= MAX_CACHED_TEXTS:
+            _text_cache.clear()
+        text_surface = get_font(font_size).render(text, True, color)
+        _text_cache[key] = text_surface
+    return text_surface
+
+def format_cost(cost):
+    """
+    Format a resource cost as "amount resource" pairs, reusing the string for repeated costs
+    
+    Args:
+        cost: Dictionary mapping resource types to amounts
+        
+    Returns:
+        String like "50 Stone, 10 Iron"
+    """
+    key = tuple(cost.items())
+    cost_text = _cost_text_cache.get(key)
+    if cost_text is None:
+        if len(_cost_text_cache) >= MAX_CACHED_TEXTS:
+            _cost_text_cache.clear()
+        cost_text = ", ".join(f"{amt} {res}" for res, amt in key)
+        _cost_text_cache[key] = cost_text
+    return cost_text